@@ -1,6 +1,8 @@
 from __future__ import annotations
 from collections import abc
 import random
+from typing import List
+from player_sort import integer_sort_descending, introsort_descending
 
 
 class Player:
@@ -13,6 +15,14 @@ class Player:
            A unique identifier for the player.
        _player_name : str
            The name of the player.
+       _player_score : int
+           The score of the player.
+       _hash : int
+           The hash value of the player, computed once from the uid.
+       _score_listeners : Optional[List[Callable]]
+           The callables notified of every score change, or None if there are none.
+
+       Players use __slots__ instead of a per-instance __dict__, as registries hold millions of them.
 
        Methods:
        --------
@@ -27,9 +37,13 @@ class Player:
            format 'Player(player_name=<name>, player_id=<id>)'.
        """
 
+    __slots__ = ("_player_id", "_player_name", "_player_score", "_hash", "_score_listeners")
+
     _player_id: str
     _player_name: str
     _player_score: int
+    _hash: int
+    _score_listeners: List[abc.Callable[[Player, int], None]] | None
 
     def __init__(self, player_id: str, player_name: str, score: int = 0):
         """
@@ -45,6 +59,9 @@ class Player:
         self._player_id = player_id
         self._player_name = player_name
         self._player_score = score
+        # the uid has no setter, so the hash can never change and is computed only once
+        self._hash = self.sum_of_ascii_values(player_id)
+        self._score_listeners = None
 
     @property
     def score(self) -> int:
@@ -61,6 +78,8 @@ class Player:
         """
         Set the player's score, ensuring it is a positive integer.
 
+        If the score changes, every score listener is then called with the player and its old score.
+
         Args:
             player_score (int): The new score for the player.
 
@@ -68,7 +87,39 @@ class Player:
             ValueError: If the score is not a positive integer.
         """
         if player_score > 0:
+            old_score = self._player_score
             self._player_score = player_score
+            if self._score_listeners is not None and player_score != old_score:
+                for listener in tuple(self._score_listeners):
+                    listener(self, old_score)
+
+    def add_score_listener(self, listener: abc.Callable[[Player, int], None]):
+        """
+        Register a callable to notify of every change of the player's score.
+
+        Args:
+            listener (Callable[[Player, int], None]): Called with the player and its old score, after
+                the new score is set.
+        """
+        if self._score_listeners is None:
+            self._score_listeners = []
+        self._score_listeners.append(listener)
+
+    def remove_score_listener(self, listener: abc.Callable[[Player, int], None]):
+        """
+        Unregister a score listener.
+
+        Args:
+            listener (Callable[[Player, int], None]): A listener registered with add_score_listener().
+
+        Raises:
+            ValueError: If the listener is not registered.
+        """
+        if self._score_listeners is None:
+            raise ValueError("Listener is not registered")
+        self._score_listeners.remove(listener)
+        if not self._score_listeners:
+            self._score_listeners = None
 
     @property
     def uid(self) -> str:
@@ -109,10 +160,9 @@ class Player:
         """
         Sorts a collection of elements in descending order using the quicksort algorithm.
 
-        This static method implements the quicksort algorithm to sort the given collection.
-        It divides the collection into two sublists: one with elements greater than the pivot
-        and the other with elements less than or equal to the pivot. It then recursively sorts
-        these sublists and combines them with the pivot to form the final sorted list.
+        The elements are copied into a new list, which is then sorted in place by
+        player_sort.introsort_descending: an iterative quicksort with median-of-three pivots and
+        three-way partitioning, insertion sort for small ranges and a heapsort fallback.
 
         Parameters:
         collection (Iterable): An iterable collection (e.g., list, tuple) of elements to be sorted.
@@ -127,17 +177,21 @@ class Player:
 
         Notes:
         - The method assumes that the elements in the collection are comparable.
-        - This method uses the first element of the collection as the pivot.
-        - The time complexity of this implementation is O(n log n) on average, but can degrade to O(n^2) in the worst case.
+        - The original collection is left unchanged.
+        - The time complexity is O(n log n) in the worst case, including already sorted input and many
+          duplicates, and no recursion is used.
+        - Players whose scores are all non-negative integers are sorted by
+          player_sort.integer_sort_descending() instead, in linear time and stably; any other
+          elements are only compared with ``<``.
         """
         collection = list(collection)
-        if len(collection) < 2:
-            return collection
-
-        pivot = collection[0]
-        gt_than_pivot = [v for v in collection[1:] if v > pivot]
-        le_than_pivot = [v for v in collection[1:] if v <= pivot]
-        return Player.quicksort_descending(gt_than_pivot) + [pivot] + Player.quicksort_descending(le_than_pivot)
+        if collection and all(isinstance(item, Player) for item in collection):
+            try:
+                return integer_sort_descending(collection)
+            except ValueError:
+                pass
+        introsort_descending(collection)
+        return collection
 
     @staticmethod
     def sum_of_ascii_values(key: str | Player) -> int:
@@ -162,12 +216,12 @@ class Player:
 
     def __hash__(self) -> int:
         """
-        Compute the hash value of the player using the sum of ASCII values of the UID.
+        Return the hash value of the player: the sum of ASCII values of the UID, cached at creation.
 
         Returns:
             int: The hash value of the player.
         """
-        return self.sum_of_ascii_values(self.uid)
+        return self._hash
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Player):
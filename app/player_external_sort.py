@@ -0,0 +1,173 @@
+from __future__ import annotations
+import heapq
+import os
+import struct
+import tempfile
+from collections import abc
+from operator import attrgetter
+from typing import Iterator, List
+from player import Player
+
+# score (signed 64-bit), uid length and name length, followed by the UTF-8 encoded uid and name
+RECORD_HEADER = struct.Struct("<qII")
+# Estimated bytes held in memory per buffered player on top of its uid and name: the Player object,
+# the two string objects and the list slot.
+PLAYER_OVERHEAD: int = 200
+MEMORY_BUDGET: int = 64 * 1024 * 1024
+MAX_FAN_IN: int = 64
+_BUFFER_SIZE: int = 1024 * 1024
+_score = attrgetter("score")
+
+
+def _write_run(players: abc.Iterable[Player], directory: str) -> str:
+    """
+    Writes players to a new run file in the compact binary record format.
+
+    Parameters:
+    -----------
+    players : Iterable[Player]
+        The players to write, in order.
+    directory : str
+        The directory to create the file in.
+
+    Returns:
+    --------
+    str
+        The path of the run file.
+    """
+    descriptor, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    pack = RECORD_HEADER.pack
+
+    with open(descriptor, "wb", buffering=_BUFFER_SIZE) as run_file:
+        write = run_file.write
+        for player in players:
+            uid = player.uid.encode()
+            name = player.name.encode()
+            write(pack(player.score, len(uid), len(name)))
+            write(uid)
+            write(name)
+
+    return path
+
+
+def _read_run(path: str) -> Iterator[Player]:
+    """
+    Reads the players of a run file back, in order.
+
+    Parameters:
+    -----------
+    path : str
+        The path of the run file.
+
+    Yields:
+    -------
+    Player
+        The players of the run.
+    """
+    header_size = RECORD_HEADER.size
+    unpack = RECORD_HEADER.unpack
+
+    with open(path, "rb", buffering=_BUFFER_SIZE) as run_file:
+        read = run_file.read
+        while True:
+            header = read(header_size)
+            if not header:
+                return
+            score, uid_length, name_length = unpack(header)
+            data = read(uid_length + name_length)
+            yield Player(data[:uid_length].decode(), data[uid_length:].decode(), score)
+
+
+def _merge_runs(paths: List[str]) -> Iterator[Player]:
+    """
+    Lazily k-way merges run files sorted by descending score into one descending stream.
+
+    Equal scores come out in the order of the runs, so merging runs written in input order is stable.
+
+    Parameters:
+    -----------
+    paths : List[str]
+        The run files, in input order.
+
+    Returns:
+    --------
+    Iterator[Player]
+        The players of all runs, by descending score.
+    """
+    return heapq.merge(*(_read_run(path) for path in paths), key=_score, reverse=True)
+
+
+def external_sort_descending(players: abc.Iterable[Player], memory_budget: int = MEMORY_BUDGET,
+                             max_fan_in: int = MAX_FAN_IN, tmp_dir: str | None = None) -> Iterator[Player]:
+    """
+    Sorts players by descending score, for datasets that do not fit in memory.
+
+    The input is streamed into runs that fit in the memory budget. Each run is sorted and spilled to a
+    temporary file in a compact binary format (a 16-byte header and the UTF-8 encoded uid and name per
+    player), then the runs are k-way merged back lazily. When there are more runs than max_fan_in, groups
+    of them are first merged into longer runs, so that no more than max_fan_in files are open at once.
+    Input that fits in a single run is sorted in memory without touching the disk.
+
+    The sort is stable: players with equal scores keep their input order. The yielded players are new
+    Player objects read back from disk, except when the input fit in a single run.
+
+    Parameters:
+    -----------
+    players : Iterable[Player]
+        The players to sort, e.g. a generator reading the player table.
+    memory_budget : int
+        The approximate number of bytes of players to buffer in memory per run.
+    max_fan_in : int
+        The maximum number of runs merged at once.
+    tmp_dir : Optional[str]
+        The directory for the temporary run files, or None for the system default.
+
+    Yields:
+    -------
+    Player
+        The players, by descending score. The temporary files are removed once the generator is
+        exhausted or closed.
+
+    Raises:
+    -------
+    ValueError:
+        If max_fan_in is less than 2.
+    """
+    if max_fan_in < 2:
+        raise ValueError("max_fan_in must be at least 2")
+
+    with tempfile.TemporaryDirectory(prefix="player-sort-", dir=tmp_dir) as directory:
+        run_paths = []
+        run = []
+        run_bytes = 0
+
+        for player in players:
+            run.append(player)
+            run_bytes += PLAYER_OVERHEAD + len(player.uid) + len(player.name)
+            if run_bytes >= memory_budget:
+                run.sort(key=_score, reverse=True)
+                run_paths.append(_write_run(run, directory))
+                run = []
+                run_bytes = 0
+
+        run.sort(key=_score, reverse=True)
+        if not run_paths:
+            yield from run
+            return
+        if run:
+            run_paths.append(_write_run(run, directory))
+        del run
+
+        while len(run_paths) > max_fan_in:
+            merged_paths = []
+            for start in range(0, len(run_paths), max_fan_in):
+                group = run_paths[start:start + max_fan_in]
+                if len(group) == 1:
+                    merged_paths.append(group[0])
+                    continue
+                merged_paths.append(_write_run(_merge_runs(group), directory))
+                for path in group:
+                    os.remove(path)
+            run_paths = merged_paths
+
+        yield from _merge_runs(run_paths)
@@ -0,0 +1,365 @@
+from __future__ import annotations
+import random
+from collections import abc
+from typing import Dict, Iterator, List
+from player import Player
+
+# Enough levels for the skip list to stay logarithmic up to 2 ** 32 players.
+MAX_LEVEL: int = 32
+
+
+class _SkipNode:
+    """
+    A node of the leaderboard's indexable skip list.
+
+    Attributes:
+    -----------
+    key : tuple | None
+        The (negated score, uid) the node is ordered by, or None for the head.
+    player : Player | None
+        The player of the node, or None for the head.
+    next : List[Optional[_SkipNode]]
+        The following node on every level the node belongs to.
+    width : List[int]
+        The number of bottom-level steps each link of next spans; a link to None spans up to one past
+        the last node.
+    """
+    __slots__ = ("key", "player", "next", "width")
+
+    def __init__(self, key: tuple | None, player: Player | None, height: int):
+        self.key = key
+        self.player = player
+        self.next = [None] * height
+        self.width = [1] * height
+
+
+class PlayerLeaderboard:
+    """
+    Players ordered by descending score, kept up to date as their scores change, with O(log n) rank
+    queries.
+
+    The players are held in an indexable skip list ordered by (negated score, uid), so equal scores
+    are ranked by uid. Every link of the list records how many players it skips, which lets
+    rank_of() add up the widths along the search path and player_at() follow the links whose widths
+    fit in the wanted rank, both in expected O(log n). The leaderboard registers a score listener on
+    every player it holds, so that setting ``player.score`` moves the player to its new rank in
+    O(log n) instead of re-sorting everyone.
+
+    Ranks start at 1 for the best player.
+
+    Attributes:
+    -----------
+    _head : _SkipNode
+        The head node, linked to the first node on every level.
+    _height : int
+        The number of levels in use.
+    _nodes : Dict[str, _SkipNode]
+        The node of every player, by uid.
+    """
+
+    _head: _SkipNode
+    _height: int
+    _nodes: Dict[str, _SkipNode]
+
+    def __init__(self, players: abc.Iterable[Player] = ()):
+        """
+        Initializes a leaderboard with the given players.
+
+        Parameters:
+        -----------
+        players : Iterable[Player]
+            The players to add.
+
+        Raises:
+        -------
+        ValueError:
+            If two players have the same uid.
+        """
+        self._head = _SkipNode(None, None, MAX_LEVEL)
+        self._height = 1
+        self._nodes = {}
+
+        for player in players:
+            self.add(player)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of players on the leaderboard.
+
+        Returns:
+        --------
+        int
+            The number of players.
+        """
+        return len(self._nodes)
+
+    def __contains__(self, key: str | Player) -> bool:
+        """
+        Returns whether a player is on the leaderboard.
+
+        Parameters:
+        -----------
+        key : str | Player
+            The uid of the player, or a Player to look up by its uid.
+
+        Returns:
+        --------
+        bool
+            True if the player is on the leaderboard, False otherwise.
+        """
+        return (key.uid if isinstance(key, Player) else key) in self._nodes
+
+    def __iter__(self) -> Iterator[Player]:
+        """
+        Iterates over the players, from the best to the worst.
+
+        Yields:
+        -------
+        Player
+            The players by rank.
+        """
+        node = self._head.next[0]
+        while node is not None:
+            yield node.player
+            node = node.next[0]
+
+    def add(self, player: Player):
+        """
+        Adds a player at the rank of its score and starts following its score changes.
+
+        Parameters:
+        -----------
+        player : Player
+            The player to add.
+
+        Raises:
+        -------
+        ValueError:
+            If a player with the same uid is already on the leaderboard.
+        """
+        if player.uid in self._nodes:
+            raise ValueError(f"Player already exists on the leaderboard with uid{player.uid}")
+
+        self._nodes[player.uid] = self._insert(player)
+        player.add_score_listener(self._score_changed)
+
+    def remove(self, key: str | Player) -> Player:
+        """
+        Removes a player and stops following its score changes.
+
+        Parameters:
+        -----------
+        key : str | Player
+            The uid of the player, or a Player to remove by its uid.
+
+        Returns:
+        --------
+        Player
+            The removed player.
+
+        Raises:
+        -------
+        KeyError:
+            If the player is not on the leaderboard.
+        """
+        uid = key.uid if isinstance(key, Player) else key
+        if uid not in self._nodes:
+            raise KeyError(f"Key {key} not found")
+
+        node = self._nodes.pop(uid)
+        self._delete(node)
+        node.player.remove_score_listener(self._score_changed)
+        return node.player
+
+    def rank_of(self, key: str | Player) -> int:
+        """
+        Returns the rank of a player, in expected O(log n).
+
+        Parameters:
+        -----------
+        key : str | Player
+            The uid of the player, or a Player to look up by its uid.
+
+        Returns:
+        --------
+        int
+            The rank of the player, 1 being the best.
+
+        Raises:
+        -------
+        KeyError:
+            If the player is not on the leaderboard.
+        """
+        uid = key.uid if isinstance(key, Player) else key
+        if uid not in self._nodes:
+            raise KeyError(f"Key {key} not found")
+
+        target = self._nodes[uid].key
+        node = self._head
+        rank = 0
+        for level in range(self._height - 1, -1, -1):
+            while node.next[level] is not None and node.next[level].key <= target:
+                rank += node.width[level]
+                node = node.next[level]
+        return rank
+
+    def player_at(self, rank: int) -> Player:
+        """
+        Returns the player at a rank, in expected O(log n).
+
+        Parameters:
+        -----------
+        rank : int
+            The rank, 1 being the best.
+
+        Returns:
+        --------
+        Player
+            The player at that rank.
+
+        Raises:
+        -------
+        IndexError:
+            If the rank is not between 1 and the number of players.
+        """
+        if not 1 <= rank <= len(self._nodes):
+            raise IndexError("Rank out of range")
+
+        return self._node_at(rank).player
+
+    def range(self, rank_lo: int, rank_hi: int) -> List[Player]:
+        """
+        Returns the players from one rank to another, both included, in O(log n + k) for k players.
+
+        Parameters:
+        -----------
+        rank_lo : int
+            The first rank, 1 being the best. Ranks below 1 are treated as 1.
+        rank_hi : int
+            The last rank. Ranks past the number of players are treated as the last one.
+
+        Returns:
+        --------
+        List[Player]
+            The players by rank, or an empty list if the range holds no player.
+        """
+        rank_lo = max(rank_lo, 1)
+        rank_hi = min(rank_hi, len(self._nodes))
+        players = []
+        if rank_lo > rank_hi:
+            return players
+
+        node = self._node_at(rank_lo)
+        for _ in range(rank_hi - rank_lo + 1):
+            players.append(node.player)
+            node = node.next[0]
+        return players
+
+    def _node_at(self, rank: int) -> _SkipNode:
+        """
+        Finds the node at a rank between 1 and the number of players.
+
+        Parameters:
+        -----------
+        rank : int
+            The rank of the node.
+
+        Returns:
+        --------
+        _SkipNode
+            The node at that rank.
+        """
+        node = self._head
+        for level in range(self._height - 1, -1, -1):
+            while node.next[level] is not None and node.width[level] <= rank:
+                rank -= node.width[level]
+                node = node.next[level]
+        return node
+
+    def _score_changed(self, player: Player, old_score: int):
+        """
+        Score listener: moves a player to the rank of its new score.
+
+        Parameters:
+        -----------
+        player : Player
+            The player whose score changed.
+        old_score : int
+            Its previous score.
+        """
+        self._delete(self._nodes.pop(player.uid))
+        self._nodes[player.uid] = self._insert(player)
+
+    def _insert(self, player: Player) -> _SkipNode:
+        """
+        Links a new node for a player into the skip list, at a random height. The player must not be
+        in _nodes yet, as the size of the list is taken from it.
+
+        Parameters:
+        -----------
+        player : Player
+            The player to insert.
+
+        Returns:
+        --------
+        _SkipNode
+            The new node.
+        """
+        key = (-player.score, player.uid)
+        height = 1
+        while height < MAX_LEVEL and random.random() < 0.5:
+            height += 1
+
+        head = self._head
+        size = len(self._nodes)
+        for level in range(self._height, height):
+            # a level coming into use holds no node yet, so its head link spans the whole list
+            head.next[level] = None
+            head.width[level] = size + 1
+        self._height = max(self._height, height)
+
+        # the last node before the key and the number of players up to it, on every level
+        chain = [head] * self._height
+        steps = [0] * self._height
+        node = head
+        rank = 0
+        for level in range(self._height - 1, -1, -1):
+            while node.next[level] is not None and node.next[level].key < key:
+                rank += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+            steps[level] = rank
+
+        new_node = _SkipNode(key, player, height)
+        for level in range(height):
+            previous = chain[level]
+            skipped = rank - steps[level]
+            new_node.next[level] = previous.next[level]
+            new_node.width[level] = previous.width[level] - skipped
+            previous.next[level] = new_node
+            previous.width[level] = skipped + 1
+        for level in range(height, self._height):
+            chain[level].width[level] += 1
+        return new_node
+
+    def _delete(self, target: _SkipNode):
+        """
+        Unlinks a node from the skip list.
+
+        Parameters:
+        -----------
+        target : _SkipNode
+            The node to unlink.
+        """
+        node = self._head
+        for level in range(self._height - 1, -1, -1):
+            while node.next[level] is not None and node.next[level].key < target.key:
+                node = node.next[level]
+            if node.next[level] is target:
+                node.width[level] += target.width[level] - 1
+                node.next[level] = target.next[level]
+            else:
+                node.width[level] -= 1
+
+        while self._height > 1 and self._head.next[self._height - 1] is None:
+            self._height -= 1
@@ -1,5 +1,8 @@
-from typing import Optional
+from __future__ import annotations
+from collections import abc
+from typing import Dict, Optional
 from player_node import PlayerNode
+from player_node_pool import PlayerNodePool
 from player import Player
 
 
@@ -17,21 +20,46 @@ class PlayerList:
         Indicates whether the list is empty.
     _length: int
         Keeps track of PlayerList size
+    _uid_index : Optional[Dict[str, PlayerNode]]
+        Maps the uid of every node in the list to the node, or None if the index is disabled.
+        It makes duplicate checks, find_node_by_key and pop_by_uid O(1) instead of O(n).
+    _node_pool : Optional[PlayerNodePool]
+        The pool the push_player_* methods draw nodes from and the pop_player_* methods
+        return nodes to, or None to always allocate new nodes.
+    _finger : Optional[tuple]
+        The last node reached by position and its index, so that nearby positional accesses walk
+        from there instead of from the head or tail. It is dropped by any mutation that can shift
+        positions, or None if there is no cached position.
     """
 
     _head: PlayerNode | None = None
     _tail: PlayerNode | None = None
     _is_empty: bool
     _length: int
+    _uid_index: Dict[str, PlayerNode] | None
+    _node_pool: PlayerNodePool | None
+    _finger: tuple | None
 
-    def __init__(self):
+    def __init__(self, index_uids: bool = True, node_pool: PlayerNodePool | None = None):
         """
         Initializes an empty PlayerList with no head, tail, and sets the list as empty.
+
+        Parameters:
+        -----------
+        index_uids : bool
+            If True, keeps a uid -> node index in sync with the list. Disable it for
+            memory-constrained use, e.g. short hash map chains, at the cost of O(n) lookups.
+        node_pool : Optional[PlayerNodePool]
+            A pool of nodes to recycle in the push_player_* and pop_player_* methods. A pool can be
+            shared between lists.
         """
         self._head = None
         self._tail = None
         self._is_empty = True
         self._length = 0
+        self._uid_index = {} if index_uids else None
+        self._node_pool = node_pool
+        self._finger = None
 
     def __len__(self) -> int:
         """
@@ -54,6 +82,18 @@ class PlayerList:
         """
         return self._is_empty
 
+    @property
+    def is_indexed(self) -> bool:
+        """
+        Returns whether the list keeps a uid -> node index.
+
+        Returns:
+        --------
+        bool
+            True if the uid index is enabled, False otherwise.
+        """
+        return self._uid_index is not None
+
     @property
     def head(self) -> PlayerNode | None:
         """
@@ -92,9 +132,13 @@ class PlayerList:
         bool
             True if the node can be added (i.e., it is not a duplicate), False otherwise.
         """
+        if self._uid_index is not None:
+            # the same node or the same player always means the same uid, so one lookup covers all cases
+            return new_node.key not in self._uid_index
+
         return not any(filter(new_node.equals, self.iterate()))
 
-    def push_front(self, player_node: PlayerNode | None = None):
+    def push_front(self, player_node: PlayerNode | None = None, check_duplicates: bool = True):
         """
         Adds a node to the front of the list.
 
@@ -102,13 +146,16 @@ class PlayerList:
         -----------
         player_node : Optional[PlayerNode]
             The node to add to the front of the list.
+        check_duplicates : bool
+            If False, skips the duplicate scan. Only safe when the caller already
+            knows the node's uid is not in the list (e.g. when rehashing).
 
         Raises:
         -------
         ValueError:
             If the node already exists in the list.
         """
-        if not self.can_add_node(player_node):
+        if check_duplicates and not self.can_add_node(player_node):
             raise ValueError(f"Player or PlayerNode already exists in the list with uid{player_node.key}")
 
         if self._is_empty:
@@ -119,9 +166,15 @@ class PlayerList:
             self._head.player_prev_node = player_node
             self._head = player_node
 
+        # every node moves one position back
+        self._finger = None
+
+        if self._uid_index is not None:
+            self._uid_index[player_node.key] = player_node
+
         self._length += 1
 
-    def push_back(self, player_node: PlayerNode | None = None):
+    def push_back(self, player_node: PlayerNode | None = None, check_duplicates: bool = True):
         """
         Adds a node to the end of the list.
 
@@ -129,13 +182,16 @@ class PlayerList:
         -----------
         player_node : Optional[PlayerNode]
             The node to add to the end of the list.
+        check_duplicates : bool
+            If False, skips the duplicate scan. Only safe when the caller already
+            knows the node's uid is not in the list.
 
         Raises:
         -------
         ValueError:
             If the node already exists in the list.
         """
-        if not self.can_add_node(player_node):
+        if check_duplicates and not self.can_add_node(player_node):
             raise ValueError(f"Player or PlayerNode already exists in the list with uid{player_node.key}")
 
         if self._is_empty:
@@ -146,6 +202,9 @@ class PlayerList:
             self._tail.player_next_node = player_node
             self._tail = player_node
 
+        if self._uid_index is not None:
+            self._uid_index[player_node.key] = player_node
+
         self._length += 1
 
     def pop_from_front(self) -> PlayerNode | None:
@@ -165,21 +224,7 @@ class PlayerList:
         if self._is_empty:
             raise IndexError("List is empty")
 
-        deleted_node = self._head
-
-        if self._head == self._tail:
-            self._head = None
-            self._tail = None
-        else:
-            self._head.player_next_node.player_prev_node = None
-            self._head = self._head.player_next_node
-            self._head.player_next_node = None  # actually clearing the next reference to the node for the deleted node
-
-        self._is_empty = self._head is None
-
-        self._length -= 1
-
-        return deleted_node
+        return self.remove_node(self._head)
 
     def pop_from_back(self) -> PlayerNode | None:
         """
@@ -198,21 +243,118 @@ class PlayerList:
         if self._is_empty:
             raise IndexError("List is empty")
 
-        deleted_node = self._tail
+        return self.remove_node(self._tail)
 
-        if self._head == self._tail:
-            self._head = None
-            self._tail = None
-        else:
-            self._tail.player_prev_node.player_next_node = None
-            self._tail = self._tail.player_prev_node
-            self._tail.player_prev_node = None  # clearing the prev reference to the node for the deleted node
+    def _new_node(self, player: Player) -> PlayerNode:
+        """
+        Returns a node for the given player, taken from the node pool if the list has one.
 
-        self._is_empty = self._head is None
+        Parameters:
+        -----------
+        player : Player
+            The player to store in the node.
 
-        self._length -= 1
+        Returns:
+        --------
+        PlayerNode
+            A node holding the player.
+        """
+        if self._node_pool is not None:
+            return self._node_pool.acquire(player)
+        return PlayerNode(player)
+
+    def _recycle(self, player_node: PlayerNode) -> Player:
+        """
+        Returns an unlinked node to the node pool, if the list has one.
+
+        Parameters:
+        -----------
+        player_node : PlayerNode
+            A node removed from the list that nobody else holds on to.
+
+        Returns:
+        --------
+        Player
+            The player the node held.
+        """
+        player = player_node.player
+        if self._node_pool is not None:
+            self._node_pool.release(player_node)
+        return player
+
+    def push_player_front(self, player: Player):
+        """
+        Adds a player to the front of the list in a node drawn from the node pool.
+
+        Parameters:
+        -----------
+        player : Player
+            The player to add.
+
+        Raises:
+        -------
+        ValueError:
+            If the player's uid already exists in the list.
+        """
+        player_node = self._new_node(player)
+        try:
+            self.push_front(player_node)
+        except ValueError:
+            self._recycle(player_node)
+            raise
+
+    def push_player_back(self, player: Player):
+        """
+        Adds a player to the end of the list in a node drawn from the node pool.
+
+        Parameters:
+        -----------
+        player : Player
+            The player to add.
+
+        Raises:
+        -------
+        ValueError:
+            If the player's uid already exists in the list.
+        """
+        player_node = self._new_node(player)
+        try:
+            self.push_back(player_node)
+        except ValueError:
+            self._recycle(player_node)
+            raise
+
+    def pop_player_from_front(self) -> Player:
+        """
+        Removes the node at the front of the list, returns it to the node pool and returns its player.
 
-        return deleted_node
+        Returns:
+        --------
+        Player
+            The player that was at the front of the list.
+
+        Raises:
+        -------
+        IndexError:
+            If the list is empty.
+        """
+        return self._recycle(self.pop_from_front())
+
+    def pop_player_from_back(self) -> Player:
+        """
+        Removes the node at the end of the list, returns it to the node pool and returns its player.
+
+        Returns:
+        --------
+        Player
+            The player that was at the end of the list.
+
+        Raises:
+        -------
+        IndexError:
+            If the list is empty.
+        """
+        return self._recycle(self.pop_from_back())
 
     def pop_by_uid(self, key: str) -> PlayerNode | None:
         """
@@ -238,44 +380,441 @@ class PlayerList:
         if self._is_empty:
             raise IndexError("List is empty")
 
+        current_node = self.find_node_by_key(key)
+
+        if current_node is None:
+            raise ValueError("Value not found")
+
+        return self.remove_node(current_node)
+
+    def remove_node(self, player_node: PlayerNode) -> PlayerNode:
+        """
+        Unlinks the given node from the list in O(1), without searching for it.
+
+        Parameters:
+        -----------
+        player_node : PlayerNode
+            A node that belongs to this list, e.g. one returned by find_node_by_key.
+
+        Returns:
+        --------
+        PlayerNode
+            The removed node, with its next and previous references cleared.
+
+        Raises:
+        -------
+        ValueError:
+            If the node is detected not to belong to this list. With the uid index this is
+            always detected, without it only the head and tail positions can be checked in O(1),
+            so callers must not pass foreign nodes.
+        """
+        prev_node = player_node.player_prev_node
+        next_node = player_node.player_next_node
+
+        if self._uid_index is not None:
+            if self._uid_index.get(player_node.key) is not player_node:
+                raise ValueError("Node does not belong to the list")
+            del self._uid_index[player_node.key]
+        elif (prev_node is None and self._head is not player_node) or \
+                (next_node is None and self._tail is not player_node):
+            raise ValueError("Node does not belong to the list")
+
+        # situation where node is a head (or a head and a tail at the same time)
+        if prev_node is None:
+            self._head = next_node
+        else:
+            prev_node.player_next_node = next_node
+
+        # situation where node is a tail (or a head and a tail at the same time)
+        if next_node is None:
+            self._tail = prev_node
+        else:
+            next_node.player_prev_node = prev_node
+
+        # clearing the references of the deleted node
+        player_node.player_prev_node = None
+        player_node.player_next_node = None
+
+        self._finger = None
+
+        self._is_empty = self._head is None
+        self._length -= 1
+        return player_node
+
+    def _unlink_where(self, predicate: abc.Callable[[PlayerNode], bool], limit: int | None = None) -> list:
+        """
+        Unlinks every node matching the predicate in a single pass from head to tail.
+
+        Parameters:
+        -----------
+        predicate : Callable[[PlayerNode], bool]
+            Returns True for the nodes to remove.
+        limit : Optional[int]
+            Stops the pass once this many nodes were removed, or None to walk the whole list.
+
+        Returns:
+        --------
+        list
+            The removed nodes in list order, with their next and previous references cleared.
+        """
+        removed = []
         current_node = self._head
 
-        while current_node is not None:
-            if current_node.key == key:
-
-                # situation where node is in between the head and the tail
-                if current_node.player_prev_node and current_node.player_next_node:
-                    current_node.player_prev_node.player_next_node = current_node.player_next_node
-                    current_node.player_next_node.player_prev_node = current_node.player_prev_node
-                    # actually clearing the next reference to the node for the deleted node
-                    current_node.player_prev_node = None
-                    # clearing the prev reference to the node for the deleted node
-                    current_node.player_next_node = None
-
-                # situation where node is a head
-                elif current_node.player_next_node:
-                    current_node.player_next_node.player_prev_node = None
-                    self._head = current_node.player_next_node
-                    # actually clearing next reference to the node for the deleted node
-                    current_node.player_next_node = None
-
-                # situation where node is a tail
-                elif current_node.player_prev_node:
-                    current_node.player_prev_node.player_next_node = None
-                    self._tail = current_node.player_prev_node
-                    # actually clearing the prev reference to the node for the deleted node
-                    current_node.player_prev_node = None
-
-                # situation where node is a head and tail at the same time
-                elif current_node == self._head and current_node == self._tail:
-                    self._head = self._tail = None
-
-                self._is_empty = self._head is None
-                self._length -= 1
-                return current_node
-
-            current_node = current_node.player_next_node
-        raise ValueError("Value not found")
+        while current_node is not None and (limit is None or len(removed) < limit):
+            next_node = current_node.player_next_node
+            if predicate(current_node):
+                prev_node = current_node.player_prev_node
+                if prev_node is None:
+                    self._head = next_node
+                else:
+                    prev_node.player_next_node = next_node
+                if next_node is None:
+                    self._tail = prev_node
+                else:
+                    next_node.player_prev_node = prev_node
+
+                current_node.player_prev_node = None
+                current_node.player_next_node = None
+                if self._uid_index is not None:
+                    del self._uid_index[current_node.key]
+                removed.append(current_node)
+            current_node = next_node
+
+        if removed:
+            self._length -= len(removed)
+            self._is_empty = self._head is None
+            self._finger = None
+        return removed
+
+    def pop_many(self, uids: abc.Iterable[str]) -> tuple:
+        """
+        Removes the nodes with the given unique IDs in a single pass over the list.
+
+        Unlike repeated pop_by_uid calls, uids that are not in the list do not raise, they are
+        reported back so that the rest of the batch is still removed. With the uid index the pass
+        stops as soon as the last present uid is found.
+
+        Parameters:
+        -----------
+        uids : Iterable[str]
+            The unique IDs of the nodes to remove. Repeated uids are only removed once.
+
+        Returns:
+        --------
+        tuple
+            The list of removed nodes, in list order, and the list of uids that were not found,
+            in the order they were given.
+        """
+        wanted = dict.fromkeys(uids)
+
+        if self._uid_index is not None:
+            present = sum(1 for uid in wanted if uid in self._uid_index)
+            removed = self._unlink_where(lambda node: node.key in wanted, present) if present else []
+        else:
+            removed = self._unlink_where(lambda node: node.key in wanted)
+
+        removed_uids = {node.key for node in removed}
+        missing = [uid for uid in wanted if uid not in removed_uids]
+        return removed, missing
+
+    def remove_where(self, predicate: abc.Callable[[PlayerNode], bool]) -> list:
+        """
+        Removes every node matching the predicate in a single pass over the list.
+
+        Parameters:
+        -----------
+        predicate : Callable[[PlayerNode], bool]
+            Called once with each node, returns True for the nodes to remove. It must not modify the list.
+
+        Returns:
+        --------
+        list
+            The removed nodes, in list order.
+        """
+        return self._unlink_where(predicate)
+
+    def _keys(self) -> abc.Container:
+        """
+        Returns a container of the uids in the list for duplicate checks against many nodes.
+
+        Returns:
+        --------
+        Container
+            The uid index itself if enabled, otherwise a set built in a single pass.
+        """
+        if self._uid_index is not None:
+            return self._uid_index
+        return {node.key for node in self.iterate()}
+
+    def _link_chain(self, after_node: PlayerNode | None, first: PlayerNode, last: PlayerNode, length: int):
+        """
+        Links an already connected chain of nodes into the list in O(1).
+
+        Parameters:
+        -----------
+        after_node : Optional[PlayerNode]
+            The node of this list to insert the chain after, or None to insert it at the front.
+        first : PlayerNode
+            The first node of the chain.
+        last : PlayerNode
+            The last node of the chain.
+        length : int
+            The number of nodes in the chain.
+        """
+        next_node = self._head if after_node is None else after_node.player_next_node
+        if next_node is not None:
+            # appending at the tail leaves the positions of the existing nodes unchanged
+            self._finger = None
+
+        first.player_prev_node = after_node
+        if after_node is None:
+            self._head = first
+        else:
+            after_node.player_next_node = first
+
+        last.player_next_node = next_node
+        if next_node is None:
+            self._tail = last
+        else:
+            next_node.player_prev_node = last
+
+        self._is_empty = False
+        self._length += length
+
+    def extend(self, players: abc.Iterable[PlayerNode | Player]):
+        """
+        Appends many nodes (or players, which are wrapped in new nodes) to the end of the list.
+
+        Duplicates are checked for the whole batch before anything is linked, with a single pass
+        over the list when it has no uid index, instead of one full scan per pushed node.
+
+        Parameters:
+        -----------
+        players : Iterable[PlayerNode | Player]
+            The nodes or players to append, in order.
+
+        Raises:
+        -------
+        ValueError:
+            If a uid is already in the list or repeats within the batch. The list is left unchanged.
+        """
+        existing_keys = self._keys()
+        batch = {}
+        prev_node = None
+
+        for player in players:
+            player_node = player if isinstance(player, PlayerNode) else PlayerNode(player)
+            key = player_node.key
+            if key in existing_keys or key in batch:
+                # leave the already chained nodes of the batch unlinked again
+                for node in batch.values():
+                    node.player_prev_node = node.player_next_node = None
+                raise ValueError(f"Player or PlayerNode already exists in the list with uid{key}")
+
+            batch[key] = player_node
+            player_node.player_prev_node = prev_node
+            if prev_node is not None:
+                prev_node.player_next_node = player_node
+            prev_node = player_node
+
+        if not batch:
+            return
+
+        first_node = next(iter(batch.values()))
+        if self._uid_index is not None:
+            self._uid_index.update(batch)
+
+        self._link_chain(self._tail, first_node, prev_node, len(batch))
+
+    def _take_nodes(self, other: PlayerList, check_duplicates: bool) -> tuple:
+        """
+        Validates the nodes of another list, moves them into the uid index and empties the other list.
+
+        Parameters:
+        -----------
+        other : PlayerList
+            The list whose nodes are being moved into this one.
+        check_duplicates : bool
+            Whether to reject uids that are already in this list.
+
+        Returns:
+        --------
+        tuple
+            The first node, last node and number of nodes taken from the other list.
+
+        Raises:
+        -------
+        ValueError:
+            If the other list is this list, or shares a uid with it. Both lists are left unchanged.
+        """
+        if other is self:
+            raise ValueError("Cannot move a list into itself")
+
+        if check_duplicates:
+            # probe the indexed side with the keys of the other one, preferring the smaller list
+            if other._uid_index is not None and (self._uid_index is None or len(other) > len(self)):
+                keys, container = (node.key for node in self.iterate()), other._uid_index
+            else:
+                keys, container = (node.key for node in other.iterate()), self._keys()
+            for key in keys:
+                if key in container:
+                    raise ValueError(f"Player or PlayerNode already exists in the list with uid{key}")
+
+        if self._uid_index is not None:
+            if other._uid_index is not None:
+                self._uid_index.update(other._uid_index)
+            else:
+                self._uid_index.update((node.key, node) for node in other.iterate())
+
+        taken = (other._head, other._tail, other._length)
+
+        other._head = other._tail = None
+        other._is_empty = True
+        other._length = 0
+        other._finger = None
+        if other._uid_index is not None:
+            other._uid_index = {}
+
+        return taken
+
+    def concat(self, other: PlayerList, check_duplicates: bool = True):
+        """
+        Moves all nodes of another list to the end of this one, leaving the other list empty.
+
+        The nodes are relinked in O(1). Keeping the uid index up to date and checking for duplicates
+        cost O(len(other)) on top of that; both are skipped when neither is needed.
+
+        Parameters:
+        -----------
+        other : PlayerList
+            The list to append. It is empty afterwards.
+        check_duplicates : bool
+            If False, skips the duplicate check. Only safe when the lists are known to share no uid.
+
+        Raises:
+        -------
+        ValueError:
+            If the other list is this list, or shares a uid with it. Both lists are left unchanged.
+        """
+        self.splice(self._tail, other, check_duplicates)
+
+    def splice(self, after_node: PlayerNode | None, other: PlayerList, check_duplicates: bool = True):
+        """
+        Moves all nodes of another list into this one right after the given node, leaving the other
+        list empty.
+
+        The nodes are relinked in O(1), see concat() for the cost of the uid index and duplicate check.
+
+        Parameters:
+        -----------
+        after_node : Optional[PlayerNode]
+            The node of this list to insert the other list after, or None to insert it at the front.
+        other : PlayerList
+            The list to insert. It is empty afterwards.
+        check_duplicates : bool
+            If False, skips the duplicate check. Only safe when the lists are known to share no uid.
+
+        Raises:
+        -------
+        ValueError:
+            If the node is detected not to belong to this list, the other list is this list, or the
+            lists share a uid. Both lists are left unchanged.
+        """
+        if after_node is not None:
+            if self._uid_index is not None:
+                is_member = self._uid_index.get(after_node.key) is after_node
+            else:
+                is_member = after_node.player_next_node is not None or self._tail is after_node
+            if not is_member:
+                raise ValueError("Node does not belong to the list")
+
+        if other.is_empty:
+            if other is self:
+                raise ValueError("Cannot move a list into itself")
+            return
+
+        first, last, length = self._take_nodes(other, check_duplicates)
+        self._link_chain(after_node, first, last, length)
+
+    def _node_at(self, index: int) -> PlayerNode:
+        """
+        Returns the node at the given position, walking from the closest of the head, the tail
+        and the cached finger, and moves the finger there.
+
+        Parameters:
+        -----------
+        index : int
+            A position between 0 and len(self) - 1.
+
+        Returns:
+        --------
+        PlayerNode
+            The node at the given position.
+        """
+        node, position, distance = self._head, 0, index
+        if self._length - 1 - index < distance:
+            node, position, distance = self._tail, self._length - 1, self._length - 1 - index
+        if self._finger is not None and abs(index - self._finger[1]) < distance:
+            node, position = self._finger
+
+        while position < index:
+            node = node.player_next_node
+            position += 1
+        while position > index:
+            node = node.player_prev_node
+            position -= 1
+
+        self._finger = (node, index)
+        return node
+
+    def __getitem__(self, index: int | slice) -> PlayerNode | list:
+        """
+        Returns the node at the given position, or a list of the nodes in the given slice.
+
+        A lookup walks from the head, the tail or the position of the previous lookup, whichever is
+        closest, so sequential or nearby accesses such as paging cost O(distance) instead of O(index).
+
+        Parameters:
+        -----------
+        index : int | slice
+            The position of the node, negative positions counting from the end, or a slice of positions.
+
+        Returns:
+        --------
+        PlayerNode | list
+            The node at the given position, or a list of the nodes in the slice, in slice order.
+
+        Raises:
+        -------
+        IndexError:
+            If the position is out of range.
+        TypeError:
+            If the index is neither an integer nor a slice.
+        """
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._length))
+            if not positions:
+                return []
+
+            node = self._node_at(positions[0])
+            nodes = [node]
+            step = positions.step
+            for _ in positions[1:]:
+                for _ in range(abs(step)):
+                    node = node.player_next_node if step > 0 else node.player_prev_node
+                nodes.append(node)
+
+            self._finger = (node, positions[-1])
+            return nodes
+
+        if not isinstance(index, int):
+            raise TypeError(f"List indices must be integers or slices, not {type(index).__name__}")
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("List index out of range")
+
+        return self._node_at(index)
 
     def iterate(self, forward: bool = True):
         """
@@ -326,6 +865,22 @@ class PlayerList:
             current_node = getattr(current_node, next_attr)
 
     def find_node_by_key(self, uid: str) -> Optional[PlayerNode]:
+        """
+        Finds the node holding the player with the given unique ID.
+
+        Parameters:
+        -----------
+        uid : str
+            The unique ID to look for.
+
+        Returns:
+        --------
+        Optional[PlayerNode]
+            The node with the given ID, or None if it is not in the list.
+        """
+        if self._uid_index is not None:
+            return self._uid_index.get(uid)
+
         current = self._head
         while current:
             if current.key == uid:
@@ -15,8 +15,12 @@ class PlayerNode:
         A reference to the next node in the linked list.
     _player_prev_node : Optional[PlayerNode]
         A reference to the previous node in the linked list.
+
+    Nodes use __slots__ instead of a per-instance __dict__ to keep large lists compact.
     """
-    _player = Player
+    __slots__ = ("_player", "_player_next_node", "_player_prev_node")
+
+    _player: Player
     _player_next_node: PlayerNode | None
     _player_prev_node: PlayerNode | None
 
@@ -53,6 +57,26 @@ class PlayerNode:
         """
         return self._player
 
+    @player.setter
+    def player(self, player: Player):
+        """
+        Replaces the player associated with this node.
+
+        Parameters:
+        -----------
+        player : Player
+            The player instance to be associated with this node.
+
+        Raises:
+        -------
+        ValueError:
+            If the provided player is None or not an instance of Player.
+        """
+        if player is None or not isinstance(player, Player):
+            raise ValueError("Must provide Player instance!")
+
+        self._player = player
+
     @property
     def player_next_node(self) -> PlayerNode | None:
         """
@@ -101,6 +125,17 @@ class PlayerNode:
         """
         self._player_prev_node = player_prev_node
 
+    def detach(self):
+        """
+        Clears the player and the next and previous references of this node.
+
+        Used by PlayerNodePool to recycle nodes without keeping their last player alive.
+        The node must be given a new player before it is used again.
+        """
+        self._player = None
+        self._player_next_node = None
+        self._player_prev_node = None
+
     @property
     def key(self) -> str:
         """
@@ -119,9 +154,12 @@ class PlayerNode:
 
        Equality is determined based on either:
        - The two nodes being the same instance.
-       - The players they contain being equal.
+       - The players they contain being the same instance.
        - The unique IDs (keys) of the players being the same.
 
+       Players are deliberately not compared with ``==`` here, as Player
+       equality is defined by score and unrelated players would clash.
+
        Parameters:
        -----------
        other : Any
@@ -133,8 +171,8 @@ class PlayerNode:
            True if the nodes are considered equal, False otherwise.
        """
         if isinstance(other, PlayerNode):
-            return (self == other or
-                    self.player == other.player or
+            return (self is other or
+                    self.player is other.player or
                     self.key == other.key)
 
         return False
@@ -0,0 +1,175 @@
+from __future__ import annotations
+from typing import Dict, List
+from player_node import PlayerNode
+from player import Player
+
+
+class PlayerNodePool:
+    """
+    A free list of PlayerNodes that lets high-churn PlayerLists reuse nodes instead of
+    allocating a new one for every push and leaving the popped one to the garbage collector.
+
+    Attributes:
+    -----------
+    _free_nodes : List[PlayerNode]
+        The detached nodes ready to be handed out again.
+    _max_size : int
+        The maximum number of nodes kept in the pool, released nodes beyond it are dropped.
+    _hits : int
+        The number of acquired nodes that were taken from the pool.
+    _misses : int
+        The number of acquired nodes that had to be allocated.
+    _discarded : int
+        The number of released nodes dropped because the pool was full.
+    """
+
+    MAX_SIZE: int = 1024
+
+    _free_nodes: List[PlayerNode]
+    _max_size: int
+    _hits: int
+    _misses: int
+    _discarded: int
+
+    def __init__(self, max_size: int = MAX_SIZE, preallocate: int = 0):
+        """
+        Initializes an empty pool.
+
+        Parameters:
+        -----------
+        max_size : int
+            The maximum number of free nodes to keep.
+        preallocate : int
+            The number of nodes to allocate up front (at most max_size).
+
+        Raises:
+        -------
+        ValueError:
+            If max_size or preallocate is negative.
+        """
+        if max_size < 0 or preallocate < 0:
+            raise ValueError("Pool sizes must not be negative")
+
+        self._max_size = max_size
+        self._free_nodes = []
+        self._hits = 0
+        self._misses = 0
+        self._discarded = 0
+
+        placeholder = Player("", "")
+        for _ in range(min(preallocate, max_size)):
+            node = PlayerNode(placeholder)
+            node.detach()
+            self._free_nodes.append(node)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of free nodes currently in the pool.
+
+        Returns:
+        --------
+        int
+            The number of nodes that can be acquired without an allocation.
+        """
+        return len(self._free_nodes)
+
+    @property
+    def max_size(self) -> int:
+        """
+        Returns the maximum number of free nodes the pool keeps.
+
+        Returns:
+        --------
+        int
+            The pool size limit.
+        """
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        """
+        Returns the number of acquired nodes that were reused from the pool.
+
+        Returns:
+        --------
+        int
+            The hit counter.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Returns the number of acquired nodes that had to be allocated.
+
+        Returns:
+        --------
+        int
+            The miss counter.
+        """
+        return self._misses
+
+    def acquire(self, player: Player) -> PlayerNode:
+        """
+        Returns a node holding the given player, reusing a free node if there is one.
+
+        Parameters:
+        -----------
+        player : Player
+            The player to store in the node.
+
+        Returns:
+        --------
+        PlayerNode
+            A node with the player set and no next or previous references.
+
+        Raises:
+        -------
+        ValueError:
+            If the provided player is None or not an instance of Player.
+        """
+        if not self._free_nodes:
+            self._misses += 1
+            return PlayerNode(player)
+
+        # the player is validated by its setter before the node leaves the pool, so a bad player
+        # cannot lose a pooled node
+        node = self._free_nodes[-1]
+        node.player = player
+        self._free_nodes.pop()
+        self._hits += 1
+        return node
+
+    def release(self, node: PlayerNode):
+        """
+        Returns a node that is no longer linked into any list to the pool.
+
+        Its player and references are cleared. If the pool is already full the node is dropped.
+
+        Parameters:
+        -----------
+        node : PlayerNode
+            The node to recycle. It must not be used by the caller afterwards.
+        """
+        node.detach()
+        if len(self._free_nodes) < self._max_size:
+            self._free_nodes.append(node)
+        else:
+            self._discarded += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the pool counters.
+
+        Returns:
+        --------
+        Dict[str, int]
+            The number of free nodes, the size limit and the hit, miss and discard counters.
+        """
+        return {
+            "free": len(self._free_nodes),
+            "max_size": self._max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "discarded": self._discarded,
+        }
@@ -0,0 +1,230 @@
+from __future__ import annotations
+import heapq
+import os
+from array import array
+from bisect import bisect_left
+from collections import abc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List
+from player import Player
+
+# Inputs smaller than this are sorted in the calling process, where starting a pool costs more than it saves.
+MIN_PARALLEL_SIZE: int = 100_000
+# Samples taken per chunk and worker to pick the splitters of the merge phase.
+OVERSAMPLING: int = 32
+
+
+def _attach(name: str) -> tuple:
+    """
+    Attaches to a shared memory block created by the parent process as an array of int64.
+
+    Parameters:
+    -----------
+    name : str
+        The name of the shared memory block.
+
+    Returns:
+    --------
+    tuple
+        The SharedMemory object and an int64 memoryview of its buffer, which must be released before
+        the block is closed.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    return block, block.buf.cast("q")
+
+
+def _sort_chunk(scores_name: str, order_name: str, start: int, end: int):
+    """
+    Worker task: writes the positions start..end - 1 to the order array, stably sorted by descending score.
+
+    Parameters:
+    -----------
+    scores_name : str
+        The shared memory block of the scores.
+    order_name : str
+        The shared memory block receiving the sorted positions.
+    start : int
+        The first position of the chunk.
+    end : int
+        The position after the last one of the chunk.
+    """
+    scores_block, scores = _attach(scores_name)
+    order_block, order = _attach(order_name)
+    try:
+        order[start:end] = array("q", sorted(range(start, end), key=scores.__getitem__, reverse=True))
+    finally:
+        scores.release()
+        order.release()
+        scores_block.close()
+        order_block.close()
+
+
+def _merge_chunks(scores_name: str, order_name: str, output_name: str, ranges: List[tuple], output_start: int):
+    """
+    Worker task: k-way merges one slice of every sorted chunk into a contiguous part of the output array.
+
+    Parameters:
+    -----------
+    scores_name : str
+        The shared memory block of the scores.
+    order_name : str
+        The shared memory block of the chunk-sorted positions.
+    output_name : str
+        The shared memory block receiving the fully sorted positions.
+    ranges : List[tuple]
+        The (start, end) slice of the order array to take from each chunk, in chunk order.
+    output_start : int
+        Where the merged positions go in the output array.
+    """
+    scores_block, scores = _attach(scores_name)
+    order_block, order = _attach(order_name)
+    output_block, output = _attach(output_name)
+    runs = []
+    try:
+        runs.extend(order[start:end] for start, end in ranges)
+        # merging the chunks in input order keeps equal scores in input order
+        merged = array("q", heapq.merge(*runs, key=scores.__getitem__, reverse=True))
+        output[output_start:output_start + len(merged)] = merged
+    finally:
+        # the runs are views of the order block, which cannot be closed while they are exported
+        for run in runs:
+            run.release()
+        scores.release()
+        order.release()
+        output.release()
+        scores_block.close()
+        order_block.close()
+        output_block.close()
+
+
+def _split_positions(scores: memoryview, order: memoryview, bounds: List[int], workers: int) -> List[List[int]]:
+    """
+    Cuts every sorted chunk at the same global splitters, so that the j-th slices of all chunks hold
+    exactly the elements of the j-th part of the final order.
+
+    Splitters are (score, position) pairs, the position breaking ties, so that the cuts are exact even
+    when most scores are equal.
+
+    Parameters:
+    -----------
+    scores : memoryview
+        The scores.
+    order : memoryview
+        The positions, sorted within each chunk.
+    bounds : List[int]
+        The start of every chunk, followed by the end of the last one.
+    workers : int
+        The number of parts to cut the final order into.
+
+    Returns:
+    --------
+    List[List[int]]
+        For every chunk, the workers + 1 positions in the order array where its slices start and end.
+    """
+    def sort_key(position):
+        return -scores[position], position
+
+    samples = []
+    for chunk in range(len(bounds) - 1):
+        start, end = bounds[chunk], bounds[chunk + 1]
+        step = max(1, (end - start) // (OVERSAMPLING * workers))
+        samples.extend(sort_key(order[index]) for index in range(start, end, step))
+    samples.sort()
+    splitters = [samples[len(samples) * part // workers] for part in range(1, workers)]
+
+    return [[start] + [bisect_left(order, splitter, start, end, key=sort_key) for splitter in splitters] + [end]
+            for start, end in zip(bounds, bounds[1:])]
+
+
+def parallel_argsort_descending(scores: abc.Sequence[int], workers: int | None = None) -> array:
+    """
+    Returns the positions of the scores in stable descending order, sorting with a pool of processes.
+
+    The scores are copied once into a shared memory block of int64. Every worker sorts one chunk of
+    positions by score into a second block, the chunks are cut at sampled splitters, and every worker
+    k-way merges its slice of all chunks into a third block. Only shared memory names and a few
+    integers are pickled, never the scores or Player objects, and the calling process does no more
+    than O(workers^2 log n) work besides copying the scores in and the result out.
+
+    Parameters:
+    -----------
+    scores : Sequence[int]
+        The scores to sort. They must fit in a signed 64-bit integer.
+    workers : Optional[int]
+        The number of worker processes, or None for one per CPU. Inputs smaller than
+        MIN_PARALLEL_SIZE, or a single worker, are sorted in the calling process.
+
+    Returns:
+    --------
+    array
+        An array of int64 positions into scores, by descending score, equal scores in input order.
+
+    Raises:
+    -------
+    OverflowError:
+        If a score does not fit in a signed 64-bit integer, when sorting in parallel.
+    """
+    count = len(scores)
+    workers = min(workers or os.cpu_count() or 1, count)
+    if workers < 2 or count < MIN_PARALLEL_SIZE:
+        return array("q", sorted(range(count), key=scores.__getitem__, reverse=True))
+
+    blocks = [shared_memory.SharedMemory(create=True, size=8 * count) for _ in range(3)]
+    # the blocks may be rounded up to whole pages, so the views are cut to the exact size
+    views = [block.buf[:8 * count].cast("q") for block in blocks]
+    scores_view, order_view, output_view = views
+    names = [block.name for block in blocks]
+    try:
+        scores_view[:] = array("q", scores)
+        bounds = [count * chunk // workers for chunk in range(workers + 1)]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for future in [pool.submit(_sort_chunk, names[0], names[1], start, end)
+                           for start, end in zip(bounds, bounds[1:])]:
+                future.result()
+
+            cuts = _split_positions(scores_view, order_view, bounds, workers)
+            tasks = []
+            output_start = 0
+            for part in range(workers):
+                ranges = [(chunk_cuts[part], chunk_cuts[part + 1]) for chunk_cuts in cuts]
+                tasks.append(pool.submit(_merge_chunks, *names, ranges, output_start))
+                output_start += sum(end - start for start, end in ranges)
+            for future in tasks:
+                future.result()
+
+        positions = array("q")
+        positions.frombytes(output_view.cast("B"))
+        return positions
+    finally:
+        for view in views:
+            view.release()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def parallel_sort_descending(collection: abc.Iterable, workers: int | None = None) -> list:
+    """
+    Sorts players, by score, or plain integer scores in descending order using a pool of processes.
+
+    It returns the same result as Player.quicksort_descending, a new descending list, except that
+    equal scores keep their input order. See parallel_argsort_descending() for how the work is split.
+
+    Parameters:
+    -----------
+    collection : Iterable
+        The players or integer scores to sort.
+    workers : Optional[int]
+        The number of worker processes, or None for one per CPU.
+
+    Returns:
+    --------
+    list
+        A new list with the elements of the collection, sorted in descending order.
+    """
+    items = list(collection)
+    scores = [item.score for item in items] if items and isinstance(items[0], Player) else items
+
+    return [items[position] for position in parallel_argsort_descending(scores, workers)]
@@ -0,0 +1,183 @@
+from __future__ import annotations
+from bisect import bisect_left
+from typing import Dict, List
+from player_sort import players_of
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RANK_METHODS = ("competition", "dense")
+
+
+class PlayerRanking:
+    """
+    Ranks, percentiles and descending order of the players of a collection.
+
+    The uids and scores are read from the collection once, and the descending order is computed once
+    and shared by all queries. When NumPy is installed, the scores are held in a contiguous int64 array
+    and every query is vectorized; otherwise the same results are computed in pure Python.
+
+    Attributes:
+    -----------
+    _uids : List[str]
+        The uids of the players, in collection order.
+    _scores : List[int] | numpy.ndarray
+        The scores of the players, in collection order.
+    _order : List[int] | numpy.ndarray
+        The positions of the players by descending score, equal scores in collection order.
+    _use_numpy : bool
+        Whether the NumPy path is used.
+    """
+
+    _uids: List[str]
+    _use_numpy: bool
+
+    def __init__(self, collection, use_numpy: bool | None = None):
+        """
+        Reads the players of a collection and sorts them by descending score.
+
+        Parameters:
+        -----------
+        collection
+            A PlayerHashMap, a PlayerList, an UnrolledPlayerList or any iterable of players.
+        use_numpy : Optional[bool]
+            True to require the NumPy path, False to force the pure-Python one, or None to use NumPy
+            when it is installed.
+
+        Raises:
+        -------
+        ImportError:
+            If use_numpy is True and NumPy is not installed.
+        """
+        if use_numpy and np is None:
+            raise ImportError("NumPy is required for use_numpy=True")
+        self._use_numpy = np is not None if use_numpy is None else use_numpy
+
+        players = players_of(collection)
+        self._uids = [player.uid for player in players]
+
+        if self._use_numpy:
+            self._scores = np.fromiter((player.score for player in players), dtype=np.int64, count=len(players))
+            # the stable sort of the negated scores keeps equal scores in collection order
+            self._order = np.argsort(-self._scores, kind="stable")
+        else:
+            self._scores = [player.score for player in players]
+            self._order = sorted(range(len(players)), key=self._scores.__getitem__, reverse=True)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of ranked players.
+
+        Returns:
+            int: The number of players.
+        """
+        return len(self._uids)
+
+    @property
+    def uses_numpy(self) -> bool:
+        """
+        Returns whether the rankings are computed with NumPy.
+
+        Returns:
+        --------
+        bool
+            True if the NumPy path is used, False for the pure-Python one.
+        """
+        return self._use_numpy
+
+    def descending_uids(self) -> List[str]:
+        """
+        Returns the uids of the players by descending score.
+
+        Returns:
+        --------
+        List[str]
+            The uids, best player first, equal scores in collection order.
+        """
+        return [self._uids[position] for position in self._order]
+
+    def ranks(self, method: str = "competition") -> Dict[str, int]:
+        """
+        Returns the rank of every player, 1 being the best.
+
+        Parameters:
+        -----------
+        method : str
+            "competition" for ranks that skip after ties (1, 2, 2, 4), or "dense" for ranks that
+            do not (1, 2, 2, 3).
+
+        Returns:
+        --------
+        Dict[str, int]
+            The rank of each player by uid.
+
+        Raises:
+        -------
+        ValueError:
+            If the method is unknown.
+        """
+        if method not in RANK_METHODS:
+            raise ValueError(f"Unknown rank method {method}, expected one of {RANK_METHODS}")
+
+        uids = self.descending_uids()
+        if not uids:
+            return {}
+
+        if self._use_numpy:
+            sorted_scores = self._scores[self._order]
+            # True at the first player of every group of equal scores
+            starts = np.empty(len(sorted_scores), dtype=bool)
+            starts[0] = True
+            np.not_equal(sorted_scores[1:], sorted_scores[:-1], out=starts[1:])
+            if method == "dense":
+                ranks = np.cumsum(starts)
+            else:
+                ranks = np.maximum.accumulate(np.where(starts, np.arange(1, len(starts) + 1), 0))
+            return dict(zip(uids, ranks.tolist()))
+
+        ranks = {}
+        rank = dense_rank = 0
+        previous_score = None
+        for index, position in enumerate(self._order):
+            score = self._scores[position]
+            if score != previous_score:
+                rank = index + 1
+                dense_rank += 1
+                previous_score = score
+            ranks[self._uids[position]] = dense_rank if method == "dense" else rank
+        return ranks
+
+    def percentile_buckets(self, buckets: int = 100) -> Dict[str, int]:
+        """
+        Returns the percentile bucket of every player: the share of players with a strictly lower score,
+        scaled to 0..buckets - 1. With 100 buckets, a player in bucket 90 beats at least 90% of the players.
+
+        Parameters:
+        -----------
+        buckets : int
+            The number of buckets, e.g. 100 for percentiles or 10 for deciles.
+
+        Returns:
+        --------
+        Dict[str, int]
+            The bucket of each player by uid. Players with equal scores share a bucket.
+
+        Raises:
+        -------
+        ValueError:
+            If the number of buckets is less than 1.
+        """
+        if buckets < 1:
+            raise ValueError("There must be at least one bucket")
+
+        count = len(self._uids)
+        if self._use_numpy:
+            ascending_scores = self._scores[self._order[::-1]]
+            lower = np.searchsorted(ascending_scores, self._scores, side="left")
+            return dict(zip(self._uids, (lower * buckets // count).tolist()))
+
+        ascending_scores = [self._scores[position] for position in reversed(self._order)]
+        return {uid: bisect_left(ascending_scores, score) * buckets // count
+                for uid, score in zip(self._uids, self._scores)}
@@ -0,0 +1,652 @@
+from __future__ import annotations
+import heapq
+from collections import Counter, abc
+from itertools import accumulate, chain
+from operator import attrgetter
+from typing import List
+
+# Ranges of at most this many elements are finished with insertion sort.
+INSERTION_SORT_THRESHOLD: int = 16
+# Ranges of more than this many elements pick the pivot with Tukey's ninther instead of a median of three.
+NINTHER_THRESHOLD: int = 128
+# integer_sort_descending() uses counting sort when the scores span fewer values than there are
+# players, and radix sort otherwise; counting sort is faster up to about that range.
+COUNTING_SORT_RANGE_FACTOR: int = 1
+# The number of bits of the score sorted by each pass of the radix sort.
+RADIX_BITS: int = 11
+_score = attrgetter("score")
+
+
+def introsort_descending(items: List, lo: int = 0, hi: int | None = None):
+    """
+    Sorts a list, or the range items[lo:hi] of it, in descending order, in place.
+
+    An iterative introsort: quicksort with a median-of-three (or ninther) pivot and three-way
+    partitioning, so runs of equal elements such as duplicate scores are placed in a single pass and
+    never partitioned again. Small ranges are finished with insertion sort, and a range that keeps
+    partitioning badly falls back to heapsort once it exceeds 2 * log2(n) levels, which bounds the
+    worst case to O(n log n). The pending ranges live on an explicit stack, always deferring the
+    larger side, so it holds O(log n) ranges and there is no recursion at all.
+
+    Only the ``<`` operator is used to compare elements. The sort is not stable.
+
+    Parameters:
+    -----------
+    items : List
+        The list to sort.
+    lo : int
+        The first index of the range to sort.
+    hi : Optional[int]
+        The index after the last one of the range to sort, or None to sort up to the end of the list.
+    """
+    if hi is None:
+        hi = len(items)
+    if hi - lo < 2:
+        return
+
+    stack = [(lo, hi, 2 * (hi - lo).bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+
+        while hi - lo > INSERTION_SORT_THRESHOLD:
+            if depth == 0:
+                _heapsort_descending(items, lo, hi)
+                lo = hi
+                break
+            depth -= 1
+
+            greater_end, less_start = _partition_descending(items, lo, hi, _choose_pivot(items, lo, hi))
+            # defer the larger side and keep going with the smaller one
+            if greater_end - lo < hi - less_start:
+                stack.append((less_start, hi, depth))
+                hi = greater_end
+            else:
+                stack.append((lo, greater_end, depth))
+                lo = less_start
+
+        _insertion_sort_descending(items, lo, hi)
+
+
+def players_of(collection) -> List:
+    """
+    Copies the players of a collection into a new list, in a single pass.
+
+    Parameters:
+    -----------
+    collection
+        A PlayerList, an UnrolledPlayerList, a PlayerHashMap (or any other object with a values()
+        method, whose values are used) or any iterable of players or PlayerNodes.
+
+    Returns:
+    --------
+    List
+        The players of the collection.
+    """
+    # duck typed, since importing the collections here would be circular: they all import player
+    if callable(getattr(collection, "values", None)):
+        return list(collection.values())
+    if callable(getattr(collection, "iterate", None)):
+        # a PlayerList yields nodes, an UnrolledPlayerList yields the players themselves
+        return [getattr(item, "player", item) for item in collection.iterate()]
+    # e.g. a PlayerList.iterate() generator, whose nodes are unwrapped as well
+    return [getattr(item, "player", item) for item in collection]
+
+
+def sort_players(collection, key: abc.Callable | None = None, reverse: bool = False) -> List:
+    """
+    Returns the players of a collection in a new list sorted by the given key.
+
+    The sort is stable, also with reverse=True: players with equal keys keep their relative order, so
+    a multi-field ordering can be built from successive sorts, least significant field first. The key
+    is computed once per player (decorate-sort-undecorate) and the collection is copied exactly once,
+    into the returned list, which is then sorted in place.
+
+    Without a key, players whose scores are all non-negative integers are sorted by
+    integer_sort_descending(), in linear time. Other players are sorted by their extracted scores,
+    which gives the same order as comparing them but skips the O(n log n) calls to Player.__lt__.
+
+    Parameters:
+    -----------
+    collection
+        A PlayerList, an UnrolledPlayerList, a PlayerHashMap or any iterable of players.
+    key : Optional[Callable]
+        Computes the sort key of a player, e.g. ``operator.attrgetter("name")`` or
+        ``lambda player: (-player.score, player.uid)`` for scores with a deterministic tie-break.
+        If None, players are compared directly, which compares their scores.
+    reverse : bool
+        If True, sorts in descending order.
+
+    Returns:
+    --------
+    List
+        The sorted players.
+    """
+    players = players_of(collection)
+    if key is None and players and hasattr(players[0], "score"):
+        scores = _integer_scores(players)
+        if scores is not None:
+            return _integer_sort(players, scores, reverse)
+        key = _score
+
+    players.sort(key=key, reverse=reverse)
+    return players
+
+
+def _integer_scores(items: List) -> List[int] | None:
+    """
+    Returns the scores of a list of players, or the integers themselves for a list of scores, if they
+    are all non-negative integers.
+
+    Parameters:
+    -----------
+    items : List
+        Players or integer scores.
+
+    Returns:
+    --------
+    Optional[List[int]]
+        The scores, or None if an item is neither a player nor an integer, or a score is not a
+        non-negative integer.
+    """
+    if not items:
+        return []
+    if type(items[0]) is int:
+        scores = items
+    else:
+        try:
+            scores = list(map(_score, items))
+        except AttributeError:
+            return None
+    return scores if set(map(type, scores)) == {int} and min(scores) >= 0 else None
+
+
+def _integer_sort(items: List, scores: List[int], reverse: bool) -> List:
+    """
+    Stably sorts items by their non-negative integer scores, with counting sort if the scores span
+    fewer than COUNTING_SORT_RANGE_FACTOR * n values, otherwise with radix sort.
+
+    Parameters:
+    -----------
+    items : List
+        The items to sort, at least one.
+    scores : List[int]
+        The score of every item, all non-negative.
+    reverse : bool
+        If True, sorts in descending order.
+
+    Returns:
+    --------
+    List
+        The sorted items, equal scores in their original order.
+    """
+    lowest, highest = min(scores), max(scores)
+    if highest - lowest < COUNTING_SORT_RANGE_FACTOR * len(items):
+        return _counting_sort(items, scores, lowest, highest, reverse)
+    return _radix_sort(items, scores, highest, reverse)
+
+
+def _counting_sort(items: List, scores: List[int], lowest: int, highest: int, reverse: bool) -> List:
+    """
+    Stably sorts items by their integer scores in O(n + highest - lowest).
+
+    The occurrences of every score are counted into an array, whose prefix sums give the position of
+    the first item of each score in the output; every item is then written straight to its position.
+
+    Parameters:
+    -----------
+    items : List
+        The items to sort.
+    scores : List[int]
+        The score of every item.
+    lowest : int
+        The lowest score.
+    highest : int
+        The highest score.
+    reverse : bool
+        If True, sorts in descending order.
+
+    Returns:
+    --------
+    List
+        The sorted items, equal scores in their original order.
+    """
+    counts = [0] * (highest - lowest + 1)
+    for score, count in Counter(scores).items():
+        counts[score - lowest] = count
+
+    if reverse:
+        # the items of a score go after those of all higher scores
+        starts = list(accumulate(reversed(counts), initial=0))[-2::-1]
+    else:
+        starts = list(accumulate(counts, initial=0))
+
+    output = [None] * len(items)
+    for item, score in zip(items, scores):
+        index = score - lowest
+        output[starts[index]] = item
+        starts[index] += 1
+
+    return output
+
+
+def _radix_sort(items: List, scores: List[int], highest: int, reverse: bool) -> List:
+    """
+    Stably sorts items by their non-negative integer scores with an LSD radix sort, in
+    O(n * log(highest) / RADIX_BITS).
+
+    Every pass distributes the positions into one bucket per RADIX_BITS-bit digit, starting from the
+    least significant digit. Each pass keeps the order of the previous one within a bucket, so the
+    final order is sorted by the whole score, and stable.
+
+    Parameters:
+    -----------
+    items : List
+        The items to sort.
+    scores : List[int]
+        The score of every item, all non-negative.
+    highest : int
+        The highest score.
+    reverse : bool
+        If True, sorts in descending order.
+
+    Returns:
+    --------
+    List
+        The sorted items, equal scores in their original order.
+    """
+    mask = (1 << RADIX_BITS) - 1
+    order = range(len(items))
+    shift = 0
+
+    while True:
+        buckets = [[] for _ in range(mask + 1)]
+        appends = [bucket.append for bucket in buckets]
+        for position in order:
+            appends[(scores[position] >> shift) & mask](position)
+        order = list(chain.from_iterable(reversed(buckets) if reverse else buckets))
+
+        shift += RADIX_BITS
+        if highest >> shift == 0:
+            break
+
+    return [items[position] for position in order]
+
+
+def _checked_scores(items: List) -> List[int]:
+    """
+    Returns the scores of players or integer scores, checking that they are non-negative integers.
+
+    Parameters:
+    -----------
+    items : List
+        Players or integer scores.
+
+    Returns:
+    --------
+    List[int]
+        The scores.
+
+    Raises:
+    -------
+    ValueError:
+        If a score is not an integer or is negative.
+    """
+    scores = _integer_scores(items)
+    if scores is None:
+        raise ValueError("Scores must be non-negative integers")
+    return scores
+
+
+def counting_sort_descending(collection) -> List:
+    """
+    Sorts players by score, or plain scores, in stable descending order with counting sort.
+
+    It runs in O(n + k) time and memory for scores between 0 and k, so it suits small score ranges.
+
+    Parameters:
+    -----------
+    collection
+        Players, non-negative integer scores, or any collection accepted by sort_players().
+
+    Returns:
+    --------
+    List
+        A new list sorted in descending order, equal scores in their original order.
+
+    Raises:
+    -------
+    ValueError:
+        If a score is not an integer or is negative.
+    """
+    items = players_of(collection)
+    scores = _checked_scores(items)
+    if not items:
+        return items
+
+    return _counting_sort(items, scores, min(scores), max(scores), reverse=True)
+
+
+def radix_sort_descending(collection) -> List:
+    """
+    Sorts players by score, or plain scores, in stable descending order with an LSD radix sort.
+
+    It runs in O(n) time per RADIX_BITS bits of the highest score, whatever the score range.
+
+    Parameters:
+    -----------
+    collection
+        Players, non-negative integer scores, or any collection accepted by sort_players().
+
+    Returns:
+    --------
+    List
+        A new list sorted in descending order, equal scores in their original order.
+
+    Raises:
+    -------
+    ValueError:
+        If a score is not an integer or is negative.
+    """
+    items = players_of(collection)
+    scores = _checked_scores(items)
+    if not items:
+        return items
+
+    return _radix_sort(items, scores, max(scores), reverse=True)
+
+
+def integer_sort_descending(collection) -> List:
+    """
+    Sorts players by score, or plain scores, in stable descending order in linear time, picking
+    counting sort for small score ranges and LSD radix sort for large ones.
+
+    Counting sort is used when the scores span fewer than COUNTING_SORT_RANGE_FACTOR times as many
+    values as there are players, radix sort otherwise. sort_players() and
+    Player.quicksort_descending() route here by themselves for players with non-negative integer
+    scores.
+
+    Parameters:
+    -----------
+    collection
+        Players, non-negative integer scores, or any collection accepted by sort_players().
+
+    Returns:
+    --------
+    List
+        A new list sorted in descending order, equal scores in their original order.
+
+    Raises:
+    -------
+    ValueError:
+        If a score is not an integer or is negative.
+    """
+    items = players_of(collection)
+    scores = _checked_scores(items)
+    if not items:
+        return items
+
+    return _integer_sort(items, scores, reverse=True)
+
+
+def top_k(players: abc.Iterable, k: int, key: abc.Callable | None = None) -> List:
+    """
+    Returns the k greatest players (or scores) of any iterable, in descending order, in O(n log k).
+
+    The input is streamed through a min-heap bounded to k entries, so it is read once and never
+    materialized, which suits generators such as ``PlayerList.iterate()``. Among equal keys the
+    players that come first in the input are preferred and listed first.
+
+    Parameters:
+    -----------
+    players : Iterable
+        Players, scores, or PlayerNodes, which are unwrapped to their players. Collections with an
+        iterate() or values() method are read through it.
+    k : int
+        The number of players to return.
+    key : Optional[Callable]
+        Computes the value to rank a player by. If None, players are compared directly, which
+        compares their scores.
+
+    Returns:
+    --------
+    List
+        The k best players, or all of them if there are fewer, in descending order.
+    """
+    if callable(getattr(players, "values", None)):
+        players = players.values()
+    elif callable(getattr(players, "iterate", None)):
+        players = players.iterate()
+
+    return heapq.nlargest(k, (getattr(player, "player", player) for player in players), key=key)
+
+
+def select_top_k(players: abc.Iterable, k: int, key: abc.Callable | None = None) -> List:
+    """
+    Returns the k greatest players (or scores) in descending order, using quickselect.
+
+    The players are copied into a list once, which is partitioned around median-of-three pivots until
+    the k greatest ones are at its front, in O(n) on average; only those k are then sorted. A range that
+    keeps partitioning badly is sorted outright instead, bounding the worst case to O(n log n). Being
+    pure Python, it only beats the C-backed heap of top_k() when k is a large fraction of n; prefer
+    top_k() otherwise, and always for input that should not be held in memory.
+
+    Parameters:
+    -----------
+    players : Iterable
+        Players, scores, or any collection accepted by sort_players().
+    k : int
+        The number of players to return.
+    key : Optional[Callable]
+        Computes the value to rank a player by. If None, players are compared directly, which
+        compares their scores.
+
+    Returns:
+    --------
+    List
+        The k best players, or all of them if there are fewer, in descending order. Among equal keys
+        the order is unspecified if key is None, otherwise the players that come first are listed first.
+    """
+    items = players_of(players)
+    if key is not None:
+        # the negated position breaks ties in favour of earlier players and keeps players from being compared
+        items = [(key(player), -index, player) for index, player in enumerate(items)]
+    k = max(0, min(k, len(items)))
+
+    lo, hi = 0, len(items)
+    depth = 2 * hi.bit_length()
+    while hi - lo > INSERTION_SORT_THRESHOLD:
+        if depth == 0:
+            introsort_descending(items, lo, hi)
+            break
+        depth -= 1
+
+        greater_end, less_start = _partition_descending(items, lo, hi, _choose_pivot(items, lo, hi))
+        if k < greater_end:
+            hi = greater_end
+        elif k > less_start:
+            lo = less_start
+        else:
+            # the k-th position holds a pivot-equal element, so the front k are settled
+            break
+    else:
+        # the range holding the k-th position is too small to partition further
+        _insertion_sort_descending(items, lo, hi)
+
+    introsort_descending(items, 0, k)
+    del items[k:]
+    return items if key is None else [player for _, _, player in items]
+
+
+def _median_of_three(a, b, c):
+    """
+    Returns the median of three elements.
+
+    Parameters:
+    -----------
+    a, b, c
+        The elements to compare.
+
+    Returns:
+    --------
+    object
+        The element that is neither the smallest nor the largest.
+    """
+    if a < b:
+        if b < c:
+            return b
+        return c if a < c else a
+    if a < c:
+        return a
+    return c if b < c else b
+
+
+def _choose_pivot(items: List, lo: int, hi: int):
+    """
+    Picks a pivot for the range items[lo:hi]: the median of its first, middle and last elements, or
+    for large ranges the median of three such medians (Tukey's ninther).
+
+    Sampling the ends and the middle keeps already sorted or reversed input, the usual shape of a
+    leaderboard, from producing the one-sided partitions a first-element pivot would.
+
+    Parameters:
+    -----------
+    items : List
+        The list being sorted.
+    lo : int
+        The first index of the range.
+    hi : int
+        The index after the last one of the range.
+
+    Returns:
+    --------
+    object
+        The pivot element.
+    """
+    last = hi - 1
+    middle = lo + (hi - lo) // 2
+
+    if hi - lo <= NINTHER_THRESHOLD:
+        return _median_of_three(items[lo], items[middle], items[last])
+
+    step = (hi - lo) // 8
+    return _median_of_three(
+        _median_of_three(items[lo], items[lo + step], items[lo + 2 * step]),
+        _median_of_three(items[middle - step], items[middle], items[middle + step]),
+        _median_of_three(items[last - 2 * step], items[last - step], items[last]),
+    )
+
+
+def _partition_descending(items: List, lo: int, hi: int, pivot) -> tuple:
+    """
+    Rearranges items[lo:hi] into the elements greater than, equal to and less than the pivot, in that order.
+
+    Parameters:
+    -----------
+    items : List
+        The list being sorted.
+    lo : int
+        The first index of the range.
+    hi : int
+        The index after the last one of the range.
+    pivot
+        The element to partition around.
+
+    Returns:
+    --------
+    tuple
+        The end of the greater elements and the start of the less elements; everything in between
+        equals the pivot and is already in its final place.
+    """
+    greater_end, current, less_start = lo, lo, hi
+
+    while current < less_start:
+        value = items[current]
+        if pivot < value:
+            items[current] = items[greater_end]
+            items[greater_end] = value
+            greater_end += 1
+            current += 1
+        elif value < pivot:
+            less_start -= 1
+            items[current] = items[less_start]
+            items[less_start] = value
+        else:
+            current += 1
+
+    return greater_end, less_start
+
+
+def _insertion_sort_descending(items: List, lo: int, hi: int):
+    """
+    Sorts the range items[lo:hi] in descending order with insertion sort.
+
+    Parameters:
+    -----------
+    items : List
+        The list being sorted.
+    lo : int
+        The first index of the range.
+    hi : int
+        The index after the last one of the range.
+    """
+    for index in range(lo + 1, hi):
+        value = items[index]
+        position = index
+        while position > lo and items[position - 1] < value:
+            items[position] = items[position - 1]
+            position -= 1
+        items[position] = value
+
+
+def _sift_down(items: List, lo: int, root: int, size: int):
+    """
+    Restores the min-heap order of the heap stored in items[lo:lo + size] below the given root.
+
+    Parameters:
+    -----------
+    items : List
+        The list holding the heap.
+    lo : int
+        The index of the heap's first element.
+    root : int
+        The heap position (relative to lo) of the element to sift down.
+    size : int
+        The number of elements in the heap.
+    """
+    value = items[lo + root]
+    child = 2 * root + 1
+
+    while child < size:
+        if child + 1 < size and items[lo + child + 1] < items[lo + child]:
+            child += 1
+        if not items[lo + child] < value:
+            break
+        items[lo + root] = items[lo + child]
+        root = child
+        child = 2 * root + 1
+
+    items[lo + root] = value
+
+
+def _heapsort_descending(items: List, lo: int, hi: int):
+    """
+    Sorts the range items[lo:hi] in descending order with heapsort, in O(n log n) whatever the input.
+
+    A min-heap is built over the range, then its smallest element is repeatedly swapped to the end.
+
+    Parameters:
+    -----------
+    items : List
+        The list being sorted.
+    lo : int
+        The first index of the range.
+    hi : int
+        The index after the last one of the range.
+    """
+    size = hi - lo
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(items, lo, root, size)
+
+    for end in range(size - 1, 0, -1):
+        items[lo], items[lo + end] = items[lo + end], items[lo]
+        _sift_down(items, lo, 0, end)
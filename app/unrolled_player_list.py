@@ -0,0 +1,499 @@
+from __future__ import annotations
+from typing import Dict, List, Optional
+from player import Player
+
+
+class PlayerChunk:
+    """
+    A node of an UnrolledPlayerList holding up to a fixed number of players in an array.
+
+    Attributes:
+    -----------
+    players : List[Player]
+        The players of the chunk, in list order.
+    next_chunk : Optional[PlayerChunk]
+        The next chunk in the list, or None if this is the last chunk.
+    prev_chunk : Optional[PlayerChunk]
+        The previous chunk in the list, or None if this is the first chunk.
+    """
+    __slots__ = ("players", "next_chunk", "prev_chunk")
+
+    players: List[Player]
+    next_chunk: PlayerChunk | None
+    prev_chunk: PlayerChunk | None
+
+    def __init__(self):
+        """
+        Initializes an empty, unlinked chunk.
+        """
+        self.players = []
+        self.next_chunk = None
+        self.prev_chunk = None
+
+
+class UnrolledPlayerList:
+    """
+    An unrolled linked list of players: a doubly linked list of fixed-capacity array chunks.
+
+    It offers the same push/pop front/back, pop_by_uid, iterate(forward) and __len__ API as
+    PlayerList, except that it takes and returns Player objects rather than PlayerNodes, since
+    there are no per-player nodes. Sequential scans walk arrays instead of chasing one node per
+    player, and each player costs an array slot instead of a whole PlayerNode, while operations
+    on both ends stay O(1).
+
+    Attributes:
+    -----------
+    _head : Optional[PlayerChunk]
+        The first chunk of the list, or None if the list is empty.
+    _tail : Optional[PlayerChunk]
+        The last chunk of the list, or None if the list is empty.
+    _length : int
+        Keeps track of the number of players in the list.
+    _chunk_size : int
+        The maximum number of players per chunk.
+    _uid_index : Optional[Dict[str, PlayerChunk]]
+        Maps the uid of every player to the chunk holding it, or None if the index is disabled.
+        It makes duplicate checks O(1) and pop_by_uid O(chunk size).
+    """
+
+    CHUNK_SIZE: int = 64
+
+    _head: PlayerChunk | None
+    _tail: PlayerChunk | None
+    _length: int
+    _chunk_size: int
+    _uid_index: Dict[str, PlayerChunk] | None
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE, index_uids: bool = True):
+        """
+        Initializes an empty list.
+
+        Parameters:
+        -----------
+        chunk_size : int
+            The maximum number of players per chunk.
+        index_uids : bool
+            If True, keeps a uid -> chunk index in sync with the list. Disable it for
+            memory-constrained use at the cost of O(n) duplicate checks and pop_by_uid.
+
+        Raises:
+        -------
+        ValueError:
+            If the chunk size is less than 2.
+        """
+        if chunk_size < 2:
+            raise ValueError("Chunk size must be at least 2")
+
+        self._head = None
+        self._tail = None
+        self._length = 0
+        self._chunk_size = chunk_size
+        self._uid_index = {} if index_uids else None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of players currently in the list.
+
+        Returns:
+            int: The number of players in the list.
+        """
+        return self._length
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Returns whether the list is empty.
+
+        Returns:
+        --------
+        bool
+            True if the list is empty, False otherwise.
+        """
+        return self._length == 0
+
+    @property
+    def head(self) -> Player | None:
+        """
+        Returns the first player of the list.
+
+        Returns:
+        --------
+        Optional[Player]
+            The first player, or None if the list is empty.
+        """
+        return self._head.players[0] if self._head is not None else None
+
+    @property
+    def tail(self) -> Player | None:
+        """
+        Returns the last player of the list.
+
+        Returns:
+        --------
+        Optional[Player]
+            The last player, or None if the list is empty.
+        """
+        return self._tail.players[-1] if self._tail is not None else None
+
+    def can_add_player(self, player: Player) -> bool:
+        """
+        Checks if a player can be added to the list by ensuring its uid is not in the list yet.
+
+        Parameters:
+        -----------
+        player : Player
+            The player to check for duplication.
+
+        Returns:
+        --------
+        bool
+            True if the player can be added (i.e., it is not a duplicate), False otherwise.
+        """
+        if self._uid_index is not None:
+            return player.uid not in self._uid_index
+        return self._find(player.uid) is None
+
+    def _find(self, uid: str) -> tuple | None:
+        """
+        Finds the chunk and the position within it of the player with the given uid.
+
+        Parameters:
+        -----------
+        uid : str
+            The unique ID to look for.
+
+        Returns:
+        --------
+        Optional[tuple]
+            The chunk and the index of the player in it, or None if the uid is not in the list.
+        """
+        if self._uid_index is not None:
+            chunk = self._uid_index.get(uid)
+            chunks = (chunk,) if chunk is not None else ()
+        else:
+            chunks = self._chunks()
+
+        for chunk in chunks:
+            for position, player in enumerate(chunk.players):
+                if player.uid == uid:
+                    return chunk, position
+        return None
+
+    def _chunks(self):
+        """
+        Iterates over the chunks of the list, from head to tail.
+
+        Yields:
+        -------
+        PlayerChunk
+            The chunks of the list.
+        """
+        chunk = self._head
+        while chunk is not None:
+            yield chunk
+            chunk = chunk.next_chunk
+
+    def _link_chunk(self, chunk: PlayerChunk, front: bool):
+        """
+        Adds an empty chunk at the front or the end of the list.
+
+        Parameters:
+        -----------
+        chunk : PlayerChunk
+            The chunk to add.
+        front : bool
+            If True, adds the chunk before the head, otherwise after the tail.
+        """
+        if self._head is None:
+            self._head = self._tail = chunk
+        elif front:
+            chunk.next_chunk = self._head
+            self._head.prev_chunk = chunk
+            self._head = chunk
+        else:
+            chunk.prev_chunk = self._tail
+            self._tail.next_chunk = chunk
+            self._tail = chunk
+
+    def _unlink_chunk(self, chunk: PlayerChunk):
+        """
+        Removes a chunk from the list.
+
+        Parameters:
+        -----------
+        chunk : PlayerChunk
+            The chunk to remove.
+        """
+        if chunk.prev_chunk is None:
+            self._head = chunk.next_chunk
+        else:
+            chunk.prev_chunk.next_chunk = chunk.next_chunk
+
+        if chunk.next_chunk is None:
+            self._tail = chunk.prev_chunk
+        else:
+            chunk.next_chunk.prev_chunk = chunk.prev_chunk
+
+        chunk.next_chunk = chunk.prev_chunk = None
+
+    def push_front(self, player: Player):
+        """
+        Adds a player to the front of the list.
+
+        Parameters:
+        -----------
+        player : Player
+            The player to add to the front of the list.
+
+        Raises:
+        -------
+        ValueError:
+            If a player with the same uid already exists in the list.
+        """
+        if not self.can_add_player(player):
+            raise ValueError(f"Player already exists in the list with uid{player.uid}")
+
+        if self._head is None or len(self._head.players) >= self._chunk_size:
+            self._link_chunk(PlayerChunk(), front=True)
+
+        # inserting at the start of a chunk moves at most chunk_size references
+        self._head.players.insert(0, player)
+        if self._uid_index is not None:
+            self._uid_index[player.uid] = self._head
+        self._length += 1
+
+    def push_back(self, player: Player):
+        """
+        Adds a player to the end of the list.
+
+        Parameters:
+        -----------
+        player : Player
+            The player to add to the end of the list.
+
+        Raises:
+        -------
+        ValueError:
+            If a player with the same uid already exists in the list.
+        """
+        if not self.can_add_player(player):
+            raise ValueError(f"Player already exists in the list with uid{player.uid}")
+
+        if self._tail is None or len(self._tail.players) >= self._chunk_size:
+            self._link_chunk(PlayerChunk(), front=False)
+
+        self._tail.players.append(player)
+        if self._uid_index is not None:
+            self._uid_index[player.uid] = self._tail
+        self._length += 1
+
+    def extend(self, players):
+        """
+        Appends many players to the end of the list, filling whole chunks at a time.
+
+        Duplicates are checked for the whole batch before anything is added, with a single pass
+        over the list when it has no uid index, instead of one full scan per pushed player.
+
+        Parameters:
+        -----------
+        players : Iterable[Player]
+            The players to append, in order.
+
+        Raises:
+        -------
+        ValueError:
+            If a uid is already in the list or repeats within the batch. The list is left unchanged.
+        """
+        existing_uids = self._uid_index if self._uid_index is not None else \
+            {player.uid for player in self.iterate()}
+        batch_uids = set()
+        batch = []
+        for player in players:
+            if player.uid in existing_uids or player.uid in batch_uids:
+                raise ValueError(f"Player already exists in the list with uid{player.uid}")
+            batch_uids.add(player.uid)
+            batch.append(player)
+
+        start = 0
+        while start < len(batch):
+            if self._tail is None or len(self._tail.players) >= self._chunk_size:
+                self._link_chunk(PlayerChunk(), front=False)
+            chunk = self._tail
+            end = start + self._chunk_size - len(chunk.players)
+            chunk.players.extend(batch[start:end])
+            if self._uid_index is not None:
+                for player in batch[start:end]:
+                    self._uid_index[player.uid] = chunk
+            start = end
+
+        self._length += len(batch)
+
+    def _remove(self, chunk: PlayerChunk, position: int) -> Player:
+        """
+        Removes the player at the given position of a chunk, dropping or merging the chunk if
+        it becomes empty or less than half full.
+
+        Parameters:
+        -----------
+        chunk : PlayerChunk
+            The chunk holding the player.
+        position : int
+            The index of the player within the chunk.
+
+        Returns:
+        --------
+        Player
+            The removed player.
+        """
+        player = chunk.players.pop(position)
+        if self._uid_index is not None:
+            del self._uid_index[player.uid]
+        self._length -= 1
+
+        if not chunk.players:
+            self._unlink_chunk(chunk)
+        elif len(chunk.players) < self._chunk_size // 2:
+            # keep chunks at least half full after removals from the middle of the list
+            neighbour = chunk.next_chunk
+            if neighbour is not None and len(chunk.players) + len(neighbour.players) <= self._chunk_size:
+                chunk.players.extend(neighbour.players)
+                if self._uid_index is not None:
+                    for moved_player in neighbour.players:
+                        self._uid_index[moved_player.uid] = chunk
+                self._unlink_chunk(neighbour)
+
+        return player
+
+    def pop_from_front(self) -> Player:
+        """
+        Removes and returns the player at the front of the list.
+
+        Returns:
+        --------
+        Player
+            The player that was removed from the front of the list.
+
+        Raises:
+        -------
+        IndexError:
+            If the list is empty.
+        """
+        if self._head is None:
+            raise IndexError("List is empty")
+
+        return self._remove(self._head, 0)
+
+    def pop_from_back(self) -> Player:
+        """
+        Removes and returns the player at the end of the list.
+
+        Returns:
+        --------
+        Player
+            The player that was removed from the end of the list.
+
+        Raises:
+        -------
+        IndexError:
+            If the list is empty.
+        """
+        if self._tail is None:
+            raise IndexError("List is empty")
+
+        return self._remove(self._tail, len(self._tail.players) - 1)
+
+    def pop_by_uid(self, key: str) -> Player:
+        """
+        Removes and returns the player with the specified unique ID (key).
+
+        Parameters:
+        -----------
+        key : str
+            The unique ID of the player to remove.
+
+        Returns:
+        --------
+        Player
+            The player that was removed.
+
+        Raises:
+        -------
+        IndexError:
+            If the list is empty.
+        ValueError:
+            If no player with the given ID is found.
+        """
+        if self._head is None:
+            raise IndexError("List is empty")
+
+        found = self._find(key)
+        if found is None:
+            raise ValueError("Value not found")
+
+        return self._remove(*found)
+
+    def find_player_by_key(self, uid: str) -> Optional[Player]:
+        """
+        Finds the player with the given unique ID.
+
+        Parameters:
+        -----------
+        uid : str
+            The unique ID to look for.
+
+        Returns:
+        --------
+        Optional[Player]
+            The player with the given ID, or None if it is not in the list.
+        """
+        found = self._find(uid)
+        if found is None:
+            return None
+
+        chunk, position = found
+        return chunk.players[position]
+
+    def iterate(self, forward: bool = True):
+        """
+        Iterates over the players in the list.
+
+        Parameters:
+        -----------
+        forward : bool
+            If True, iterates from head to tail; otherwise, from tail to head.
+
+        Yields:
+        -------
+        Player
+            The players in the list, one at a time.
+        """
+        if forward:
+            chunk = self._head
+            while chunk is not None:
+                yield from chunk.players
+                chunk = chunk.next_chunk
+        else:
+            chunk = self._tail
+            while chunk is not None:
+                yield from reversed(chunk.players)
+                chunk = chunk.prev_chunk
+
+    def display(self, forward: bool = True):
+        """
+        Prints the players in the list.
+
+        Parameters:
+        -----------
+        forward : bool
+            If True, prints from head to tail; otherwise, from tail to head.
+
+        Raises:
+        -------
+        ValueError:
+            If the list is empty.
+        """
+        if self.is_empty:
+            raise ValueError("List is empty!")
+
+        for player in self.iterate(forward):
+            print(player)
@@ -0,0 +1,48 @@
+"""
+Compares loading players one at a time through __setitem__ with the PlayerHashMap bulk-load API.
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/bulk_load_benchmark.py [--sizes 100000 1000000]
+"""
+import argparse
+import time
+
+from player import Player
+from data_stuctures.player_hash_map import PlayerHashMap
+
+
+def load_one_by_one(pairs: list) -> PlayerHashMap:
+    hash_map = PlayerHashMap()
+    for uid, name in pairs:
+        hash_map[uid] = name
+    return hash_map
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 300_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'players':>10}{'__setitem__ s':>16}{'from_iterable s':>18}{'Players s':>12}")
+    for size in args.sizes:
+        pairs = [(f"P{i:07d}", f"name{i}") for i in range(size)]
+        players = [Player(uid, name) for uid, name in pairs]
+
+        start = time.perf_counter()
+        load_one_by_one(pairs)
+        one_by_one = time.perf_counter() - start
+
+        start = time.perf_counter()
+        PlayerHashMap.from_iterable(pairs)
+        from_pairs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        PlayerHashMap.from_iterable(players)
+        from_players = time.perf_counter() - start
+
+        print(f"{size:>10}{one_by_one:>16.2f}{from_pairs:>18.2f}{from_players:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Multi-threaded throughput of ConcurrentPlayerHashMap versus a PlayerHashMap behind one global lock.
+
+Every thread runs a mix of lookups (90%) and inserts/updates (10%) over a shared key space.
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/concurrent_hash_map_benchmark.py [--operations N] [--threads 1 2 4 8]
+
+On a GIL build of CPython the threads still take turns executing bytecode, so this mostly
+measures lock contention; on a free-threaded build the striped map can scale with the cores.
+"""
+import argparse
+import random
+import sys
+import time
+from threading import Lock, Thread
+
+from data_stuctures.concurrent_player_hash_map import ConcurrentPlayerHashMap
+from data_stuctures.player_hash_map import PlayerHashMap
+
+
+class SingleLockPlayerHashMap:
+    """The baseline: a PlayerHashMap wrapped in a single lock that serializes every operation."""
+
+    def __init__(self):
+        self._hash_map = PlayerHashMap()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._hash_map.get(key)
+
+    def __setitem__(self, key, name):
+        with self._lock:
+            self._hash_map[key] = name
+
+
+def run(hash_map, threads: int, operations: int, keys: list) -> float:
+    def worker(seed: int):
+        rng = random.Random(seed)
+        for _ in range(operations // threads):
+            key = keys[rng.randrange(len(keys))]
+            if rng.random() < 0.9:
+                hash_map.get(key)
+            else:
+                hash_map[key] = "name"
+
+    workers = [Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return operations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operations", type=int, default=400_000)
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    keys = [f"P{i:07d}" for i in range(args.keys)]
+    print(f"{args.operations} operations over {args.keys} keys (GIL {'enabled' if gil else 'disabled'})")
+    print(f"{'threads':>8}{'single lock ops/s':>20}{'striped ops/s':>16}{'speedup':>10}")
+
+    for threads in args.threads:
+        single_lock = SingleLockPlayerHashMap()
+        striped = ConcurrentPlayerHashMap()
+        for hash_map in (single_lock, striped):
+            for key in keys:
+                hash_map[key] = "name"
+
+        single_lock_rate = run(single_lock, threads, args.operations, keys)
+        striped_rate = run(striped, threads, args.operations, keys)
+        print(f"{threads:>8}{single_lock_rate:>20.0f}{striped_rate:>16.0f}{striped_rate / single_lock_rate:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
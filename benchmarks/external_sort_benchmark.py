@@ -0,0 +1,66 @@
+"""
+Sorts a synthetic stream of players by descending score with the external merge sort, checking the
+order of the output and reporting the time, the size of the spilled runs and the peak resident memory.
+
+The players are generated on the fly and never held in a list, so the dataset can be far larger than
+memory: at the in-memory size of a Player (about 200 bytes), --players 20000000 is a 4 GB dataset,
+which spills about 0.75 GB of runs.
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/external_sort_benchmark.py [--players N] [--budget-mb N] [--fan-in N]
+"""
+import argparse
+import os
+import random
+import resource
+import time
+
+import player_external_sort
+from player import Player
+from player_external_sort import external_sort_descending
+
+
+def synthetic_players(count: int):
+    generator = random.Random(0)
+    for index in range(count):
+        yield Player(f"P{index:09d}", f"player{index}", generator.randrange(1, 1_000_000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=2_000_000)
+    parser.add_argument("--budget-mb", type=int, default=64)
+    parser.add_argument("--fan-in", type=int, default=player_external_sort.MAX_FAN_IN)
+    args = parser.parse_args()
+
+    spilled = []
+    write_run = player_external_sort._write_run
+
+    def measuring_write_run(players, directory):
+        path = write_run(players, directory)
+        spilled.append(os.path.getsize(path))
+        return path
+
+    player_external_sort._write_run = measuring_write_run
+
+    start = time.perf_counter()
+    previous_score = float("inf")
+    count = 0
+    for player in external_sort_descending(synthetic_players(args.players), memory_budget=args.budget_mb << 20,
+                                           max_fan_in=args.fan_in):
+        assert player.score <= previous_score
+        previous_score = player.score
+        count += 1
+    seconds = time.perf_counter() - start
+
+    assert count == args.players
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{args.players} players, {args.budget_mb} MB budget, fan-in {args.fan_in}")
+    print(f"sorted in {seconds:.1f} s ({args.players / seconds:,.0f} players/s)")
+    print(f"{len(spilled)} run files written, {sum(spilled) / 2 ** 20:.0f} MB spilled in total")
+    print(f"peak resident memory {peak_mb:.0f} MB")
+
+
+if __name__ == '__main__':
+    main()
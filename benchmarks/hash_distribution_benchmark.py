@@ -0,0 +1,77 @@
+"""
+Compares how evenly each PlayerHashMap hash strategy spreads typical player uids over the buckets.
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/hash_distribution_benchmark.py [--keys N] [--buckets B]
+"""
+import argparse
+import random
+import string
+import timeit
+from statistics import pstdev
+
+from data_stuctures.hash_strategies import SumOfAsciiHash, PolynomialHash, FNV1aHash, SeededHash
+
+
+def sequential_uids(count: int) -> list:
+    return [f"P{i:06d}" for i in range(count)]
+
+
+def random_uids(count: int) -> list:
+    alphabet = string.ascii_letters + string.digits
+    return ["".join(random.choices(alphabet, k=10)) for _ in range(count)]
+
+
+def anagram_uids(count: int) -> list:
+    base = list("abcdefghij")
+    uids = set()
+    while len(uids) < count:
+        random.shuffle(base)
+        uids.add("".join(base))
+    return list(uids)
+
+
+def bucket_skew(strategy, uids: list, buckets: int) -> dict:
+    counts = [0] * buckets
+    for uid in uids:
+        counts[strategy(uid) % buckets] += 1
+    mean = len(uids) / buckets
+    return {
+        "max_chain": max(counts),
+        "empty_pct": 100 * counts.count(0) / buckets,
+        "cv": pstdev(counts) / mean,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--buckets", type=int, default=131_072)
+    args = parser.parse_args()
+
+    random.seed(42)
+    strategies = [SumOfAsciiHash(), PolynomialHash(), FNV1aHash(), SeededHash()]
+    key_sets = {
+        "sequential": sequential_uids(args.keys),
+        "random": random_uids(args.keys),
+        "anagrams": anagram_uids(args.keys),
+    }
+
+    print(f"{args.keys} keys over {args.buckets} buckets (ideal mean chain {args.keys / args.buckets:.2f})")
+    print(f"{'keys':<12}{'strategy':<18}{'max chain':>10}{'empty %':>10}{'cv':>8}")
+    for name, uids in key_sets.items():
+        for strategy in strategies:
+            skew = bucket_skew(strategy, uids, args.buckets)
+            print(f"{name:<12}{type(strategy).__name__:<18}{skew['max_chain']:>10}"
+                  f"{skew['empty_pct']:>10.1f}{skew['cv']:>8.2f}")
+
+    print(f"\n{'strategy':<18}{'ns/hash':>10}")
+    sample = key_sets["random"][:10_000]
+    for strategy in strategies:
+        seconds = timeit.timeit(lambda: [strategy(uid) for uid in sample], number=5)
+        print(f"{type(strategy).__name__:<18}{seconds / (5 * len(sample)) * 1e9:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Compares memory use and lookup/insert time of the chaining and open-addressing hash map backends.
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/hash_map_backends_benchmark.py [--players N]
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from data_stuctures.player_hash_map import PlayerHashMap
+from data_stuctures.probing_player_hash_map import ProbingPlayerHashMap
+
+
+def measure(backend, uids: list) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    hash_map = backend()
+    for uid in uids:
+        hash_map[uid] = "name"
+    insert_seconds = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    lookups = random.sample(uids, min(len(uids), 100_000))
+    start = time.perf_counter()
+    for uid in lookups:
+        hash_map[uid]
+    lookup_seconds = time.perf_counter() - start
+
+    return {
+        "bytes_per_player": memory / len(uids),
+        "insert_us": insert_seconds / len(uids) * 1e6,
+        "lookup_us": lookup_seconds / len(lookups) * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=200_000)
+    args = parser.parse_args()
+
+    random.seed(42)
+    uids = [f"P{i:07d}" for i in range(args.players)]
+
+    print(f"{args.players} players")
+    print(f"{'backend':<24}{'bytes/player':>14}{'insert us':>12}{'lookup us':>12}")
+    for backend in (PlayerHashMap, ProbingPlayerHashMap):
+        result = measure(backend, uids)
+        print(f"{backend.__name__:<24}{result['bytes_per_player']:>14.0f}"
+              f"{result['insert_us']:>12.2f}{result['lookup_us']:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Times the linear-time integer sorts (counting sort, LSD radix sort and integer_sort_descending,
+which picks one of them by score range) against the comparison-only introsort, a
+comparison sort keyed on the score and sort_players(), on Players with score ranges from a few values
+shared by many players to far more values than players.
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/integer_sort_benchmark.py [--players N]
+"""
+import argparse
+import random
+import time
+from operator import attrgetter
+
+from player import Player
+from player_sort import (counting_sort_descending, integer_sort_descending, introsort_descending, radix_sort_descending,
+                         sort_players)
+
+
+def introsort(players):
+    # what Player.quicksort_descending does for input that does not qualify for the integer sorts
+    players = list(players)
+    introsort_descending(players)
+    return players
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    sorts = {
+        "introsort": introsort,
+        "sorted(key=score)": lambda players: sorted(players, key=attrgetter("score"), reverse=True),
+        "counting sort": counting_sort_descending,
+        "radix sort": radix_sort_descending,
+        "integer_sort_descending": integer_sort_descending,
+        "sort_players": lambda players: sort_players(players, reverse=True),
+    }
+
+    random.seed(0)
+    print(f"{args.players} players, seconds")
+    print(f"{'score range':<14}" + "".join(f"{name:>25}" for name in sorts))
+    for score_range in (10, 1_000, args.players // 64, args.players // 8, args.players, 1_000_000_000):
+        players = [Player(f"P{i:07d}", "name", random.randrange(score_range)) for i in range(args.players)]
+        expected = [player.score for player in sorted(players, key=attrgetter("score"), reverse=True)]
+        timings = []
+        for name, sort in sorts.items():
+            if name == "counting sort" and score_range > 10 * args.players:
+                timings.append("-")
+                continue
+            start = time.perf_counter()
+            result = sort(players)
+            timings.append(f"{time.perf_counter() - start:.2f}")
+            assert [player.score for player in result] == expected, name
+        print(f"{score_range:<14}" + "".join(f"{timing:>25}" for timing in timings))
+
+
+if __name__ == '__main__':
+    main()
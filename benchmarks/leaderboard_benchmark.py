@@ -0,0 +1,58 @@
+"""
+Times answering "what rank is player X" and "who is at rank R" after every score change, with the
+incrementally maintained PlayerLeaderboard against re-sorting all players with sort_players().
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/leaderboard_benchmark.py [--players N] [--updates N]
+"""
+import argparse
+import random
+import time
+
+from player import Player
+from player_leaderboard import PlayerLeaderboard
+from player_sort import sort_players
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--updates", type=int, default=20)
+    args = parser.parse_args()
+
+    random.seed(0)
+    players = [Player(f"P{i:07d}", "name", random.randrange(1, 1_000_000)) for i in range(args.players)]
+    updates = [(random.randrange(args.players), random.randrange(1, 1_000_000), random.randrange(1, args.players + 1))
+               for _ in range(args.updates)]
+
+    initial_scores = [player.score for player in players]
+    start = time.perf_counter()
+    leaderboard = PlayerLeaderboard(players)
+    build_seconds = time.perf_counter() - start
+
+    def with_leaderboard(index, score, rank):
+        players[index].score = score
+        return leaderboard.rank_of(players[index]), leaderboard.player_at(rank).uid
+
+    def with_sort(index, score, rank):
+        players[index].score = score
+        ordered = sort_players(players, key=lambda player: (-player.score, player.uid))
+        return [player.uid for player in ordered].index(players[index].uid) + 1, ordered[rank - 1].uid
+
+    print(f"{args.players} players, {args.updates} score changes, each followed by rank_of and player_at")
+    print(f"leaderboard built in {build_seconds:.2f} s")
+    print(f"{'method':<20}{'us per update':>16}")
+    results = {}
+    for name, update in (("PlayerLeaderboard", with_leaderboard), ("sort_players", with_sort)):
+        for player, score in zip(players, initial_scores):
+            player.score = score
+        start = time.perf_counter()
+        results[name] = [update(*change) for change in updates]
+        microseconds = (time.perf_counter() - start) / args.updates * 1e6
+        print(f"{name:<20}{microseconds:>16,.0f}")
+    assert results["PlayerLeaderboard"] == results["sort_players"]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Simulates matchmaking lobby churn (push_back / pop_from_front cycles) on a PlayerList with and
+without a PlayerNodePool, reporting time, garbage collections and total GC pause time.
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/node_pool_benchmark.py [--lobby N] [--cycles N]
+"""
+import argparse
+import gc
+import time
+
+from player import Player
+from player_list import PlayerList
+from player_node_pool import PlayerNodePool
+
+
+class GcMonitor:
+    """Counts garbage collections and sums their duration through gc.callbacks."""
+
+    def __init__(self):
+        self.collections = 0
+        self.pause_seconds = 0.0
+        self._started = 0.0
+
+    def __call__(self, phase: str, info: dict):
+        if phase == "start":
+            self._started = time.perf_counter()
+        else:
+            self.collections += 1
+            self.pause_seconds += time.perf_counter() - self._started
+
+    def __enter__(self):
+        gc.collect()
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        gc.callbacks.remove(self)
+
+
+def churn(player_list: PlayerList, players: list, lobby: int, cycles: int):
+    for player in players[:lobby]:
+        player_list.push_player_back(player)
+    waiting = players[lobby:]
+    for cycle in range(cycles):
+        # a player leaves the front of the lobby and a waiting one joins at the back
+        waiting.append(player_list.pop_player_from_front())
+        player_list.push_player_back(waiting[cycle])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lobby", type=int, default=10_000)
+    parser.add_argument("--cycles", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    players = [Player(f"P{i:07d}", "name") for i in range(2 * args.lobby)]
+
+    print(f"lobby of {args.lobby}, {args.cycles} churn cycles")
+    print(f"{'mode':<8}{'seconds':>9}{'gc runs':>9}{'gc pause ms':>13}{'pool hits':>11}{'misses':>8}")
+    for mode in ("no pool", "pool"):
+        pool = PlayerNodePool(max_size=args.lobby) if mode == "pool" else None
+        player_list = PlayerList(node_pool=pool)
+        with GcMonitor() as monitor:
+            start = time.perf_counter()
+            churn(player_list, list(players), args.lobby, args.cycles)
+            seconds = time.perf_counter() - start
+        hits, misses = (pool.hits, pool.misses) if pool is not None else (0, args.lobby + args.cycles)
+        print(f"{mode:<8}{seconds:>9.2f}{monitor.collections:>9}{monitor.pause_seconds * 1e3:>13.1f}"
+              f"{hits:>11}{misses:>8}")
+
+
+if __name__ == '__main__':
+    main()
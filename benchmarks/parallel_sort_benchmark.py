@@ -0,0 +1,52 @@
+"""
+Measures how the multi-process sort scales with the number of workers on a large array of scores,
+compared with Player.quicksort_descending and sorted() in a single process.
+
+The speedup is bounded by the number of CPU cores: on a machine with fewer cores than workers the
+extra processes only add overhead.
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/parallel_sort_benchmark.py [--scores N] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import random
+import time
+
+from player import Player
+from player_parallel_sort import parallel_sort_descending
+
+
+def timed(sort, scores: list) -> float:
+    start = time.perf_counter()
+    result = sort(scores)
+    seconds = time.perf_counter() - start
+    assert result == sorted(scores, reverse=True)
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scores", type=int, default=5_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    random.seed(0)
+    scores = [random.randrange(1, 1_000_000) for _ in range(args.scores)]
+
+    print(f"{args.scores} scores, {os.cpu_count()} CPUs")
+    print(f"{'sort':<30}{'seconds':>9}{'speedup':>9}")
+    baseline = timed(lambda values: sorted(values, reverse=True), scores)
+    print(f"{'sorted()':<30}{baseline:>9.2f}")
+    print(f"{'Player.quicksort_descending':<30}{timed(Player.quicksort_descending, scores):>9.2f}")
+
+    single = None
+    for workers in args.workers:
+        seconds = timed(lambda values: parallel_sort_descending(values, workers), scores)
+        single = single or seconds
+        print(f"{f'parallel, {workers} workers':<30}{seconds:>9.2f}{single / seconds:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Compares PlayerList.extend/concat with the equivalent push_back and pop/push loops.
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/player_list_bulk_benchmark.py [--players N] [--unindexed-players N]
+
+Without the uid index every push_back scans the whole list, so that configuration uses a
+smaller list to keep the loop baseline finishing in reasonable time.
+"""
+import argparse
+import time
+
+from player import Player
+from player_node import PlayerNode
+from player_list import PlayerList
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def roster(prefix: str, size: int, index_uids: bool) -> PlayerList:
+    player_list = PlayerList(index_uids=index_uids)
+    player_list.extend(Player(f"{prefix}{i}", "name") for i in range(size))
+    return player_list
+
+
+def push_loop(player_list: PlayerList, nodes: list):
+    for node in nodes:
+        player_list.push_back(node)
+
+
+def pop_push_loop(player_list: PlayerList, other: PlayerList):
+    while not other.is_empty:
+        player_list.push_back(other.pop_from_front())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=200_000)
+    parser.add_argument("--unindexed-players", type=int, default=3_000)
+    args = parser.parse_args()
+
+    print(f"{'index':<8}{'players':>9}{'push loop s':>13}{'extend s':>10}{'pop/push s':>12}{'concat s':>10}")
+    for index_uids, size in ((True, args.players), (False, args.unindexed_players)):
+        # append `size` new players to a roster already holding `size` players
+        target = roster("a", size, index_uids)
+        nodes = [PlayerNode(Player(f"b{i}", "name")) for i in range(size)]
+        push_seconds = timed(lambda: push_loop(target, nodes))
+
+        target = roster("a", size, index_uids)
+        nodes = [PlayerNode(Player(f"b{i}", "name")) for i in range(size)]
+        extend_seconds = timed(lambda: target.extend(nodes))
+
+        target, other = roster("a", size, index_uids), roster("b", size, index_uids)
+        pop_push_seconds = timed(lambda: pop_push_loop(target, other))
+
+        target, other = roster("a", size, index_uids), roster("b", size, index_uids)
+        concat_seconds = timed(lambda: target.concat(other))
+
+        print(f"{'on' if index_uids else 'off':<8}{size:>9}{push_seconds:>13.3f}{extend_seconds:>10.3f}"
+              f"{pop_push_seconds:>12.3f}{concat_seconds:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Measures bytes per player (Player + PlayerNode) and the cost of hash(player) for the current slotted
+classes against the previous __dict__ based layout that recomputed the hash on every call.
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/player_memory_benchmark.py [--players N]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from player import Player
+from player_node import PlayerNode
+
+
+class DictPlayer:
+    """The previous Player layout: attributes in a __dict__ and the hash recomputed on every call."""
+
+    def __init__(self, player_id: str, player_name: str, score: int = 0):
+        self._player_id = player_id
+        self._player_name = player_name
+        self._player_score = score
+
+    def __hash__(self) -> int:
+        return sum(ord(char) for char in self._player_id)
+
+
+class DictPlayerNode:
+    """The previous PlayerNode layout, with its attributes in a __dict__."""
+
+    def __init__(self, player):
+        self._player = player
+        self._player_next_node = None
+        self._player_prev_node = None
+
+
+def bytes_per_player(player_class, node_class, uids: list) -> float:
+    gc.collect()
+    tracemalloc.start()
+    nodes = [node_class(player_class(uid, "name")) for uid in uids]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del nodes
+    # the list holding the nodes is not part of a player's footprint
+    return (memory - 8 * len(uids)) / len(uids)
+
+
+def hash_call_ns(players: list) -> float:
+    start = time.perf_counter()
+    for player in players:
+        hash(player)
+    return (time.perf_counter() - start) / len(players) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    uids = [f"P{i:07d}" for i in range(args.players)]
+
+    print(f"{args.players} players")
+    print(f"{'layout':<10}{'bytes/player':>14}{'hash ns':>10}")
+    for layout, player_class, node_class in (("before", DictPlayer, DictPlayerNode), ("after", Player, PlayerNode)):
+        memory = bytes_per_player(player_class, node_class, uids)
+        players = [player_class(uid, "name") for uid in uids]
+        print(f"{layout:<10}{memory:>14.0f}{hash_call_ns(players):>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
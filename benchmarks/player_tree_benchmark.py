@@ -0,0 +1,75 @@
+"""
+Compares the AVL PlayerTree with a PlayerHashMap whose players are sorted by uid whenever ordered
+access is needed: building, point lookups, full in-order iteration, a uid prefix scan and floor
+queries.
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/player_tree_benchmark.py [--players N] [--queries N]
+"""
+import argparse
+import random
+import time
+from bisect import bisect_right
+from operator import attrgetter
+
+from player import Player
+from player_sort import sort_players
+from data_stuctures.player_hash_map import PlayerHashMap
+from data_stuctures.player_tree import PlayerTree
+
+_uid = attrgetter("uid")
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=1_000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    players = [Player(f"P{i:07d}", "name") for i in random.sample(range(10 * args.players), args.players)]
+    lookups = random.sample([player.uid for player in players], min(args.players, args.queries))
+    prefix = sorted(lookups)[0][:5]
+
+    tree, tree_build = timed(lambda: PlayerTree(players))
+    hash_map, map_build = timed(lambda: PlayerHashMap.from_iterable(players))
+
+    def floors_by_sorting():
+        uids = [player.uid for player in sort_players(hash_map, key=_uid)]
+        return [uids[bisect_right(uids, uid + "0") - 1] for uid in lookups]
+
+    rows = [
+        ("build", tree_build, map_build),
+        (f"{len(lookups)} lookups", timed(lambda: [tree[uid] for uid in lookups])[1],
+         timed(lambda: [hash_map[uid] for uid in lookups])[1]),
+    ]
+    tree_order, tree_seconds = timed(lambda: [player.uid for player in tree.values()])
+    map_order, map_seconds = timed(lambda: [player.uid for player in sort_players(hash_map, key=_uid)])
+    assert tree_order == map_order
+    rows.append(("in-order iteration", tree_seconds, map_seconds))
+
+    tree_prefix, tree_seconds = timed(lambda: [player.uid for player in tree.prefix(prefix)])
+    map_prefix, map_seconds = timed(lambda: sorted(uid for uid in hash_map if uid.startswith(prefix)))
+    assert tree_prefix == map_prefix
+    rows.append((f"prefix {prefix!r} ({len(tree_prefix)} players)", tree_seconds, map_seconds))
+
+    tree_floors, tree_seconds = timed(lambda: [tree.floor(uid + "0").uid for uid in lookups])
+    map_floors, map_seconds = timed(floors_by_sorting)
+    assert tree_floors == map_floors
+    rows.append((f"{len(lookups)} floor queries", tree_seconds, map_seconds))
+
+    print(f"{args.players} players, tree height {tree.height}, milliseconds")
+    print(f"{'operation':<34}{'PlayerTree':>14}{'PlayerHashMap':>16}")
+    for name, tree_seconds, map_seconds in rows:
+        print(f"{name:<34}{tree_seconds * 1e3:>14.1f}{map_seconds * 1e3:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
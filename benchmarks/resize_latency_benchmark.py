@@ -0,0 +1,47 @@
+"""
+Compares the worst single-insert latency of PlayerHashMap with full and incremental resizing.
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/resize_latency_benchmark.py [--players N] [--gc]
+
+The garbage collector is disabled by default, as its full collections over millions of nodes
+cause pauses of their own that would hide the cost of the resize itself.
+"""
+import argparse
+import gc
+import time
+
+from data_stuctures.player_hash_map import PlayerHashMap
+
+
+def insert_latencies(hash_map: PlayerHashMap, uids: list) -> list:
+    latencies = []
+    for uid in uids:
+        start = time.perf_counter()
+        hash_map[uid] = "name"
+        latencies.append(time.perf_counter() - start)
+    return sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--gc", action="store_true", help="keep the garbage collector enabled")
+    args = parser.parse_args()
+
+    if not args.gc:
+        gc.disable()
+
+    uids = [f"P{i:07d}" for i in range(args.players)]
+
+    print(f"{args.players} inserts")
+    print(f"{'mode':<14}{'total s':>10}{'p50 us':>10}{'p99 us':>10}{'max ms':>10}")
+    for mode, hash_map in (("full", PlayerHashMap()), ("incremental", PlayerHashMap(incremental_resize=True))):
+        latencies = insert_latencies(hash_map, uids)
+        print(f"{mode:<14}{sum(latencies):>10.2f}{latencies[len(latencies) // 2] * 1e6:>10.1f}"
+              f"{latencies[int(len(latencies) * 0.99)] * 1e6:>10.1f}{latencies[-1] * 1e3:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Times Player.quicksort_descending (now backed by the iterative introsort) against the previous
+recursive first-element-pivot quicksort and the built-in sorted(), on lists of Players whose scores
+are random, sorted, reversed or heavily duplicated.
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/sort_benchmark.py [--players N] [--repeat N]
+"""
+import argparse
+import random
+import time
+
+from player import Player
+
+
+def legacy_quicksort_descending(collection) -> list:
+    """The recursive quicksort Player.quicksort_descending used to be."""
+    collection = list(collection)
+    if len(collection) < 2:
+        return collection
+
+    pivot = collection[0]
+    gt_than_pivot = [v for v in collection[1:] if v > pivot]
+    le_than_pivot = [v for v in collection[1:] if v <= pivot]
+    return legacy_quicksort_descending(gt_than_pivot) + [pivot] + legacy_quicksort_descending(le_than_pivot)
+
+
+def make_scores(shape: str, size: int) -> list:
+    if shape == "random":
+        return [random.randrange(1, 10 * size) for _ in range(size)]
+    if shape == "sorted":
+        return list(range(1, size + 1))
+    if shape == "reversed":
+        return list(range(size, 0, -1))
+    # a leaderboard where most players share a handful of scores
+    return [random.randrange(1, 20) * 100 for _ in range(size)]
+
+
+def best_of(sort, players: list, repeat: int) -> str:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            sort(players)
+        except RecursionError:
+            return "RecursionError"
+        best = min(best, time.perf_counter() - start)
+    return f"{best * 1e3:.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sorts = {
+        "legacy quicksort": legacy_quicksort_descending,
+        "introsort": Player.quicksort_descending,
+        "sorted()": lambda players: sorted(players, reverse=True),
+    }
+
+    random.seed(0)
+    print(f"{args.players} players, best of {args.repeat}, milliseconds")
+    print(f"{'input':<12}" + "".join(f"{name:>20}" for name in sorts))
+    for shape in ("random", "sorted", "reversed", "duplicates"):
+        players = [Player(f"P{i:07d}", "name", score) for i, score in enumerate(make_scores(shape, args.players))]
+        print(f"{shape:<12}" + "".join(f"{best_of(sort, players, args.repeat):>20}" for sort in sorts.values()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Times selecting the top k players of a large population with the bounded heap (top_k, streaming a
+PlayerList.iterate() generator and a plain list), quickselect (select_top_k) and a full sort
+(Player.quicksort_descending, then slicing).
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/top_k_benchmark.py [--players N] [--k N]
+"""
+import argparse
+import random
+import time
+
+from player import Player
+from player_list import PlayerList
+from player_sort import select_top_k, top_k
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--k", type=int, default=100)
+    args = parser.parse_args()
+
+    random.seed(0)
+    players = [Player(f"P{i:07d}", "name", random.randrange(1, 100_000)) for i in range(args.players)]
+    player_list = PlayerList()
+    player_list.extend(players)
+
+    selections = {
+        "top_k(list)": lambda: top_k(players, args.k),
+        "top_k(PlayerList.iterate())": lambda: top_k(player_list.iterate(), args.k),
+        "select_top_k(list)": lambda: select_top_k(players, args.k),
+        "quicksort_descending[:k]": lambda: Player.quicksort_descending(players)[:args.k],
+    }
+
+    print(f"top {args.k} of {args.players} players")
+    print(f"{'method':<30}{'ms':>10}")
+    expected = None
+    for name, select in selections.items():
+        start = time.perf_counter()
+        result = select()
+        milliseconds = (time.perf_counter() - start) * 1e3
+        scores = [player.score for player in result]
+        expected = expected or scores
+        assert scores == expected, name
+        print(f"{name:<30}{milliseconds:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Compares PlayerList with UnrolledPlayerList: memory per player, full scan time and end operations.
+
+Run from the repository root with the app package on the path:
+
+    PYTHONPATH=app:. python benchmarks/unrolled_list_benchmark.py [--players N]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from player import Player
+from player_node import PlayerNode
+from player_list import PlayerList
+from unrolled_player_list import UnrolledPlayerList
+
+
+def build(kind: str, players: list, index_uids: bool):
+    player_list = PlayerList(index_uids=index_uids) if kind == "PlayerList" else \
+        UnrolledPlayerList(index_uids=index_uids)
+    player_list.extend(players)
+    return player_list
+
+
+def scan(kind: str, player_list) -> int:
+    total = 0
+    if kind == "PlayerList":
+        for node in player_list.iterate():
+            total += node.player.score
+    else:
+        for player in player_list.iterate():
+            total += player.score
+    return total
+
+
+def churn(kind: str, player_list, players: list):
+    for player in players:
+        player_list.pop_from_front()
+        player_list.push_back(PlayerNode(player) if kind == "PlayerList" else player)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    players = [Player(f"P{i:07d}", "name", i) for i in range(args.players)]
+    newcomers = [Player(f"N{i:07d}", "name", i) for i in range(100_000)]
+
+    print(f"{args.players} players")
+    print(f"{'list':<22}{'index':<7}{'bytes/player':>14}{'scan ms':>10}{'pop+push us':>13}")
+    for kind in ("PlayerList", "UnrolledPlayerList"):
+        for index_uids in (True, False):
+            gc.collect()
+            tracemalloc.start()
+            player_list = build(kind, players, index_uids)
+            memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            start = time.perf_counter()
+            scan(kind, player_list)
+            scan_seconds = time.perf_counter() - start
+
+            churn_seconds = 0.0
+            if index_uids:  # without the index every push is a duplicate scan over the whole list
+                start = time.perf_counter()
+                churn(kind, player_list, newcomers)
+                churn_seconds = time.perf_counter() - start
+
+            print(f"{kind:<22}{'on' if index_uids else 'off':<7}{memory / args.players:>14.0f}"
+                  f"{scan_seconds * 1e3:>10.1f}"
+                  f"{churn_seconds / len(newcomers) * 1e6 if index_uids else float('nan'):>13.2f}")
+            del player_list
+
+
+if __name__ == '__main__':
+    main()
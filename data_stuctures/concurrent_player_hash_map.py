@@ -0,0 +1,226 @@
+from __future__ import annotations
+from collections import abc
+from threading import Lock
+from typing import List, Tuple
+from player import Player
+from data_stuctures.player_hash_map import PlayerHashMap
+
+
+class ConcurrentPlayerHashMap:
+    """
+    A thread-safe hash map of Player objects using lock striping.
+
+    The keys are split over a fixed number of stripes, each being an independent PlayerHashMap
+    segment guarded by its own lock. Threads working on keys of different stripes never contend,
+    and since every segment resizes on its own under its lock, a resize only blocks the threads
+    that use that one stripe.
+
+    The stripe of a key is chosen with Python's built-in string hash, which is independent of
+    the segments' own hash strategy. Otherwise all keys of a stripe would share the same low
+    bits and pile up in a fraction of the segment's buckets.
+
+    Attributes:
+        STRIPES (int): The default number of stripes, always a power of two.
+    """
+    STRIPES: int = 16
+    _segments: List[PlayerHashMap]
+    _locks: List[Lock]
+
+    def __init__(self, stripes: int = STRIPES, capacity: int | None = None, **kwargs):
+        """
+        Initialize an empty hash map.
+
+        Args:
+            stripes (int): The number of independently locked segments, rounded up to a power of two.
+            capacity (int | None): Expected number of players, spread evenly over the segments.
+            **kwargs: Passed on to the PlayerHashMap constructor of every segment.
+
+        Raises:
+            ValueError: If the number of stripes is less than 1.
+        """
+        if stripes < 1:
+            raise ValueError("There must be at least one stripe")
+
+        stripe_count = 1
+        while stripe_count < stripes:
+            stripe_count *= 2
+        segment_capacity = -(-capacity // stripe_count) if capacity else None
+
+        self._mask = stripe_count - 1
+        self._segments = [PlayerHashMap(capacity=segment_capacity, **kwargs) for _ in range(stripe_count)]
+        self._locks = [Lock() for _ in range(stripe_count)]
+
+    @property
+    def stripe_count(self) -> int:
+        """
+        Get the number of stripes.
+
+        Returns:
+            int: The number of independently locked segments.
+        """
+        return len(self._segments)
+
+    def _stripe(self, uid: str) -> int:
+        """
+        Calculate the stripe responsible for the given uid.
+
+        Args:
+            uid (str): The uid of the player.
+
+        Returns:
+            int: The index of the segment and lock of the uid.
+        """
+        return hash(uid) & self._mask
+
+    def __getitem__(self, key: str | Player) -> Player:
+        """
+        Retrieve a Player object from the hash map using the given key.
+
+        Args:
+            key (str | Player): The key associated with the player to retrieve, or a Player to
+                look up by its uid.
+
+        Returns:
+            Player: The Player object associated with the given key.
+
+        Raises:
+            KeyError: If no player is found with the given key.
+        """
+        uid = key.uid if isinstance(key, Player) else key
+        stripe = self._stripe(uid)
+        with self._locks[stripe]:
+            return self._segments[stripe][uid]
+
+    def __setitem__(self, key: str | Player, name: str):
+        """
+        Insert or update a Player in the hash map with the given key and name.
+
+        Args:
+            key (str | Player): The key for the player, or a Player whose uid is used as the key.
+            name (str): The name of the player.
+        """
+        uid = key.uid if isinstance(key, Player) else key
+        stripe = self._stripe(uid)
+        with self._locks[stripe]:
+            self._segments[stripe][uid] = name
+
+    def __delitem__(self, key: str | Player):
+        """
+        Delete a Player from the hash map using the given key.
+
+        Args:
+            key (str | Player): The key of the player to delete, or a Player to delete by its uid.
+
+        Raises:
+            KeyError: If no player is found with the given key.
+        """
+        uid = key.uid if isinstance(key, Player) else key
+        stripe = self._stripe(uid)
+        with self._locks[stripe]:
+            del self._segments[stripe][uid]
+
+    def __contains__(self, key: str | Player) -> bool:
+        """
+        Check whether a player with the given key is in the hash map.
+
+        Args:
+            key (str | Player): The key to look for, or a Player to look up by its uid.
+
+        Returns:
+            bool: True if the key is in the hash map, False otherwise.
+        """
+        uid = key.uid if isinstance(key, Player) else key
+        stripe = self._stripe(uid)
+        with self._locks[stripe]:
+            return uid in self._segments[stripe]
+
+    def get(self, key: str | Player, default: Player | None = None) -> Player | None:
+        """
+        Retrieve a Player object from the hash map, or a default if the key is not present.
+
+        Args:
+            key (str | Player): The key associated with the player to retrieve, or a Player to
+                look up by its uid.
+            default (Player | None): The value to return if the key is not in the hash map.
+
+        Returns:
+            Player | None: The Player object associated with the given key, or the default.
+        """
+        uid = key.uid if isinstance(key, Player) else key
+        stripe = self._stripe(uid)
+        with self._locks[stripe]:
+            return self._segments[stripe].get(uid, default)
+
+    def update(self, players: abc.Iterable[Player | Tuple[str, str]]):
+        """
+        Insert or update many players, taking each stripe's lock once.
+
+        Args:
+            players (Iterable[Player | Tuple[str, str]]): Player objects or (uid, name) pairs,
+                see PlayerHashMap.update().
+        """
+        batches = [[] for _ in self._segments]
+        for item in players:
+            batches[self._stripe(item.uid if isinstance(item, Player) else item[0])].append(item)
+
+        for stripe, batch in enumerate(batches):
+            if batch:
+                with self._locks[stripe]:
+                    self._segments[stripe].update(batch)
+
+    def __len__(self) -> int:
+        """
+        Get the number of players currently stored in the hash map.
+
+        The segments are summed without locking, so while other threads insert or delete
+        the result is only a snapshot.
+
+        Returns:
+            int: The number of players in the hash map.
+        """
+        return sum(len(segment) for segment in self._segments)
+
+    def items(self):
+        """
+        Iterate over the (uid, player) pairs of the hash map.
+
+        Each segment is copied under its lock and then yielded without holding it, so the
+        iteration is weakly consistent: it never fails because of concurrent writers, and
+        sees every player that was in the hash map for the whole iteration.
+
+        Yields:
+            Tuple[str, Player]: The uid and the player, in no particular order.
+        """
+        for stripe, segment in enumerate(self._segments):
+            with self._locks[stripe]:
+                segment_items = list(segment.items())
+            yield from segment_items
+
+    def __iter__(self):
+        """
+        Iterate over the keys of the hash map, weakly consistent, see items().
+
+        Yields:
+            str: The uid of each player, in no particular order.
+        """
+        for key, _ in self.items():
+            yield key
+
+    def keys(self):
+        """
+        Iterate over the keys of the hash map, weakly consistent, see items().
+
+        Yields:
+            str: The uid of each player, in no particular order.
+        """
+        return iter(self)
+
+    def values(self):
+        """
+        Iterate over the players of the hash map, weakly consistent, see items().
+
+        Yields:
+            Player: Each player, in no particular order.
+        """
+        for _, player in self.items():
+            yield player
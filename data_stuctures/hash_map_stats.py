@@ -0,0 +1,112 @@
+from __future__ import annotations
+from typing import Dict
+
+
+class OperationStats:
+    """
+    Counters for one kind of hash map operation (get, set or delete).
+
+    Attributes:
+        count (int): The number of operations performed.
+        misses (int): The number of operations that did not find their key.
+        comparisons (int): The total number of key comparisons made while walking chains.
+        max_comparisons (int): The largest number of key comparisons made by a single operation.
+    """
+    __slots__ = ("count", "misses", "comparisons", "max_comparisons")
+
+    def __init__(self):
+        """
+        Initialize all counters to zero.
+        """
+        self.count = 0
+        self.misses = 0
+        self.comparisons = 0
+        self.max_comparisons = 0
+
+    def record(self, comparisons: int, found: bool):
+        """
+        Record a single operation.
+
+        Args:
+            comparisons (int): The number of key comparisons the operation made.
+            found (bool): Whether the operation found its key.
+        """
+        self.count += 1
+        self.comparisons += comparisons
+        if comparisons > self.max_comparisons:
+            self.max_comparisons = comparisons
+        if not found:
+            self.misses += 1
+
+    @property
+    def mean_comparisons(self) -> float:
+        """
+        Get the average number of key comparisons per operation.
+
+        Returns:
+            float: The mean number of comparisons, or 0.0 if no operation was recorded.
+        """
+        return self.comparisons / self.count if self.count else 0.0
+
+    def as_dict(self) -> Dict[str, int | float]:
+        """
+        Export the counters.
+
+        Returns:
+            Dict[str, int | float]: The counters and the mean number of comparisons.
+        """
+        return {
+            "count": self.count,
+            "misses": self.misses,
+            "comparisons": self.comparisons,
+            "max_comparisons": self.max_comparisons,
+            "mean_comparisons": self.mean_comparisons,
+        }
+
+
+class HashMapStats:
+    """
+    Per-operation counters of a hash map.
+
+    Only integer counters are updated on the hot path, so the stats can stay enabled in production.
+    Nothing is printed; use as_dict() to hand them to a metrics pipeline.
+
+    Attributes:
+        get (OperationStats): Counters for lookups.
+        set (OperationStats): Counters for inserts and updates.
+        delete (OperationStats): Counters for deletions.
+        resizes (int): The number of times the bucket array was rebuilt.
+    """
+    get: OperationStats
+    set: OperationStats
+    delete: OperationStats
+    resizes: int
+
+    def __init__(self):
+        """
+        Initialize all counters to zero.
+        """
+        self.reset()
+
+    def reset(self):
+        """
+        Reset all counters to zero.
+        """
+        self.get = OperationStats()
+        self.set = OperationStats()
+        self.delete = OperationStats()
+        self.resizes = 0
+
+    def as_dict(self) -> Dict[str, Dict[str, int | float] | int]:
+        """
+        Export the counters.
+
+        Returns:
+            Dict[str, Dict[str, int | float] | int]: The counters of each operation and the resize count.
+        """
+        return {
+            "get": self.get.as_dict(),
+            "set": self.set.as_dict(),
+            "delete": self.delete.as_dict(),
+            "resizes": self.resizes,
+        }
@@ -0,0 +1,124 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import hashlib
+import os
+from player import Player
+
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+class HashStrategy(ABC):
+    """
+    Base class for the hash functions a PlayerHashMap can use to place keys in buckets.
+
+    A strategy is a callable taking a player uid and returning a non-negative integer.
+    The hash map reduces it to a bucket index itself, so strategies should spread their
+    output over the low bits as well as the high ones.
+    """
+
+    @abstractmethod
+    def __call__(self, key: str) -> int:
+        """
+        Hash the given key.
+
+        Args:
+            key (str): The player uid to hash.
+
+        Returns:
+            int: A non-negative hash value.
+        """
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class SumOfAsciiHash(HashStrategy):
+    """
+    The legacy strategy: the sum of the ASCII values of the key (see Player.sum_of_ascii_values).
+
+    Anagrams always collide and keys of the same length fall into a narrow range of values,
+    so it is only kept for compatibility.
+    """
+
+    def __call__(self, key: str) -> int:
+        return Player.sum_of_ascii_values(key)
+
+
+class PolynomialHash(HashStrategy):
+    """
+    A polynomial rolling hash: h = h * base + ord(char), truncated to 64 bits.
+
+    Unlike the sum of ASCII values, the position of every character matters, so anagrams
+    and sequential ids are spread over the whole range.
+    """
+
+    def __init__(self, base: int = 31):
+        """
+        Initialize the strategy with the given multiplier.
+
+        Args:
+            base (int): The multiplier applied for every character, ideally an odd prime.
+        """
+        self._base = base
+
+    def __call__(self, key: str) -> int:
+        h = 0
+        base = self._base
+        for char in key:
+            h = (h * base + ord(char)) & _MASK_64
+        return h
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(base={self._base})"
+
+
+class FNV1aHash(HashStrategy):
+    """
+    The 64-bit FNV-1a hash of the UTF-8 encoded key.
+
+    Every byte is XOR-ed into the hash before the multiplication, which mixes each
+    character into the low bits used for the bucket index. This is the default strategy.
+    """
+
+    OFFSET_BASIS: int = 0xCBF29CE484222325
+    PRIME: int = 0x100000001B3
+
+    def __call__(self, key: str) -> int:
+        h = self.OFFSET_BASIS
+        prime = self.PRIME
+        for byte in key.encode():
+            h = ((h ^ byte) * prime) & _MASK_64
+        return h
+
+
+class SeededHash(HashStrategy):
+    """
+    A keyed hash (BLAKE2b with a per-instance secret seed).
+
+    Client supplied uids cannot be crafted to collide without knowing the seed, which
+    protects the hash map against hash-flooding. It is slower than the other strategies.
+    """
+
+    def __init__(self, seed: bytes | None = None):
+        """
+        Initialize the strategy with the given seed, or a random one.
+
+        Args:
+            seed (bytes | None): Up to 64 bytes of key material. A random 16 byte seed is
+                generated when None.
+
+        Raises:
+            ValueError: If the seed is longer than 64 bytes.
+        """
+        if seed is None:
+            seed = os.urandom(16)
+        if len(seed) > hashlib.blake2b.MAX_KEY_SIZE:
+            raise ValueError(f"Seed must be at most {hashlib.blake2b.MAX_KEY_SIZE} bytes long")
+        self._seed = seed
+
+    def __call__(self, key: str) -> int:
+        digest = hashlib.blake2b(key.encode(), key=self._seed, digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(seed=<hidden>)"
@@ -1,8 +1,12 @@
 from __future__ import annotations
-from typing import List
+from collections import abc
+from math import ceil
+from typing import Dict, List, Tuple
 from player_list import PlayerList
 from player_node import PlayerNode
 from player import Player
+from data_stuctures.hash_strategies import HashStrategy, FNV1aHash
+from data_stuctures.hash_map_stats import HashMapStats
 
 
 class PlayerHashMap:
@@ -13,26 +17,180 @@ class PlayerHashMap:
     It provides functionality to insert, retrieve, update, and delete Player objects
     based on unique keys. It also supports efficient retrieval of the number of stored players.
 
+    The number of buckets grows (doubles) whenever the load factor exceeds
+    ``max_load_factor`` and, if ``min_load_factor`` is given, halves when the load
+    factor drops below it. Existing PlayerNodes are relinked into the new buckets
+    rather than re-allocated.
+
+    Keys are placed in buckets by a pluggable HashStrategy (FNV-1a by default).
+
+    With ``incremental_resize`` the old bucket array is kept next to the new one after a
+    resize and every get, set and delete migrates only a few of its buckets, so no single
+    operation pays for rehashing the whole table.
+
     Attributes:
-        SIZE (int): The size of the hash map (number of buckets).
-        hashmap (List[PlayerList]): The list of PlayerList objects that represent the hash map.
+        SIZE (int): The default (and minimum) number of buckets.
+        MAX_LOAD_FACTOR (float): The default load factor above which the hash map grows.
+        REHASH_STEP (int): The default number of old buckets migrated per operation.
+        hashmap (List[PlayerList | None]): The list of PlayerList objects that represent the hash map.
+            A bucket stays None until the first player is placed in it.
         length (int): The current number of players in the hash map.
     """
     SIZE: int = 10
+    MAX_LOAD_FACTOR: float = 0.75
+    REHASH_STEP: int = 4
     length: int
-    hashmap: List[PlayerList]  # A list where each element is a PlayerList.
-    # This list represents the hash map's buckets for separate chaining.
+    hashmap: List[PlayerList | None]  # A list where each element is a PlayerList (or None while unused).
+    # This list represents the hash map's buckets for separate chaining. Buckets are created lazily,
+    # as allocating hundreds of thousands of empty PlayerLists would itself stall a resize. Chains are
+    # short, so the buckets do without the PlayerList uid index and its per-bucket dict.
 
-    def __init__(self):
+    def __init__(self, capacity: int | None = None, max_load_factor: float = MAX_LOAD_FACTOR,
+                 min_load_factor: float | None = None, hash_strategy: HashStrategy | None = None,
+                 track_stats: bool = False, incremental_resize: bool = False, rehash_step: int = REHASH_STEP):
         """
-        Initialize an empty hash map with a fixed size.
+        Initialize an empty hash map.
+
+        Args:
+            capacity (int | None): Expected number of players. The initial number of buckets is
+                chosen so that this many players fit without a resize. Defaults to SIZE buckets.
+            max_load_factor (float): Players per bucket above which the bucket array doubles.
+            min_load_factor (float | None): Players per bucket below which the bucket array halves
+                (never below the initial size). Shrinking is disabled when None.
+            hash_strategy (HashStrategy | None): The hash function used to place keys in buckets.
+                Defaults to FNV1aHash.
+            track_stats (bool): Whether to count operations and key comparisons, see export_stats().
+            incremental_resize (bool): Whether to migrate buckets a few at a time after a resize
+                instead of all at once.
+            rehash_step (int): The number of old buckets migrated by each operation when resizing
+                incrementally.
+
+        Raises:
+            ValueError: If the capacity, load factors or rehash step are out of range.
         """
-        self.hashmap = [PlayerList() for _ in range(self.SIZE)]
+        if capacity is not None and capacity < 0:
+            raise ValueError("Capacity must be a non-negative integer")
+        if max_load_factor <= 0:
+            raise ValueError("max_load_factor must be positive")
+        # the shrink threshold must stay well below half of the growth one, otherwise
+        # a single insert right after a shrink would trigger a grow again
+        if min_load_factor is not None and not 0 < min_load_factor < max_load_factor / 2:
+            raise ValueError("min_load_factor must be positive and less than half of max_load_factor")
+        if rehash_step < 1:
+            raise ValueError("rehash_step must be at least 1")
+
+        self._hash_strategy = hash_strategy if hash_strategy is not None else FNV1aHash()
+        self._max_load_factor = max_load_factor
+        self._min_load_factor = min_load_factor
+        self._min_size = self.SIZE
+        if capacity:
+            self._min_size = max(self.SIZE, ceil(capacity / max_load_factor))
+
+        self.hashmap = [None] * self._min_size
         self._length = 0
+        self._stats = HashMapStats() if track_stats else None
 
-    # For knowledge purposes, there is a check if an argument is an instance of the Player object or a string
-    # to use the dunder hash function on the Player object or use the custom hash function directly using the static
-    # method but in both cases we end up using the same function, though with a hash() function a value can be truncated
+        self._incremental_resize = incremental_resize
+        self._rehash_step = rehash_step
+        # while an incremental resize is in progress, buckets of the old array below
+        # _rehash_index have been migrated (and set to None), the rest still hold players
+        self._old_hashmap: List[PlayerList | None] | None = None
+        self._rehash_index = 0
+
+    @property
+    def bucket_count(self) -> int:
+        """
+        Get the current number of buckets.
+
+        Returns:
+            int: The number of PlayerList buckets in the hash map.
+        """
+        return len(self.hashmap)
+
+    @property
+    def hash_strategy(self) -> HashStrategy:
+        """
+        Get the hash strategy used to place keys in buckets.
+
+        Returns:
+            HashStrategy: The hash strategy of the hash map.
+        """
+        return self._hash_strategy
+
+    @property
+    def load_factor(self) -> float:
+        """
+        Get the current load factor (players per bucket).
+
+        Returns:
+            float: The number of players divided by the number of buckets.
+        """
+        return self._length / len(self.hashmap)
+
+    @property
+    def is_rehashing(self) -> bool:
+        """
+        Check whether an incremental resize is in progress.
+
+        Returns:
+            bool: True if some players are still in the old bucket array, False otherwise.
+        """
+        return self._old_hashmap is not None
+
+    @property
+    def stats(self) -> HashMapStats | None:
+        """
+        Get the operation counters.
+
+        Returns:
+            HashMapStats | None: The counters, or None if the hash map was created without track_stats.
+        """
+        return self._stats
+
+    def chain_length_histogram(self) -> Dict[int, int]:
+        """
+        Count the buckets by the length of their chain.
+
+        Returns:
+            Dict[int, int]: The number of buckets (values) holding each chain length (keys), in
+            ascending order of chain length.
+        """
+        histogram = {}
+        for player_list in self._buckets():
+            chain_length = len(player_list) if player_list is not None else 0
+            histogram[chain_length] = histogram.get(chain_length, 0) + 1
+        return dict(sorted(histogram.items()))
+
+    def export_stats(self) -> Dict[str, object]:
+        """
+        Export the health of the hash map as a dictionary for a metrics pipeline.
+
+        The structural figures are computed here in a single pass over the buckets, while the
+        operation counters are only present when the hash map tracks stats. During an incremental
+        resize the buckets of both arrays are counted.
+
+        Returns:
+            Dict[str, object]: The number of players and buckets, load factor, chain length
+            histogram, max/mean length of the non-empty chains and, if tracked, the operation counters.
+        """
+        histogram = self.chain_length_histogram()
+        used_buckets = sum(histogram.values()) - histogram.get(0, 0)
+
+        exported = {
+            "length": self._length,
+            "bucket_count": len(self.hashmap),
+            "load_factor": self.load_factor,
+            "is_rehashing": self.is_rehashing,
+            "chain_length_histogram": histogram,
+            "max_chain_length": max(histogram),
+            "mean_chain_length": self._length / used_buckets if used_buckets else 0.0,
+        }
+        if self._stats is not None:
+            exported["operations"] = self._stats.as_dict()
+        return exported
+
+    # A Player key is hashed by its uid, so a player and its uid always end up in the same bucket
+    # whichever hash strategy is in use
     def get_index(self, key: str | Player) -> int:
         """
         Calculate the index for the given key in the hash map.
@@ -44,16 +202,84 @@ class PlayerHashMap:
             int: The index in the hash map corresponding to the given key.
         """
         if isinstance(key, Player):
-            return hash(key) % self.SIZE
-        else:
-            return Player.sum_of_ascii_values(key) % self.SIZE
+            key = key.uid
+        return self._hash_strategy(key) % len(self.hashmap)
+
+    def _bucket_for(self, key: str | Player, create: bool = False) -> PlayerList | None:
+        """
+        Find the bucket currently responsible for the given key.
+
+        During an incremental resize a key whose old bucket has not been migrated yet still
+        lives in the old bucket array, otherwise it lives in the new one.
+
+        Args:
+            key (str | Player): The key to look up.
+            create (bool): Whether to create the bucket if it has not been used yet.
+
+        Returns:
+            PlayerList | None: The bucket that holds the key, or would hold it once inserted.
+            None if the bucket is unused and ``create`` is False.
+        """
+        if isinstance(key, Player):
+            key = key.uid
+        key_hash = self._hash_strategy(key)
+
+        hashmap = self.hashmap
+        index = key_hash % len(hashmap)
+        if self._old_hashmap is not None:
+            old_index = key_hash % len(self._old_hashmap)
+            if old_index >= self._rehash_index:
+                hashmap, index = self._old_hashmap, old_index
+
+        player_list = hashmap[index]
+        if player_list is None and create:
+            player_list = hashmap[index] = PlayerList(index_uids=False)
+        return player_list
+
+    def _buckets(self):
+        """
+        Iterate over every bucket that may hold players, including the not yet migrated old ones.
+
+        Yields:
+            PlayerList: The buckets of the hash map.
+        """
+        yield from self.hashmap
+        if self._old_hashmap is not None:
+            yield from self._old_hashmap[self._rehash_index:]
+
+    def _find_node(self, player_list: PlayerList | None, key: str, operation: str) -> PlayerNode | None:
+        """
+        Find the node holding the given key in a bucket, counting comparisons if stats are tracked.
+
+        Args:
+            player_list (PlayerList | None): The bucket the key hashes to, None if it is unused.
+            key (str): The uid to look for; callers turn Player keys into their uid first.
+            operation (str): The counter to record the lookup under ("get", "set" or "delete").
+
+        Returns:
+            PlayerNode | None: The node holding the key, or None if it is not in the bucket.
+        """
+        if self._stats is None:
+            return player_list.find_node_by_key(key) if player_list is not None else None
+
+        comparisons = 0
+        current_node = player_list.head if player_list is not None else None
+        while current_node is not None:
+            comparisons += 1
+            if current_node.key == key:
+                break
+            current_node = current_node.player_next_node
+
+        getattr(self._stats, operation).record(comparisons, current_node is not None)
+        return current_node
 
     def __getitem__(self, key: str | Player) -> Player:
         """
         Retrieve a Player object from the hash map using the given key.
 
         Args:
-            key (str): The key associated with the player to retrieve.
+            key (str | Player): The key associated with the player to retrieve, or a Player to
+                look up by its uid.
 
         Returns:
             Player: The Player object associated with the given key.
@@ -61,10 +287,12 @@ class PlayerHashMap:
         Raises:
             KeyError: If no player is found with the given key.
         """
-        index = self.get_index(key)
-        player_list = self.hashmap[index]
+        if isinstance(key, Player):
+            key = key.uid
+        self._migrate_step()
+        player_list = self._bucket_for(key)
 
-        existing_player_node = player_list.find_node_by_key(key)
+        existing_player_node = self._find_node(player_list, key, "get")
 
         if not existing_player_node:
             raise KeyError(f"Key {key} not found")
@@ -76,25 +304,95 @@ class PlayerHashMap:
         Insert or update a Player in the hash map with the given key and name.
 
         Args:
-            key (str): The key for the player.
+            key (str | Player): The key for the player, or a Player whose uid is used as the key.
             name (str): The name of the player.
 
         Raises:
             ValueError: If a player with the given key already exists and updating is not desired.
         """
-        index = self.get_index(key)
-        player_list = self.hashmap[index]
+        if isinstance(key, Player):
+            key = key.uid
+        self._migrate_step()
+        player_list = self._bucket_for(key, create=True)
 
-        existing_player_node = player_list.find_node_by_key(key)
+        existing_player_node = self._find_node(player_list, key, "set")
 
         if not existing_player_node:
             new_player = Player(key, name)
             new_player_node = PlayerNode(new_player)
-            player_list.push_front(new_player_node)
+            # _find_node has just scanned the chain, no need for push_front to scan it again
+            player_list.push_front(new_player_node, check_duplicates=False)
             self._length += 1
+            if self._length > len(self.hashmap) * self._max_load_factor:
+                self._resize(len(self.hashmap) * 2)
         else:
             existing_player_node.player.name = name
 
+    @classmethod
+    def from_iterable(cls, players: abc.Iterable[Player | Tuple[str, str]], **kwargs) -> PlayerHashMap:
+        """
+        Build a hash map from an iterable of Player objects or (uid, name) pairs.
+
+        The bucket array is sized once for the whole input, see update().
+
+        Args:
+            players (Iterable[Player | Tuple[str, str]]): The players to load.
+            **kwargs: Passed on to the constructor. The capacity defaults to the number of players.
+
+        Returns:
+            PlayerHashMap: A new hash map holding the players.
+        """
+        if not isinstance(players, abc.Sized):
+            players = list(players)
+        kwargs.setdefault("capacity", len(players))
+
+        hash_map = cls(**kwargs)
+        hash_map.update(players)
+        return hash_map
+
+    def update(self, players: abc.Iterable[Player | Tuple[str, str]]):
+        """
+        Insert or update many players at once.
+
+        The bucket array is grown once up front to fit every player, then each player costs a
+        single chain scan: new players are linked straight into their bucket and existing ones
+        are updated in place. When a uid repeats, the last occurrence wins.
+
+        Player objects are stored as they are (an existing uid is re-pointed to the given object),
+        while (uid, name) pairs behave like ``hash_map[uid] = name``.
+
+        Args:
+            players (Iterable[Player | Tuple[str, str]]): The players to insert or update.
+        """
+        if not isinstance(players, abc.Sized):
+            players = list(players)
+
+        new_size = len(self.hashmap)
+        while self._length + len(players) > new_size * self._max_load_factor:
+            new_size *= 2
+        if new_size != len(self.hashmap):
+            self._resize(new_size)
+
+        for item in players:
+            if isinstance(item, Player):
+                player, uid = item, item.uid
+            else:
+                player = None
+                uid, name = item
+
+            player_list = self._bucket_for(uid, create=True)
+            existing_player_node = self._find_node(player_list, uid, "set")
+
+            if not existing_player_node:
+                if player is None:
+                    player = Player(uid, name)
+                player_list.push_front(PlayerNode(player), check_duplicates=False)
+                self._length += 1
+            elif player is not None:
+                existing_player_node.player = player
+            else:
+                existing_player_node.player.name = name
+
     def __len__(self) -> int:
         """
         Get the number of players currently stored in the hash map.
@@ -104,39 +402,214 @@ class PlayerHashMap:
         """
         return self._length
 
-    def __delitem__(self, key):
+    def __contains__(self, key: str | Player) -> bool:
+        """
+        Check whether a player with the given key is in the hash map.
+
+        Args:
+            key (str | Player): The key to look for, or a Player to look up by its uid.
+
+        Returns:
+            bool: True if the key is in the hash map, False otherwise.
+        """
+        if isinstance(key, Player):
+            key = key.uid
+        self._migrate_step()
+        return self._find_node(self._bucket_for(key), key, "get") is not None
+
+    def get(self, key: str | Player, default: Player | None = None) -> Player | None:
+        """
+        Retrieve a Player object from the hash map, or a default if the key is not present.
+
+        Unlike ``hash_map[key]`` inside a try/except, a miss costs a single chain scan and no exception.
+
+        Args:
+            key (str | Player): The key associated with the player to retrieve, or a Player to
+                look up by its uid.
+            default (Player | None): The value to return if the key is not in the hash map.
+
+        Returns:
+            Player | None: The Player object associated with the given key, or the default.
+        """
+        if isinstance(key, Player):
+            key = key.uid
+        self._migrate_step()
+        existing_player_node = self._find_node(self._bucket_for(key), key, "get")
+
+        return existing_player_node.player if existing_player_node else default
+
+    def _nodes(self):
+        """
+        Lazily iterate over every PlayerNode in the hash map, bucket by bucket.
+
+        Yields:
+            PlayerNode: The nodes of the hash map, in no particular order.
+        """
+        for player_list in self._buckets():
+            if player_list is not None:
+                yield from player_list.iterate()
+
+    # As with a dict, the hash map must not be modified while it is being iterated. With incremental
+    # resizing even lookups move nodes between buckets, so avoid them inside the loop as well.
+    def __iter__(self):
+        """
+        Lazily iterate over the keys of the hash map, without copying them.
+
+        Yields:
+            str: The uid of each player, in no particular order.
+        """
+        for player_node in self._nodes():
+            yield player_node.key
+
+    def keys(self):
+        """
+        Lazily iterate over the keys of the hash map, without copying them.
+
+        Yields:
+            str: The uid of each player, in no particular order.
+        """
+        return iter(self)
+
+    def values(self):
+        """
+        Lazily iterate over the players of the hash map, without copying them.
+
+        Yields:
+            Player: Each player, in no particular order.
+        """
+        for player_node in self._nodes():
+            yield player_node.player
+
+    def items(self):
+        """
+        Lazily iterate over the (uid, player) pairs of the hash map, without copying them.
+
+        Yields:
+            Tuple[str, Player]: The uid and the player, in no particular order.
+        """
+        for player_node in self._nodes():
+            yield player_node.key, player_node.player
+
+    def __delitem__(self, key: str | Player):
         """
         Delete a Player from the hash map using the given key.
 
         Args:
-            key (str): The key of the player to delete.
+            key (str | Player): The key of the player to delete, or a Player to delete by its uid.
 
         Raises:
             KeyError: If no player is found with the given key.
         """
-        index = self.get_index(key)
-        player_list = self.hashmap[index]
+        if isinstance(key, Player):
+            key = key.uid
+        self._migrate_step()
+        player_list = self._bucket_for(key)
 
-        existing_player_node = player_list.find_node_by_key(key)
+        existing_player_node = self._find_node(player_list, key, "delete")
 
         if not existing_player_node:
             raise KeyError(f"Key {key} not found")
 
-        player_list.pop_by_uid(key)
+        # the node has already been found, so unlink it directly instead of pop_by_uid scanning again
+        player_list.remove_node(existing_player_node)
         self._length -= 1
 
+        if (self._min_load_factor is not None and len(self.hashmap) > self._min_size
+                and self._length < len(self.hashmap) * self._min_load_factor):
+            self._resize(max(len(self.hashmap) // 2, self._min_size))
+
+    def _resize(self, new_size: int):
+        """
+        Switch to a new bucket array of the given size and redistribute every PlayerNode into it.
+
+        Without incremental resizing all buckets are migrated right away. Otherwise the old
+        array is kept and migrated by the following operations, see _migrate_step(). A resize
+        that is still in progress is completed first, so at most two arrays exist at a time.
+
+        Args:
+            new_size (int): The number of buckets of the new bucket array.
+        """
+        if self._old_hashmap is not None:
+            self._migrate_buckets(len(self._old_hashmap))
+
+        self._old_hashmap = self.hashmap
+        self.hashmap = [None] * new_size
+        self._rehash_index = 0
+        if self._stats is not None:
+            self._stats.resizes += 1
+
+        if not self._incremental_resize:
+            self._migrate_buckets(len(self._old_hashmap))
+
+    def _migrate_step(self):
+        """
+        Migrate the next rehash_step buckets of an incremental resize, if one is in progress.
+        """
+        if self._old_hashmap is not None:
+            self._migrate_buckets(self._rehash_step)
+
+    def _migrate_buckets(self, count: int):
+        """
+        Move the nodes of up to ``count`` old buckets into the new bucket array.
+
+        The nodes are unlinked from their old bucket and pushed into the new one as they are,
+        so no Player or PlayerNode is re-allocated. The duplicate scan is skipped because
+        keys are already known to be unique.
+
+        Args:
+            count (int): The maximum number of old buckets to migrate.
+        """
+        old_hashmap = self._old_hashmap
+        end = min(self._rehash_index + count, len(old_hashmap))
+
+        hashmap = self.hashmap
+
+        for old_index in range(self._rehash_index, end):
+            if old_hashmap[old_index] is None:
+                continue
+
+            current_node = old_hashmap[old_index].head
+            while current_node is not None:
+                next_node = current_node.player_next_node
+                current_node.player_next_node = None
+                current_node.player_prev_node = None
+
+                index = self.get_index(current_node.key)
+                if hashmap[index] is None:
+                    hashmap[index] = PlayerList(index_uids=False)
+                hashmap[index].push_front(current_node, check_duplicates=False)
+                current_node = next_node
+            old_hashmap[old_index] = None
+
+        self._rehash_index = end
+        if end == len(old_hashmap):
+            self._old_hashmap = None
+
     def display(self):
         """
         Display the contents of the hash map.
 
-        Prints the index and contents of each non-empty PlayerList in the hash map.
+        Prints the index and contents of each non-empty PlayerList in the hash map. During an
+        incremental resize the not yet migrated old buckets are listed after the new ones, in their
+        own section and with their index in the old array.
         """
         if len(self) == 0:
             print("The hash table is empty")
             return
 
         for index, player_list in enumerate(self.hashmap):
-            if player_list.is_empty:
+            if player_list is None or player_list.is_empty:
                 continue
             print(f"Index of the player_list {index}")
             player_list.display()
+
+        if self._old_hashmap is None:
+            return
+
+        print("Buckets of the old array not yet migrated")
+        for index in range(self._rehash_index, len(self._old_hashmap)):
+            player_list = self._old_hashmap[index]
+            if player_list is None or player_list.is_empty:
+                continue
+            print(f"Index of the old player_list {index}")
+            player_list.display()
@@ -0,0 +1,290 @@
+from __future__ import annotations
+import time
+from collections import OrderedDict, abc
+from typing import Dict
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+class PlayerLRUCache:
+    """
+    A least-recently-used cache of Player objects, keyed by uid.
+
+    The players are stored in the nodes of an indexed PlayerList, which keeps them in recency order,
+    most recently used first. The list's uid index hands out the node of a player in O(1), so a hit
+    is returned from its node and moved to the front with remove_node() and push_front() without any
+    scan, and the least recently used player is always the tail.
+
+    The cache is not built on a PlayerHashMap: the list's uid index already maps every uid to its
+    node, so a PlayerHashMap next to it would hold every player a second time, in its own chain
+    node, and cost a second lookup on every hit. The uid index takes its place as the lookup table.
+
+    Entries can also expire: with a ttl, a player that has not been put again within ttl seconds
+    is dropped the next time it is looked up, or when the cache runs out of room.
+
+    Attributes:
+        hits (int): The number of lookups that found a live player.
+        misses (int): The number of lookups that found no player or an expired one.
+        evictions (int): The number of players dropped to make room for new ones.
+        expirations (int): The number of players dropped because their ttl ran out.
+    """
+    _recency: PlayerList
+    _expires_at: OrderedDict[str, float] | None
+
+    def __init__(self, capacity: int, ttl: float | None = None,
+                 on_evict: abc.Callable[[Player], None] | None = None,
+                 clock: abc.Callable[[], float] = time.monotonic):
+        """
+        Initialize an empty cache.
+
+        Args:
+            capacity (int): The maximum number of players in the cache.
+            ttl (float | None): The number of seconds a player stays valid after it was put,
+                or None for players to never expire.
+            on_evict (Callable[[Player], None] | None): Called with every player that is evicted
+                or expires, e.g. to write it back to the database. Not called for players that are
+                deleted or replaced explicitly.
+            clock (Callable[[], float]): Returns the current time in seconds, used for the ttl.
+
+        Raises:
+            ValueError: If the capacity is less than 1 or the ttl is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self._capacity = capacity
+        self._ttl = ttl
+        self._on_evict = on_evict
+        self._clock = clock
+        self._recency = PlayerList(index_uids=True)
+        # kept in put order, which with a fixed ttl is also expiry order
+        self._expires_at = OrderedDict() if ttl is not None else None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def capacity(self) -> int:
+        """
+        Get the maximum number of players in the cache.
+
+        Returns:
+            int: The capacity of the cache.
+        """
+        return self._capacity
+
+    def __len__(self) -> int:
+        """
+        Get the number of players currently in the cache, including expired ones not dropped yet.
+
+        Returns:
+            int: The number of players in the cache.
+        """
+        return len(self._recency)
+
+    def _is_expired(self, uid: str) -> bool:
+        """
+        Check whether the ttl of a cached player has run out.
+
+        Args:
+            uid (str): The uid of a player in the cache.
+
+        Returns:
+            bool: True if the player has expired, False otherwise or if the cache has no ttl.
+        """
+        return self._expires_at is not None and self._expires_at[uid] <= self._clock()
+
+    def _drop(self, player_node: PlayerNode) -> Player:
+        """
+        Remove a player from the recency list and the expiry times.
+
+        Args:
+            player_node (PlayerNode): The recency node of the player.
+
+        Returns:
+            Player: The removed player.
+        """
+        self._recency.remove_node(player_node)
+        if self._expires_at is not None:
+            del self._expires_at[player_node.key]
+        return player_node.player
+
+    def _expire(self, player_node: PlayerNode):
+        """
+        Drop an expired player and notify the eviction callback.
+
+        Args:
+            player_node (PlayerNode): The recency node of the expired player.
+        """
+        player = self._drop(player_node)
+        self.expirations += 1
+        if self._on_evict is not None:
+            self._on_evict(player)
+
+    def get(self, key: str | Player, default: Player | None = None) -> Player | None:
+        """
+        Retrieve a player and mark it as the most recently used one.
+
+        Args:
+            key (str | Player): The uid of the player, or a Player to look up by its uid.
+            default (Player | None): The value to return if the player is not cached.
+
+        Returns:
+            Player | None: The cached player, or the default if it is missing or expired.
+        """
+        uid = key.uid if isinstance(key, Player) else key
+        player_node = self._recency.find_node_by_key(uid)
+
+        if player_node is None:
+            self.misses += 1
+            return default
+        if self._is_expired(uid):
+            self._expire(player_node)
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        if player_node is not self._recency.head:
+            self._recency.remove_node(player_node)
+            self._recency.push_front(player_node, check_duplicates=False)
+        return player_node.player
+
+    def __getitem__(self, key: str | Player) -> Player:
+        """
+        Retrieve a player and mark it as the most recently used one.
+
+        Args:
+            key (str | Player): The uid of the player, or a Player to look up by its uid.
+
+        Returns:
+            Player: The cached player.
+
+        Raises:
+            KeyError: If the player is not cached or has expired.
+        """
+        player = self.get(key)
+
+        if player is None:
+            raise KeyError(f"Key {key} not found")
+
+        return player
+
+    def put(self, player: Player):
+        """
+        Insert or replace a player as the most recently used one, restarting its ttl.
+
+        If the cache is full, expired players are dropped first, then the least recently used ones.
+
+        Args:
+            player (Player): The player to cache. It replaces any cached player with the same uid.
+        """
+        uid = player.uid
+        player_node = self._recency.find_node_by_key(uid)
+
+        if player_node is not None:
+            self._recency.remove_node(player_node)
+            player_node.player = player
+        else:
+            if len(self._recency) >= self._capacity:
+                self._make_room()
+            player_node = PlayerNode(player)
+
+        self._recency.push_front(player_node, check_duplicates=False)
+        if self._expires_at is not None:
+            self._expires_at[uid] = self._clock() + self._ttl
+            self._expires_at.move_to_end(uid)
+
+    def __setitem__(self, key: str, player: Player):
+        """
+        Insert or replace a player, see put().
+
+        Args:
+            key (str): The uid of the player.
+            player (Player): The player to cache.
+
+        Raises:
+            ValueError: If the key is not the uid of the player.
+        """
+        if key != player.uid:
+            raise ValueError(f"Key {key} does not match the uid of the player {player.uid}")
+
+        self.put(player)
+
+    def _make_room(self):
+        """
+        Drop the expired players if there are any, otherwise evict the least recently used one.
+        """
+        if self._expires_at is not None:
+            now = self._clock()
+            # a hit does not restart the ttl, so the expired players are found in put order, not by recency
+            while self._expires_at and next(iter(self._expires_at.values())) <= now:
+                self._expire(self._recency.find_node_by_key(next(iter(self._expires_at))))
+            if len(self._recency) < self._capacity:
+                return
+
+        player = self._drop(self._recency.tail)
+        self.evictions += 1
+        if self._on_evict is not None:
+            self._on_evict(player)
+
+    def __contains__(self, key: str | Player) -> bool:
+        """
+        Check whether a live player is cached, without changing its recency.
+
+        Args:
+            key (str | Player): The uid of the player, or a Player to look up by its uid.
+
+        Returns:
+            bool: True if the player is cached and not expired, False otherwise.
+        """
+        uid = key.uid if isinstance(key, Player) else key
+        return self._recency.find_node_by_key(uid) is not None and not self._is_expired(uid)
+
+    def __delitem__(self, key: str | Player):
+        """
+        Remove a player from the cache without calling the eviction callback.
+
+        Args:
+            key (str | Player): The uid of the player, or a Player to remove by its uid.
+
+        Raises:
+            KeyError: If the player is not cached.
+        """
+        uid = key.uid if isinstance(key, Player) else key
+        player_node = self._recency.find_node_by_key(uid)
+
+        if player_node is None:
+            raise KeyError(f"Key {key} not found")
+
+        self._drop(player_node)
+
+    def __iter__(self):
+        """
+        Iterate over the uids of the cached players, from most to least recently used.
+
+        Yields:
+            str: The uid of each cached player, expired ones included.
+        """
+        for player_node in self._recency.iterate():
+            yield player_node.key
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Export the cache counters.
+
+        Returns:
+            Dict[str, int]: The size, capacity and the hit, miss, eviction and expiration counters.
+        """
+        return {
+            "size": len(self._recency),
+            "capacity": self._capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
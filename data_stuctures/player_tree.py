@@ -0,0 +1,473 @@
+from __future__ import annotations
+from collections import abc
+from typing import Iterator, Tuple
+from player import Player
+
+
+class PlayerTreeNode:
+    """
+    A node of a PlayerTree.
+
+    Attributes:
+        key (str): The uid of the player, copied from it so that searches do not go through the
+            Player property.
+        player (Player): The player stored in the node.
+        left (PlayerTreeNode | None): The subtree of the smaller uids.
+        right (PlayerTreeNode | None): The subtree of the greater uids.
+        height (int): The number of nodes on the longest path from this node down to a leaf.
+    """
+    __slots__ = ("key", "player", "left", "right", "height")
+
+    def __init__(self, player: Player):
+        """
+        Initialize a leaf node holding a player.
+
+        Args:
+            player (Player): The player to store.
+        """
+        self.key = player.uid
+        self.player = player
+        self.left = None
+        self.right = None
+        self.height = 1
+
+
+def _height(node: PlayerTreeNode | None) -> int:
+    """
+    Get the height of a subtree.
+
+    Args:
+        node (PlayerTreeNode | None): The root of the subtree.
+
+    Returns:
+        int: The height of the subtree, 0 if it is empty.
+    """
+    return node.height if node is not None else 0
+
+
+def _update_height(node: PlayerTreeNode):
+    """
+    Recompute the height of a node from the heights of its children.
+
+    Args:
+        node (PlayerTreeNode): The node to update.
+    """
+    node.height = 1 + max(_height(node.left), _height(node.right))
+
+
+def _rotate_right(node: PlayerTreeNode) -> PlayerTreeNode:
+    """
+    Rotate a subtree to the right, lifting its left child.
+
+    Args:
+        node (PlayerTreeNode): The root of the subtree, which must have a left child.
+
+    Returns:
+        PlayerTreeNode: The new root of the subtree.
+    """
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update_height(node)
+    _update_height(pivot)
+    return pivot
+
+
+def _rotate_left(node: PlayerTreeNode) -> PlayerTreeNode:
+    """
+    Rotate a subtree to the left, lifting its right child.
+
+    Args:
+        node (PlayerTreeNode): The root of the subtree, which must have a right child.
+
+    Returns:
+        PlayerTreeNode: The new root of the subtree.
+    """
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update_height(node)
+    _update_height(pivot)
+    return pivot
+
+
+def _rebalance(node: PlayerTreeNode) -> PlayerTreeNode:
+    """
+    Restore the AVL balance of a subtree whose children differ in height by at most two.
+
+    Args:
+        node (PlayerTreeNode): The root of the subtree.
+
+    Returns:
+        PlayerTreeNode: The new root of the subtree, whose children differ in height by at most one.
+    """
+    _update_height(node)
+    balance = _height(node.left) - _height(node.right)
+
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class PlayerTree:
+    """
+    A self-balancing binary search tree (AVL tree) of Player objects, ordered by uid.
+
+    The heights of the two subtrees of every node differ by at most one, so the tree is never deeper
+    than about 1.44 * log2(n) and inserts, lookups and deletes take O(log n). Unlike a PlayerHashMap,
+    the players can be read back in uid order lazily, without sorting them, and the tree answers
+    floor and ceiling queries and range scans by uid bounds or uid prefix in O(log n + k) for k
+    players.
+
+    Inserts and deletes recurse along a single root-to-leaf path, whose length the balance bounds.
+
+    Attributes:
+        _root (PlayerTreeNode | None): The root of the tree, None while it is empty.
+        _length (int): The number of players in the tree.
+    """
+    _root: PlayerTreeNode | None
+    _length: int
+
+    def __init__(self, players: abc.Iterable[Player] = ()):
+        """
+        Initialize a tree with the given players.
+
+        Args:
+            players (Iterable[Player]): The players to insert. A later player replaces an earlier
+                one with the same uid.
+        """
+        self._root = None
+        self._length = 0
+
+        for player in players:
+            self.insert(player)
+
+    def __len__(self) -> int:
+        """
+        Get the number of players in the tree.
+
+        Returns:
+            int: The number of players.
+        """
+        return self._length
+
+    @property
+    def height(self) -> int:
+        """
+        Get the height of the tree.
+
+        Returns:
+            int: The number of nodes on the longest root-to-leaf path, 0 if the tree is empty.
+        """
+        return _height(self._root)
+
+    def insert(self, player: Player):
+        """
+        Insert a player, or replace the player with the same uid, in O(log n).
+
+        Args:
+            player (Player): The player to insert.
+        """
+        self._root = self._insert(self._root, player)
+
+    def _insert(self, node: PlayerTreeNode | None, player: Player) -> PlayerTreeNode:
+        """
+        Insert a player into a subtree.
+
+        Args:
+            node (PlayerTreeNode | None): The root of the subtree.
+            player (Player): The player to insert.
+
+        Returns:
+            PlayerTreeNode: The new root of the subtree.
+        """
+        if node is None:
+            self._length += 1
+            return PlayerTreeNode(player)
+
+        uid = player.uid
+        if uid < node.key:
+            node.left = self._insert(node.left, player)
+        elif uid > node.key:
+            node.right = self._insert(node.right, player)
+        else:
+            node.player = player
+            return node
+
+        return _rebalance(node)
+
+    def _find(self, uid: str) -> PlayerTreeNode | None:
+        """
+        Find the node of a uid.
+
+        Args:
+            uid (str): The uid to look for.
+
+        Returns:
+            PlayerTreeNode | None: The node of the uid, or None if it is not in the tree.
+        """
+        node = self._root
+        while node is not None:
+            if uid < node.key:
+                node = node.left
+            elif uid > node.key:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def __getitem__(self, key: str | Player) -> Player:
+        """
+        Retrieve a player by uid in O(log n).
+
+        Args:
+            key (str | Player): The uid of the player, or a Player to look up by its uid.
+
+        Returns:
+            Player: The player with that uid.
+
+        Raises:
+            KeyError: If no player has that uid.
+        """
+        node = self._find(key.uid if isinstance(key, Player) else key)
+
+        if node is None:
+            raise KeyError(f"Key {key} not found")
+
+        return node.player
+
+    def get(self, key: str | Player, default: Player | None = None) -> Player | None:
+        """
+        Retrieve a player by uid, or a default if there is none.
+
+        Args:
+            key (str | Player): The uid of the player, or a Player to look up by its uid.
+            default (Player | None): The value to return if no player has that uid.
+
+        Returns:
+            Player | None: The player with that uid, or the default.
+        """
+        node = self._find(key.uid if isinstance(key, Player) else key)
+
+        return node.player if node is not None else default
+
+    def __contains__(self, key: str | Player) -> bool:
+        """
+        Check whether a player with the given uid is in the tree.
+
+        Args:
+            key (str | Player): The uid to look for, or a Player to look up by its uid.
+
+        Returns:
+            bool: True if the uid is in the tree, False otherwise.
+        """
+        return self._find(key.uid if isinstance(key, Player) else key) is not None
+
+    def __delitem__(self, key: str | Player):
+        """
+        Delete a player by uid in O(log n).
+
+        Args:
+            key (str | Player): The uid of the player, or a Player to delete by its uid.
+
+        Raises:
+            KeyError: If no player has that uid.
+        """
+        uid = key.uid if isinstance(key, Player) else key
+
+        if self._find(uid) is None:
+            raise KeyError(f"Key {key} not found")
+
+        self._root = self._delete(self._root, uid)
+        self._length -= 1
+
+    def _delete(self, node: PlayerTreeNode, uid: str) -> PlayerTreeNode | None:
+        """
+        Delete a uid that is known to be in a subtree.
+
+        Args:
+            node (PlayerTreeNode): The root of the subtree.
+            uid (str): The uid to delete.
+
+        Returns:
+            PlayerTreeNode | None: The new root of the subtree.
+        """
+        if uid < node.key:
+            node.left = self._delete(node.left, uid)
+        elif uid > node.key:
+            node.right = self._delete(node.right, uid)
+        elif node.left is None:
+            return node.right
+        elif node.right is None:
+            return node.left
+        else:
+            # take over the player of the in-order successor, then delete the successor instead
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.key, node.player = successor.key, successor.player
+            node.right = self._delete(node.right, successor.key)
+
+        return _rebalance(node)
+
+    def floor(self, key: str | Player) -> Player | None:
+        """
+        Find the player with the greatest uid less than or equal to a key, in O(log n).
+
+        Args:
+            key (str | Player): The uid to search from, or a Player to search from its uid.
+
+        Returns:
+            Player | None: The player, or None if every uid is greater than the key.
+        """
+        uid = key.uid if isinstance(key, Player) else key
+        node = self._root
+        found = None
+
+        while node is not None:
+            if uid < node.key:
+                node = node.left
+            else:
+                found = node
+                if uid == node.key:
+                    break
+                node = node.right
+
+        return found.player if found is not None else None
+
+    def ceiling(self, key: str | Player) -> Player | None:
+        """
+        Find the player with the smallest uid greater than or equal to a key, in O(log n).
+
+        Args:
+            key (str | Player): The uid to search from, or a Player to search from its uid.
+
+        Returns:
+            Player | None: The player, or None if every uid is less than the key.
+        """
+        uid = key.uid if isinstance(key, Player) else key
+        node = self._root
+        found = None
+
+        while node is not None:
+            if uid > node.key:
+                node = node.right
+            else:
+                found = node
+                if uid == node.key:
+                    break
+                node = node.left
+
+        return found.player if found is not None else None
+
+    def _nodes(self, low: str | None = None, high: str | None = None) -> Iterator[PlayerTreeNode]:
+        """
+        Lazily iterate in uid order over the nodes whose uids are in [low, high).
+
+        Subtrees entirely below low are never visited, and the iteration stops at the first uid not
+        below high. The pending nodes are kept on an explicit stack of at most the tree's height.
+
+        Args:
+            low (str | None): The smallest uid to yield, or None for no lower bound.
+            high (str | None): The uid to stop before, or None for no upper bound.
+
+        Yields:
+            PlayerTreeNode: The nodes of the range, by ascending uid.
+        """
+        stack = []
+        node = self._root
+
+        while True:
+            while node is not None:
+                if low is not None and node.key < low:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if high is not None and node.key >= high:
+                return
+            yield node
+            node = node.right
+
+    # As with a dict, the tree must not be modified while it is being iterated.
+    def __iter__(self):
+        """
+        Lazily iterate over the uids of the tree, in ascending order.
+
+        Yields:
+            str: The uid of each player.
+        """
+        for node in self._nodes():
+            yield node.key
+
+    def keys(self):
+        """
+        Lazily iterate over the uids of the tree, in ascending order.
+
+        Yields:
+            str: The uid of each player.
+        """
+        return iter(self)
+
+    def values(self):
+        """
+        Lazily iterate over the players of the tree, by ascending uid.
+
+        Yields:
+            Player: Each player.
+        """
+        for node in self._nodes():
+            yield node.player
+
+    def items(self) -> Iterator[Tuple[str, Player]]:
+        """
+        Lazily iterate over the (uid, player) pairs of the tree, by ascending uid.
+
+        Yields:
+            Tuple[str, Player]: The uid and the player.
+        """
+        for node in self._nodes():
+            yield node.key, node.player
+
+    def range(self, low: str | None = None, high: str | None = None) -> Iterator[Player]:
+        """
+        Lazily iterate over the players whose uids are at least low and less than high, by ascending
+        uid, in O(log n + k) for k players.
+
+        Args:
+            low (str | None): The smallest uid to include, or None for no lower bound.
+            high (str | None): The uid to stop before, or None for no upper bound.
+
+        Yields:
+            Player: The players in the range.
+        """
+        for node in self._nodes(low, high):
+            yield node.player
+
+    def prefix(self, prefix: str) -> Iterator[Player]:
+        """
+        Lazily iterate over the players whose uids start with a prefix, by ascending uid, in
+        O(log n + k) for k players.
+
+        The uids that start with the prefix are exactly the contiguous run of uids that follows it in
+        sorted order, so the scan starts at the prefix and stops at the first uid without it.
+
+        Args:
+            prefix (str): The start of the uids to include.
+
+        Yields:
+            Player: The players whose uids start with the prefix.
+        """
+        for node in self._nodes(prefix):
+            if not node.key.startswith(prefix):
+                return
+            yield node.player
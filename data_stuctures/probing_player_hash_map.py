@@ -0,0 +1,350 @@
+from __future__ import annotations
+from array import array
+from typing import List
+from player import Player
+from data_stuctures.hash_strategies import HashStrategy, FNV1aHash
+
+# Marks a slot whose player was deleted. Lookups have to probe past it, inserts may reuse it.
+_TOMBSTONE = object()
+
+
+class ProbingPlayerHashMap:
+    """
+    An open-addressing hash map for storing and managing Player objects.
+
+    It offers the same ``__getitem__``/``__setitem__``/``__delitem__``/``__len__`` contract as
+    PlayerHashMap, but instead of a PlayerList of PlayerNodes per bucket it keeps three flat
+    parallel arrays (hashes, keys and players) and resolves collisions with linear probing.
+    There are no per-entry node objects to allocate or pointers to chase, which makes it the
+    lower-memory choice for read-heavy workloads.
+
+    Deleted entries leave a tombstone behind so that probe sequences stay intact. Tombstones
+    are reused by later inserts and purged whenever the table is rebuilt.
+
+    Attributes:
+        SIZE (int): The default (and minimum) number of slots, always a power of two.
+        MAX_LOAD_FACTOR (float): The default fraction of used slots (players and tombstones)
+            above which the table is rebuilt.
+    """
+    SIZE: int = 16
+    MAX_LOAD_FACTOR: float = 0.6
+    _hashes: array
+    _keys: List[str | object | None]
+    _players: List[Player | None]
+
+    def __init__(self, capacity: int | None = None, max_load_factor: float = MAX_LOAD_FACTOR,
+                 hash_strategy: HashStrategy | None = None):
+        """
+        Initialize an empty hash map.
+
+        Args:
+            capacity (int | None): Expected number of players. The initial number of slots is
+                chosen so that this many players fit without a rebuild. Defaults to SIZE slots.
+            max_load_factor (float): Fraction of used slots above which the table is rebuilt.
+            hash_strategy (HashStrategy | None): The hash function used to place keys in slots.
+                Defaults to FNV1aHash.
+
+        Raises:
+            ValueError: If the capacity or load factor is out of range.
+        """
+        if capacity is not None and capacity < 0:
+            raise ValueError("Capacity must be a non-negative integer")
+        # at least one slot has to stay empty, otherwise an unsuccessful lookup would never stop probing
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+
+        self._hash_strategy = hash_strategy if hash_strategy is not None else FNV1aHash()
+        self._max_load_factor = max_load_factor
+        self._length = 0
+        self._tombstones = 0
+        self._allocate(self._size_for(capacity or 0))
+
+    def _size_for(self, players: int) -> int:
+        """
+        Calculate the smallest power of two number of slots that holds the given number of players.
+
+        Args:
+            players (int): The number of players to fit under the maximum load factor.
+
+        Returns:
+            int: The number of slots.
+        """
+        size = self.SIZE
+        while players > size * self._max_load_factor:
+            size *= 2
+        return size
+
+    def _allocate(self, size: int):
+        """
+        Replace the slot arrays with empty ones of the given size.
+
+        Args:
+            size (int): The number of slots, a power of two.
+        """
+        self._hashes = array("Q", bytes(8 * size))
+        self._keys = [None] * size
+        self._players = [None] * size
+        self._mask = size - 1
+
+    @property
+    def bucket_count(self) -> int:
+        """
+        Get the current number of slots.
+
+        Returns:
+            int: The number of slots in the table.
+        """
+        return len(self._keys)
+
+    @property
+    def hash_strategy(self) -> HashStrategy:
+        """
+        Get the hash strategy used to place keys in slots.
+
+        Returns:
+            HashStrategy: The hash strategy of the hash map.
+        """
+        return self._hash_strategy
+
+    @property
+    def load_factor(self) -> float:
+        """
+        Get the current load factor (players per slot, tombstones excluded).
+
+        Returns:
+            float: The number of players divided by the number of slots.
+        """
+        return self._length / len(self._keys)
+
+    def _hash(self, key: str) -> int:
+        """
+        Hash the given key with the hash strategy, truncated to the 64 bits a slot can store.
+
+        Args:
+            key (str): The key to hash.
+
+        Returns:
+            int: The hash value of the key.
+        """
+        return self._hash_strategy(key) & 0xFFFFFFFFFFFFFFFF
+
+    def _find_slot(self, key: str | Player) -> int:
+        """
+        Probe for the slot holding the given key.
+
+        Args:
+            key (str | Player): The key to look for. A Player is looked up by its uid.
+
+        Returns:
+            int: The index of the slot holding the key, or -1 if the key is not in the hash map.
+        """
+        if isinstance(key, Player):
+            key = key.uid
+        key_hash = self._hash(key)
+        hashes, keys, mask = self._hashes, self._keys, self._mask
+        index = key_hash & mask
+
+        while True:
+            slot_key = keys[index]
+            if slot_key is None:
+                return -1
+            # comparing the stored hashes first avoids most of the string comparisons
+            if hashes[index] == key_hash and slot_key == key:
+                return index
+            index = (index + 1) & mask
+
+    def __getitem__(self, key: str | Player) -> Player:
+        """
+        Retrieve a Player object from the hash map using the given key.
+
+        Args:
+            key (str): The key associated with the player to retrieve.
+
+        Returns:
+            Player: The Player object associated with the given key.
+
+        Raises:
+            KeyError: If no player is found with the given key.
+        """
+        index = self._find_slot(key)
+
+        if index < 0:
+            raise KeyError(f"Key {key} not found")
+
+        return self._players[index]
+
+    def __setitem__(self, key: str | Player, name: str):
+        """
+        Insert or update a Player in the hash map with the given key and name.
+
+        Args:
+            key (str): The key for the player.
+            name (str): The name of the player.
+        """
+        if isinstance(key, Player):
+            key = key.uid
+        key_hash = self._hash(key)
+        hashes, keys, mask = self._hashes, self._keys, self._mask
+        index = key_hash & mask
+        free_index = -1
+
+        while True:
+            slot_key = keys[index]
+            if slot_key is None:
+                break
+            if slot_key is _TOMBSTONE:
+                if free_index < 0:
+                    free_index = index
+            elif hashes[index] == key_hash and slot_key == key:
+                self._players[index].name = name
+                return
+            index = (index + 1) & mask
+
+        if free_index < 0:
+            free_index = index
+        else:
+            self._tombstones -= 1
+
+        hashes[free_index] = key_hash
+        keys[free_index] = key
+        self._players[free_index] = Player(key, name)
+        self._length += 1
+
+        if self._length + self._tombstones > len(keys) * self._max_load_factor:
+            self._rebuild()
+
+    def __len__(self) -> int:
+        """
+        Get the number of players currently stored in the hash map.
+
+        Returns:
+            int: The number of players in the hash map.
+        """
+        return self._length
+
+    def __contains__(self, key: str | Player) -> bool:
+        """
+        Check whether a player with the given key is in the hash map.
+
+        Args:
+            key (str | Player): The key to look for.
+
+        Returns:
+            bool: True if the key is in the hash map, False otherwise.
+        """
+        return self._find_slot(key) >= 0
+
+    def get(self, key: str | Player, default: Player | None = None) -> Player | None:
+        """
+        Retrieve a Player object from the hash map, or a default if the key is not present.
+
+        Args:
+            key (str | Player): The key associated with the player to retrieve.
+            default (Player | None): The value to return if the key is not in the hash map.
+
+        Returns:
+            Player | None: The Player object associated with the given key, or the default.
+        """
+        index = self._find_slot(key)
+        return self._players[index] if index >= 0 else default
+
+    # As with a dict, the hash map must not be modified while it is being iterated
+    def __iter__(self):
+        """
+        Lazily iterate over the keys of the hash map, without copying them.
+
+        Yields:
+            str: The uid of each player, in no particular order.
+        """
+        for key in self._keys:
+            if key is not None and key is not _TOMBSTONE:
+                yield key
+
+    def keys(self):
+        """
+        Lazily iterate over the keys of the hash map, without copying them.
+
+        Yields:
+            str: The uid of each player, in no particular order.
+        """
+        return iter(self)
+
+    def values(self):
+        """
+        Lazily iterate over the players of the hash map, without copying them.
+
+        Yields:
+            Player: Each player, in no particular order.
+        """
+        for player in self._players:
+            if player is not None:
+                yield player
+
+    def items(self):
+        """
+        Lazily iterate over the (uid, player) pairs of the hash map, without copying them.
+
+        Yields:
+            Tuple[str, Player]: The uid and the player, in no particular order.
+        """
+        for player in self._players:
+            if player is not None:
+                yield player.uid, player
+
+    def __delitem__(self, key: str | Player):
+        """
+        Delete a Player from the hash map using the given key, leaving a tombstone in its slot.
+
+        Args:
+            key (str): The key of the player to delete.
+
+        Raises:
+            KeyError: If no player is found with the given key.
+        """
+        index = self._find_slot(key)
+
+        if index < 0:
+            raise KeyError(f"Key {key} not found")
+
+        self._keys[index] = _TOMBSTONE
+        self._players[index] = None
+        self._length -= 1
+        self._tombstones += 1
+
+    def _rebuild(self):
+        """
+        Re-insert every player into freshly allocated slot arrays, dropping all tombstones.
+
+        The table doubles only if the players alone would still exceed the load factor,
+        otherwise it is rebuilt at the same size just to purge tombstones. Stored hashes
+        are reused, so the hash strategy is not called again.
+        """
+        old_hashes, old_keys, old_players = self._hashes, self._keys, self._players
+        self._allocate(self._size_for(self._length * 2))
+        self._tombstones = 0
+
+        hashes, keys, players, mask = self._hashes, self._keys, self._players, self._mask
+        for old_index, key in enumerate(old_keys):
+            if key is None or key is _TOMBSTONE:
+                continue
+            key_hash = old_hashes[old_index]
+            index = key_hash & mask
+            while keys[index] is not None:
+                index = (index + 1) & mask
+            hashes[index] = key_hash
+            keys[index] = key
+            players[index] = old_players[old_index]
+
+    def display(self):
+        """
+        Display the contents of the hash map.
+
+        Prints the index and player of each occupied slot.
+        """
+        if len(self) == 0:
+            print("The hash table is empty")
+            return
+
+        for index, player in enumerate(self._players):
+            if player is not None:
+                print(f"Index of the slot {index}: {player}")
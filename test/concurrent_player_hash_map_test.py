@@ -0,0 +1,101 @@
+import unittest
+from threading import Thread
+from player import Player
+from data_stuctures.concurrent_player_hash_map import ConcurrentPlayerHashMap
+
+
+class ConcurrentHashMapTest(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize a new ConcurrentPlayerHashMap for each test."""
+        self.hash_map = ConcurrentPlayerHashMap(stripes=4)
+        self.hash_map["And12rew"] = "Andrew"
+        self.hash_map["Raf34el"] = "Rafael"
+
+    def run_threads(self, target, count: int):
+        threads = [Thread(target=target, args=(number,)) for number in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_basic_operations(self):
+        """Test the single-threaded mapping contract."""
+        self.hash_map["And12rew"] = "Andrii"
+        del self.hash_map["Raf34el"]
+        self.assertEqual(len(self.hash_map), 1)
+        self.assertEqual(self.hash_map["And12rew"].name, "Andrii")
+        self.assertIn("And12rew", self.hash_map)
+        self.assertIsNone(self.hash_map.get("Raf34el"))
+        with self.assertRaises(KeyError):
+            self.hash_map["Raf34el"]
+        with self.assertRaises(KeyError):
+            del self.hash_map["Raf34el"]
+
+    def test_player_keys(self):
+        """Test that a Player key is looked up, updated and deleted by its uid."""
+        player = Player("And12rew", "Andrew")
+
+        self.assertIn(player, self.hash_map)
+        self.assertEqual(self.hash_map.get(player).uid, "And12rew")
+        self.hash_map[player] = "Andrii"
+        self.assertEqual(len(self.hash_map), 2)
+        self.assertEqual(self.hash_map["And12rew"].name, "Andrii")
+        del self.hash_map[player]
+        self.assertNotIn("And12rew", self.hash_map)
+
+    def test_stripes_rounded_to_power_of_two(self):
+        """Test that the number of stripes is a power of two and must be positive."""
+        self.assertEqual(ConcurrentPlayerHashMap(stripes=5).stripe_count, 8)
+        with self.assertRaises(ValueError):
+            ConcurrentPlayerHashMap(stripes=0)
+
+    def test_update_and_views(self):
+        """Test bulk updates and iterating over all segments."""
+        player = Player("Sa45m", "Samuel")
+        self.hash_map.update([player, ("uid1", "name1")])
+        self.assertIs(self.hash_map["Sa45m"], player)
+        self.assertEqual(set(self.hash_map.keys()), {"And12rew", "Raf34el", "Sa45m", "uid1"})
+        self.assertEqual(len(list(self.hash_map.values())), 4)
+        self.assertEqual(dict(self.hash_map.items())["uid1"].name, "name1")
+
+    def test_concurrent_inserts_and_deletes(self):
+        """Stress test threads inserting and deleting disjoint keys while segments resize."""
+        def worker(number: int):
+            for i in range(2000):
+                self.hash_map[f"t{number}-{i}"] = f"name{i}"
+            for i in range(0, 2000, 2):
+                del self.hash_map[f"t{number}-{i}"]
+
+        self.run_threads(worker, 8)
+
+        self.assertEqual(len(self.hash_map), 2 + 8 * 1000)
+        for number in range(8):
+            self.assertNotIn(f"t{number}-0", self.hash_map)
+            self.assertEqual(self.hash_map[f"t{number}-1999"].name, "name1999")
+
+    def test_concurrent_readers_during_incremental_resize(self):
+        """Stress test readers while a writer keeps triggering incremental resizes."""
+        hash_map = ConcurrentPlayerHashMap(stripes=2, incremental_resize=True, rehash_step=1)
+        for i in range(100):
+            hash_map[f"stable{i}"] = "stable"
+        errors = []
+
+        def worker(number: int):
+            if number == 0:
+                for i in range(5000):
+                    hash_map[f"new{i}"] = "new"
+                return
+            for _ in range(20):
+                for i in range(100):
+                    if hash_map.get(f"stable{i}") is None:
+                        errors.append(i)
+
+        self.run_threads(worker, 4)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(hash_map), 5100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from data_stuctures.hash_strategies import SumOfAsciiHash, PolynomialHash, FNV1aHash, SeededHash
+from data_stuctures.player_hash_map import PlayerHashMap
+
+
+class HashStrategiesTest(unittest.TestCase):
+
+    def setUp(self):
+        """Create one instance of every hash strategy."""
+        self.strategies = [SumOfAsciiHash(), PolynomialHash(), FNV1aHash(), SeededHash()]
+
+    def test_sum_of_ascii_matches_legacy_hash(self):
+        """Test that the legacy strategy is the sum of the ASCII values of the key."""
+        self.assertEqual(SumOfAsciiHash()("abc"), 97 + 98 + 99)
+
+    def test_fnv1a_known_values(self):
+        """Test the FNV-1a strategy against the published 64-bit test vectors."""
+        fnv1a = FNV1aHash()
+        self.assertEqual(fnv1a(""), 0xCBF29CE484222325)
+        self.assertEqual(fnv1a("a"), 0xAF63DC4C8601EC8C)
+        self.assertEqual(fnv1a("foobar"), 0x85944171F73967E8)
+
+    def test_position_sensitive_strategies_separate_anagrams(self):
+        """Test that anagrams only collide under the legacy strategy."""
+        self.assertEqual(SumOfAsciiHash()("123"), SumOfAsciiHash()("321"))
+        for strategy in (PolynomialHash(), FNV1aHash(), SeededHash()):
+            self.assertNotEqual(strategy("123"), strategy("321"), repr(strategy))
+
+    def test_seeded_hash_depends_on_seed(self):
+        """Test that the seeded strategy is deterministic per seed and differs between seeds."""
+        self.assertEqual(SeededHash(b"seed")("P000123"), SeededHash(b"seed")("P000123"))
+        self.assertNotEqual(SeededHash(b"seed")("P000123"), SeededHash(b"other")("P000123"))
+
+    def test_seeded_hash_rejects_long_seed(self):
+        """Test that seeds longer than BLAKE2b accepts are rejected."""
+        with self.assertRaises(ValueError):
+            SeededHash(b"x" * 65)
+
+    def test_sequential_uids_spread_over_buckets(self):
+        """Test that sequential uids fill far more buckets than with the legacy strategy."""
+        uids = [f"P{i:06d}" for i in range(1000)]
+        used_legacy = {SumOfAsciiHash()(uid) % 1024 for uid in uids}
+        used_fnv1a = {FNV1aHash()(uid) % 1024 for uid in uids}
+        self.assertGreater(len(used_fnv1a), 4 * len(used_legacy))
+
+    def test_hash_map_works_with_every_strategy(self):
+        """Test inserting, retrieving and deleting players with each strategy."""
+        for strategy in self.strategies:
+            hash_map = PlayerHashMap(hash_strategy=strategy)
+            for i in range(50):
+                hash_map[f"uid{i}"] = f"name{i}"
+            del hash_map["uid7"]
+            self.assertIs(hash_map.hash_strategy, strategy)
+            self.assertEqual(len(hash_map), 49)
+            self.assertEqual(hash_map["uid42"].name, "name42")
+            with self.assertRaises(KeyError):
+                hash_map["uid7"]
+
+
+if __name__ == "__main__":
+    unittest.main()
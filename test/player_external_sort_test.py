@@ -0,0 +1,51 @@
+import os
+import random
+import tempfile
+import unittest
+from player import Player
+from player_external_sort import external_sort_descending
+
+
+class ExternalSortTest(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize players with many repeated scores and a private directory for the runs."""
+        random.seed(20)
+        self.players = [Player(f"P{i:05d}", f"näme{i}", random.randrange(-5, 50)) for i in range(3000)]
+        self.expected = [(player.uid, player.name, player.score)
+                         for player in sorted(self.players, key=lambda player: player.score, reverse=True)]
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def fields(self, players):
+        return [(player.uid, player.name, player.score) for player in players]
+
+    def test_sorts_in_memory_without_spilling(self):
+        result = external_sort_descending(iter(self.players), tmp_dir=self.tmp_dir.name)
+
+        self.assertEqual(self.fields(result), self.expected)
+
+    def test_spilled_runs_are_merged_stably(self):
+        # about 20 players per run, so 150 runs merged in two passes with a fan-in of 8
+        result = external_sort_descending(iter(self.players), memory_budget=4000, max_fan_in=8,
+                                          tmp_dir=self.tmp_dir.name)
+
+        self.assertEqual(self.fields(result), self.expected)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_closing_early_removes_runs(self):
+        result = external_sort_descending(iter(self.players), memory_budget=4000, tmp_dir=self.tmp_dir.name)
+
+        self.assertEqual(next(result).score, 49)
+        self.assertNotEqual(os.listdir(self.tmp_dir.name), [])
+        result.close()
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_empty_input_and_invalid_fan_in(self):
+        self.assertEqual(list(external_sort_descending([], tmp_dir=self.tmp_dir.name)), [])
+        with self.assertRaises(ValueError):
+            list(external_sort_descending(self.players, max_fan_in=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
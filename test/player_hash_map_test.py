@@ -1,6 +1,7 @@
 import unittest
 from player import Player
 from data_stuctures.player_hash_map import PlayerHashMap
+from data_stuctures.hash_strategies import SumOfAsciiHash
 
 
 class HashMapTest(unittest.TestCase):
@@ -78,3 +79,245 @@ class HashMapTest(unittest.TestCase):
         # Ensure some expected output is in the display
         output = captured_output.getvalue()
         self.assertIn("Index of the player_list", output)
+
+    def test_grows_when_load_factor_exceeded(self):
+        """Test that the bucket array doubles once the load factor is crossed."""
+        hash_map = PlayerHashMap()
+        for i in range(8):
+            hash_map[f"uid{i}"] = f"name{i}"
+        self.assertEqual(hash_map.bucket_count, PlayerHashMap.SIZE * 2)
+        self.assertLessEqual(hash_map.load_factor, 0.75)
+        for i in range(8):
+            self.assertEqual(hash_map[f"uid{i}"].name, f"name{i}")
+
+    def test_resize_keeps_player_objects(self):
+        """Test that players are relinked, not re-allocated, when the hash map grows."""
+        player = self.hash_map["And12rew"]
+        for i in range(100):
+            self.hash_map[f"uid{i}"] = f"name{i}"
+        self.assertIs(self.hash_map["And12rew"], player)
+        self.assertEqual(len(self.hash_map), 102)
+
+    def test_capacity_hint(self):
+        """Test that a capacity hint presizes the bucket array so no resize is needed."""
+        hash_map = PlayerHashMap(capacity=1000)
+        bucket_count = hash_map.bucket_count
+        self.assertGreaterEqual(bucket_count * 0.75, 1000)
+        for i in range(1000):
+            hash_map[f"uid{i}"] = f"name{i}"
+        self.assertEqual(hash_map.bucket_count, bucket_count)
+
+    def test_shrinks_when_min_load_factor_set(self):
+        """Test that the bucket array halves when a minimum load factor is given."""
+        hash_map = PlayerHashMap(min_load_factor=0.2)
+        for i in range(100):
+            hash_map[f"uid{i}"] = f"name{i}"
+        grown_bucket_count = hash_map.bucket_count
+        for i in range(95):
+            del hash_map[f"uid{i}"]
+        self.assertLess(hash_map.bucket_count, grown_bucket_count)
+        self.assertGreaterEqual(hash_map.bucket_count, PlayerHashMap.SIZE)
+        for i in range(95, 100):
+            self.assertEqual(hash_map[f"uid{i}"].name, f"name{i}")
+
+    def test_invalid_load_factors(self):
+        """Test that out of range load factors are rejected."""
+        with self.assertRaises(ValueError):
+            PlayerHashMap(max_load_factor=0)
+        with self.assertRaises(ValueError):
+            PlayerHashMap(max_load_factor=0.75, min_load_factor=0.5)
+
+    def test_from_iterable_players_and_pairs(self):
+        """Test building a hash map from Player objects and (uid, name) pairs."""
+        hash_map = PlayerHashMap.from_iterable([self.player1, ("Raf34el", "Rafael"), self.player3])
+        self.assertEqual(len(hash_map), 3)
+        self.assertIs(hash_map["And12rew"], self.player1)
+        self.assertEqual(hash_map["Raf34el"].name, "Rafael")
+
+    def test_from_iterable_presizes(self):
+        """Test that a bulk load sizes the bucket array once, from a generator as well."""
+        hash_map = PlayerHashMap.from_iterable((f"uid{i}", f"name{i}") for i in range(1000))
+        self.assertEqual(len(hash_map), 1000)
+        self.assertLessEqual(hash_map.load_factor, PlayerHashMap.MAX_LOAD_FACTOR)
+        self.assertEqual(hash_map["uid999"].name, "name999")
+
+    def test_update_deduplicates(self):
+        """Test that repeated uids in a bulk update keep the last occurrence."""
+        self.hash_map.update([("uid1", "first"), ("uid1", "second"), ("And12rew", "Andrii")])
+        self.assertEqual(len(self.hash_map), 3)
+        self.assertEqual(self.hash_map["uid1"].name, "second")
+        self.assertEqual(self.hash_map["And12rew"].name, "Andrii")
+
+    def test_update_replaces_player_object(self):
+        """Test that updating with a Player object re-points an existing uid to it."""
+        replacement = Player("And12rew", "Andrew", 50)
+        self.hash_map.update([replacement])
+        self.assertEqual(len(self.hash_map), 2)
+        self.assertIs(self.hash_map["And12rew"], replacement)
+
+    def test_export_stats_structure(self):
+        """Test the structural figures exported without operation tracking."""
+        stats = self.hash_map.export_stats()
+        self.assertIsNone(self.hash_map.stats)
+        self.assertNotIn("operations", stats)
+        self.assertEqual(stats["length"], 2)
+        self.assertEqual(stats["bucket_count"], PlayerHashMap.SIZE)
+        self.assertAlmostEqual(stats["load_factor"], 0.2)
+        self.assertEqual(sum(stats["chain_length_histogram"].values()), PlayerHashMap.SIZE)
+        self.assertEqual(sum(length * buckets for length, buckets in stats["chain_length_histogram"].items()), 2)
+        self.assertGreaterEqual(stats["max_chain_length"], 1)
+
+    def test_operation_counters(self):
+        """Test that tracked get/set/delete operations count calls, misses and comparisons."""
+        hash_map = PlayerHashMap(track_stats=True)
+        hash_map["uid1"] = "name1"
+        hash_map["uid1"] = "renamed"
+        hash_map["uid1"]
+        with self.assertRaises(KeyError):
+            hash_map["missing"]
+        del hash_map["uid1"]
+
+        operations = hash_map.export_stats()["operations"]
+        self.assertEqual(operations["set"]["count"], 2)
+        self.assertEqual(operations["set"]["misses"], 1)
+        self.assertEqual(operations["get"]["count"], 2)
+        self.assertEqual(operations["get"]["misses"], 1)
+        self.assertEqual(operations["get"]["comparisons"], 1)
+        self.assertEqual(operations["delete"]["count"], 1)
+        self.assertEqual(operations["delete"]["max_comparisons"], 1)
+
+    def test_resize_counter(self):
+        """Test that resizes are counted and the counters can be reset."""
+        hash_map = PlayerHashMap(track_stats=True)
+        for i in range(100):
+            hash_map[f"uid{i}"] = f"name{i}"
+        self.assertGreater(hash_map.stats.resizes, 0)
+        hash_map.stats.reset()
+        self.assertEqual(hash_map.stats.as_dict()["set"]["count"], 0)
+
+    def test_incremental_resize_migrates_gradually(self):
+        """Test that an incremental resize keeps both arrays and migrates a few buckets per operation."""
+        hash_map = PlayerHashMap(incremental_resize=True, rehash_step=1)
+        for i in range(8):
+            hash_map[f"uid{i}"] = f"name{i}"
+        self.assertTrue(hash_map.is_rehashing)
+        self.assertEqual(hash_map.bucket_count, PlayerHashMap.SIZE * 2)
+
+        # lookups find players in both arrays while the migration is in progress
+        for i in range(8):
+            self.assertEqual(hash_map[f"uid{i}"].name, f"name{i}")
+        self.assertTrue(hash_map.is_rehashing)
+
+        # each of the 10 old buckets takes one operation to migrate
+        hash_map["uid0"]
+        hash_map["uid1"]
+        self.assertFalse(hash_map.is_rehashing)
+        self.assertEqual(len(hash_map), 8)
+
+    def test_display_during_incremental_resize(self):
+        """Test that display lists the not yet migrated old buckets by their index in the old array."""
+        import io
+        import sys
+        hash_map = PlayerHashMap(incremental_resize=True, rehash_step=1)
+        for i in range(8):
+            hash_map[f"uid{i}"] = f"name{i}"
+        self.assertTrue(hash_map.is_rehashing)
+        old_indices = [index for index in range(hash_map._rehash_index, len(hash_map._old_hashmap))
+                       if hash_map._old_hashmap[index] is not None and not hash_map._old_hashmap[index].is_empty]
+        self.assertTrue(old_indices)
+
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        hash_map.display()
+        sys.stdout = sys.__stdout__
+
+        new_section, old_section = captured_output.getvalue().split("Buckets of the old array not yet migrated\n")
+        new_indices = [int(line.rsplit(" ", 1)[1]) for line in new_section.splitlines()
+                       if line.startswith("Index of the player_list")]
+        self.assertTrue(all(index < hash_map.bucket_count for index in new_indices))
+        self.assertEqual([int(line.rsplit(" ", 1)[1]) for line in old_section.splitlines()
+                          if line.startswith("Index of the old player_list")], old_indices)
+
+    def test_incremental_resize_mutations_during_migration(self):
+        """Test inserting, updating and deleting players while an incremental resize is in progress."""
+        hash_map = PlayerHashMap(incremental_resize=True, rehash_step=1)
+        for i in range(8):
+            hash_map[f"uid{i}"] = f"name{i}"
+        self.assertTrue(hash_map.is_rehashing)
+
+        del hash_map["uid3"]
+        hash_map["uid5"] = "renamed"
+        hash_map["new"] = "player"
+        self.assertEqual(len(hash_map), 8)
+        self.assertEqual(hash_map.export_stats()["length"], 8)
+        self.assertEqual(sum(length * buckets
+                             for length, buckets in hash_map.chain_length_histogram().items()), 8)
+        with self.assertRaises(KeyError):
+            hash_map["uid3"]
+        self.assertEqual(hash_map["uid5"].name, "renamed")
+        self.assertEqual(hash_map["new"].name, "player")
+
+    def test_incremental_resize_many_players(self):
+        """Test that back to back incremental resizes never lose players."""
+        hash_map = PlayerHashMap(incremental_resize=True, min_load_factor=0.1)
+        for i in range(5000):
+            hash_map[f"uid{i}"] = f"name{i}"
+        for i in range(0, 5000, 2):
+            del hash_map[f"uid{i}"]
+        self.assertEqual(len(hash_map), 2500)
+        for i in range(1, 5000, 2):
+            self.assertEqual(hash_map[f"uid{i}"].name, f"name{i}")
+
+    def test_contains_and_get(self):
+        """Test membership checks and lookups with a default."""
+        self.assertIn("And12rew", self.hash_map)
+        self.assertNotIn("missing", self.hash_map)
+        self.assertEqual(self.hash_map.get("Raf34el").name, "Rafael")
+        self.assertIsNone(self.hash_map.get("missing"))
+        self.assertIs(self.hash_map.get("missing", self.player3), self.player3)
+
+    def test_player_keys(self):
+        """Test that a Player key is looked up, updated and deleted by its uid."""
+        for hash_map in (self.hash_map, PlayerHashMap.from_iterable([self.player1, self.player2], track_stats=True)):
+            with self.subTest(track_stats=hash_map.stats is not None):
+                self.assertIn(self.player1, hash_map)
+                self.assertEqual(hash_map.get(self.player2).uid, "Raf34el")
+                self.assertEqual(hash_map[self.player1].uid, "And12rew")
+
+                hash_map[self.player1] = "Andrii"
+
+                self.assertEqual(len(hash_map), 2)
+                self.assertEqual(hash_map["And12rew"].name, "Andrii")
+                self.assertEqual(set(hash_map), {"And12rew", "Raf34el"})
+                del hash_map[self.player2]
+                self.assertNotIn("Raf34el", hash_map)
+
+    def test_views(self):
+        """Test iterating over keys, values and items."""
+        self.assertEqual(set(self.hash_map), {"And12rew", "Raf34el"})
+        self.assertEqual(set(self.hash_map.keys()), {"And12rew", "Raf34el"})
+        self.assertEqual({player.name for player in self.hash_map.values()}, {"Andrew", "Rafael"})
+        self.assertEqual({uid: player.name for uid, player in self.hash_map.items()},
+                         {"And12rew": "Andrew", "Raf34el": "Rafael"})
+
+    def test_views_during_incremental_resize(self):
+        """Test that iteration covers both bucket arrays while a resize is in progress."""
+        hash_map = PlayerHashMap(incremental_resize=True, rehash_step=1)
+        for i in range(8):
+            hash_map[f"uid{i}"] = f"name{i}"
+        self.assertTrue(hash_map.is_rehashing)
+        self.assertEqual(sorted(hash_map), sorted(f"uid{i}" for i in range(8)))
+
+    def test_delete_from_middle_of_chain(self):
+        """Test deleting a player that is neither the head nor the tail of its chain."""
+        hash_map = PlayerHashMap(hash_strategy=SumOfAsciiHash())
+        for uid in ("123", "231", "321"):  # anagrams share a bucket under the sum of ASCII values
+            hash_map[uid] = uid
+        chain = hash_map.hashmap[hash_map.get_index("123")]
+        middle_key = chain.head.player_next_node.key
+
+        del hash_map[middle_key]
+
+        self.assertNotIn(middle_key, hash_map)
+        self.assertEqual(len(chain), 2)
+        self.assertEqual(len(hash_map), 2)
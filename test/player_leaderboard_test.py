@@ -0,0 +1,113 @@
+import math
+import random
+import unittest
+from player import Player
+from player_leaderboard import PlayerLeaderboard
+
+
+class PlayerLeaderboardTest(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize a leaderboard of players with many repeated scores."""
+        random.seed(24)
+        self.players = [Player(f"P{i:04d}", f"name{i}", random.randrange(1, 100)) for i in range(1000)]
+        self.leaderboard = PlayerLeaderboard(self.players)
+
+    def expected_uids(self):
+        return [player.uid for player in sorted(self.players, key=lambda player: (-player.score, player.uid))]
+
+    def assert_consistent(self):
+        """Check every query against a full sort, and the link widths of every level."""
+        expected = self.expected_uids()
+
+        self.assertEqual(len(self.leaderboard), len(expected))
+        self.assertEqual([player.uid for player in self.leaderboard], expected)
+        for rank, uid in enumerate(expected, 1):
+            self.assertEqual(self.leaderboard.rank_of(uid), rank)
+            self.assertEqual(self.leaderboard.player_at(rank).uid, uid)
+        for level in range(self.leaderboard._height):
+            node, span = self.leaderboard._head, 0
+            while node is not None:
+                span += node.width[level]
+                node = node.next[level]
+            self.assertEqual(span, len(expected) + 1)
+
+    def test_ranks_by_descending_score_then_uid(self):
+        self.assert_consistent()
+        self.assertEqual(self.leaderboard.rank_of(self.leaderboard.player_at(1)), 1)
+
+    def test_score_changes_move_players(self):
+        for _ in range(500):
+            random.choice(self.players).score = random.randrange(1, 100)
+
+        self.assert_consistent()
+
+    def test_range(self):
+        expected = self.expected_uids()
+
+        self.assertEqual([player.uid for player in self.leaderboard.range(1, 10)], expected[:10])
+        self.assertEqual([player.uid for player in self.leaderboard.range(500, 520)], expected[499:520])
+        self.assertEqual([player.uid for player in self.leaderboard.range(-5, 2)], expected[:2])
+        self.assertEqual([player.uid for player in self.leaderboard.range(999, 5000)], expected[998:])
+        self.assertEqual(self.leaderboard.range(20, 10), [])
+
+    def test_add_and_remove(self):
+        removed = self.leaderboard.remove(self.players[0].uid)
+        self.leaderboard.remove(self.players[1])
+        del self.players[:2]
+
+        self.assertEqual(removed.uid, "P0000")
+        self.assertNotIn("P0000", self.leaderboard)
+        removed.score = 1000
+        self.assert_consistent()
+
+        self.leaderboard.add(removed)
+        self.players.append(removed)
+        self.assertEqual(self.leaderboard.player_at(1).uid, "P0000")
+        self.assert_consistent()
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.leaderboard.add(Player("P0000", "duplicate", 5))
+        with self.assertRaises(KeyError):
+            self.leaderboard.rank_of("missing")
+        with self.assertRaises(KeyError):
+            self.leaderboard.remove("missing")
+        for rank in (0, 1001):
+            with self.assertRaises(IndexError):
+                self.leaderboard.player_at(rank)
+
+    def test_empty_leaderboard(self):
+        leaderboard = PlayerLeaderboard()
+
+        self.assertEqual(len(leaderboard), 0)
+        self.assertEqual(list(leaderboard), [])
+        self.assertEqual(leaderboard.range(1, 10), [])
+        with self.assertRaises(IndexError):
+            leaderboard.player_at(1)
+
+    def test_skip_list_height_is_logarithmic(self):
+        for player in self.players[:990]:
+            self.leaderboard.remove(player)
+        self.assertLessEqual(self.leaderboard._height, 10)
+
+        for index in range(1000, 2 ** 14):
+            self.leaderboard.add(Player(f"P{index:05d}", "name", random.randrange(1, 100)))
+        self.assertLessEqual(self.leaderboard._height, 3 * math.log2(len(self.leaderboard)))
+
+    def test_several_leaderboards_follow_the_same_player(self):
+        other = PlayerLeaderboard(self.players[:10])
+
+        self.players[5].score = 1000
+
+        self.assertEqual(self.leaderboard.player_at(1).uid, "P0005")
+        self.assertEqual(other.player_at(1).uid, "P0005")
+        other.remove(self.players[5])
+        self.players[5].score = 1
+        self.assertEqual(self.leaderboard.rank_of("P0005"), self.expected_uids().index("P0005") + 1)
+        self.assertEqual([player.uid for player in other],
+                         [uid for uid in self.expected_uids() if uid < "P0010" and uid != "P0005"])
+
+
+if __name__ == "__main__":
+    unittest.main()
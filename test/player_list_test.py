@@ -2,6 +2,7 @@ import unittest
 from player import Player
 from player_node import PlayerNode
 from player_list import PlayerList
+from player_node_pool import PlayerNodePool
 
 
 class PlayerListTest(unittest.TestCase):
@@ -170,6 +171,313 @@ class PlayerListTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.player_list.push_front(self.player_node1)
 
+    def test_pop_front_keeps_rest_of_list(self):
+        self.player_list.push_back(self.player_node1)
+        self.player_list.push_back(self.player_node2)
+        self.player_list.push_back(self.player_node3)
+
+        removed_node = self.player_list.pop_from_front()
+
+        self.assertEqual(removed_node, self.player_node1)
+        self.assertIsNone(removed_node.player_next_node, "Removed node's next_node should be cleared")
+        self.assertEqual([node.key for node in self.player_list.iterate()], ["2", "3"])
+        self.assertEqual(len(self.player_list), 2)
+
+    def test_pop_back_keeps_rest_of_list(self):
+        self.player_list.push_back(self.player_node1)
+        self.player_list.push_back(self.player_node2)
+        self.player_list.push_back(self.player_node3)
+
+        removed_node = self.player_list.pop_from_back()
+
+        self.assertEqual(removed_node, self.player_node3)
+        self.assertIsNone(removed_node.player_prev_node, "Removed node's previous_node should be cleared")
+        self.assertEqual([node.key for node in self.player_list.iterate(forward=False)], ["2", "1"])
+
+    def test_remove_node_middle(self):
+        self.player_list.push_back(self.player_node1)
+        self.player_list.push_back(self.player_node2)
+        self.player_list.push_back(self.player_node3)
+
+        removed_node = self.player_list.remove_node(self.player_node2)
+
+        self.assertEqual(removed_node, self.player_node2)
+        self.assertIsNone(removed_node.player_prev_node)
+        self.assertIsNone(removed_node.player_next_node)
+        self.assertEqual(self.player_list.head.player_next_node, self.player_node3)
+        self.assertEqual(self.player_list.tail.player_prev_node, self.player_node1)
+        self.assertEqual(len(self.player_list), 2)
+
+    def test_remove_node_only_node(self):
+        self.player_list.push_back(self.player_node1)
+
+        self.player_list.remove_node(self.player_node1)
+
+        self.assertTrue(self.player_list.is_empty)
+        self.assertIsNone(self.player_list.head)
+        self.assertIsNone(self.player_list.tail)
+
+    def test_remove_node_not_in_list(self):
+        self.player_list.push_back(self.player_node1)
+
+        with self.assertRaises(ValueError):
+            self.player_list.remove_node(self.player_node2)
+        self.assertEqual(len(self.player_list), 1)
+
+    def test_player_node_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.player_node1, "__dict__"), "PlayerNode should use __slots__")
+
+    def test_find_node_by_key(self):
+        self.player_list.push_back(self.player_node1)
+        self.player_list.push_back(self.player_node2)
+
+        self.assertEqual(self.player_list.find_node_by_key("2"), self.player_node2)
+        self.assertIsNone(self.player_list.find_node_by_key("3"))
+
+    def test_uid_index_follows_pops(self):
+        self.player_list.push_back(self.player_node1)
+        self.player_list.push_back(self.player_node2)
+        self.player_list.push_back(self.player_node3)
+
+        self.player_list.pop_from_front()
+        self.player_list.pop_by_uid("3")
+
+        self.assertIsNone(self.player_list.find_node_by_key("1"))
+        self.assertIsNone(self.player_list.find_node_by_key("3"))
+        self.assertEqual(self.player_list.find_node_by_key("2"), self.player_node2)
+        # popped uids can be added again
+        self.player_list.push_front(self.player_node1)
+        self.assertEqual(self.player_list.head, self.player_node1)
+
+    def test_uid_index_enabled_by_default(self):
+        self.assertTrue(PlayerList().is_indexed)
+        self.assertFalse(PlayerList(index_uids=False).is_indexed)
+
+    def assert_consistent(self, player_list, expected_keys):
+        """Checks the keys in both directions, the length, head/tail and is_empty of a list."""
+        self.assertEqual([node.key for node in player_list.iterate()], expected_keys)
+        self.assertEqual([node.key for node in player_list.iterate(forward=False)], expected_keys[::-1])
+        self.assertEqual(len(player_list), len(expected_keys))
+        self.assertEqual(player_list.is_empty, not expected_keys)
+        if expected_keys:
+            self.assertIsNone(player_list.head.player_prev_node)
+            self.assertIsNone(player_list.tail.player_next_node)
+        for key in expected_keys:
+            self.assertEqual(player_list.find_node_by_key(key).key, key)
+
+    def make_list(self, *uids):
+        player_list = PlayerList(index_uids=self.player_list.is_indexed)
+        player_list.extend(Player(uid, uid) for uid in uids)
+        return player_list
+
+    def test_extend_with_players_and_nodes(self):
+        self.player_list.push_back(self.player_node1)
+
+        self.player_list.extend([self.player_node2, Player("4", "Cam"), self.player_node3])
+
+        self.assert_consistent(self.player_list, ["1", "2", "4", "3"])
+
+    def test_extend_empty_list_and_empty_batch(self):
+        self.player_list.extend([])
+        self.assert_consistent(self.player_list, [])
+
+        self.player_list.extend(iter([self.player_node1, self.player_node2]))
+        self.assert_consistent(self.player_list, ["1", "2"])
+
+    def test_extend_rejects_duplicates_atomically(self):
+        self.player_list.push_back(self.player_node1)
+
+        with self.assertRaises(ValueError):
+            self.player_list.extend([self.player_node2, Player("1", "Bob")])
+        with self.assertRaises(ValueError):
+            self.player_list.extend([self.player_node2, Player("2", "Bob")])
+        self.assert_consistent(self.player_list, ["1"])
+
+    def test_concat(self):
+        self.player_list.extend([self.player_node1, self.player_node2])
+        other = self.make_list("3", "4")
+
+        self.player_list.concat(other)
+
+        self.assert_consistent(self.player_list, ["1", "2", "3", "4"])
+        self.assert_consistent(other, [])
+
+    def test_concat_into_empty_list(self):
+        other = self.make_list("3", "4")
+
+        self.player_list.concat(other)
+        self.player_list.concat(PlayerList())
+
+        self.assert_consistent(self.player_list, ["3", "4"])
+
+    def test_concat_mixed_indexing(self):
+        self.player_list.extend([self.player_node1, self.player_node2])
+        for other_indexed in (True, False):
+            other = PlayerList(index_uids=other_indexed)
+            other.push_back(PlayerNode(Player("2", "Bob")))
+            with self.assertRaises(ValueError):
+                self.player_list.concat(other)
+            self.assertEqual(len(other), 1)
+
+            other.pop_from_back()
+            other.push_back(PlayerNode(Player(f"new{other_indexed}", "Bob")))
+            self.player_list.concat(other)
+        self.assert_consistent(self.player_list, ["1", "2", "newTrue", "newFalse"])
+
+    def test_concat_rejects_duplicates_and_self(self):
+        self.player_list.extend([self.player_node1, self.player_node2])
+        other = self.make_list("3", "1")
+
+        with self.assertRaises(ValueError):
+            self.player_list.concat(other)
+        with self.assertRaises(ValueError):
+            self.player_list.concat(self.player_list)
+        self.assert_consistent(self.player_list, ["1", "2"])
+        self.assert_consistent(other, ["3", "1"])
+
+    def test_splice_in_middle_front_and_back(self):
+        self.player_list.extend([self.player_node1, self.player_node2])
+
+        self.player_list.splice(self.player_node1, self.make_list("a", "b"))
+        self.player_list.splice(None, self.make_list("c"))
+        self.player_list.splice(self.player_list.tail, self.make_list("d"))
+
+        self.assert_consistent(self.player_list, ["c", "1", "a", "b", "2", "d"])
+
+    def test_splice_after_foreign_node(self):
+        self.player_list.extend([self.player_node1, self.player_node2])
+
+        with self.assertRaises(ValueError):
+            self.player_list.splice(self.player_node3, self.make_list("a"))
+        self.assert_consistent(self.player_list, ["1", "2"])
+
+    def test_push_and_pop_players_without_pool(self):
+        self.player_list.push_player_back(self.player1)
+        self.player_list.push_player_front(self.player2)
+
+        self.assertIs(self.player_list.head.player, self.player2)
+        self.assertIs(self.player_list.pop_player_from_back(), self.player1)
+        self.assertIs(self.player_list.pop_player_from_front(), self.player2)
+        self.assertTrue(self.player_list.is_empty)
+
+    def test_pooled_nodes_are_recycled(self):
+        pool = PlayerNodePool()
+        player_list = PlayerList(index_uids=self.player_list.is_indexed, node_pool=pool)
+
+        player_list.push_player_back(self.player1)
+        first_node = player_list.head
+        player_list.push_player_back(self.player2)
+        self.assertIs(player_list.pop_player_from_front(), self.player1)
+        self.assertIsNone(first_node.player_next_node, "Recycled node should have its references cleared")
+        player_list.push_player_back(self.player3)
+
+        self.assertIs(player_list.tail, first_node)
+        self.assertIs(player_list.tail.player, self.player3)
+        self.assertEqual(player_list.find_node_by_key("3"), first_node)
+        self.assertEqual((pool.hits, pool.misses), (1, 2))
+
+    def test_pooled_push_duplicate_returns_node(self):
+        pool = PlayerNodePool()
+        player_list = PlayerList(index_uids=self.player_list.is_indexed, node_pool=pool)
+        player_list.push_player_back(self.player1)
+
+        with self.assertRaises(ValueError):
+            player_list.push_player_front(Player("1", "Bob"))
+        self.assertEqual(len(pool), 1)
+        self.assertEqual(len(player_list), 1)
+
+    def test_getitem(self):
+        player_list = self.make_list(*map(str, range(10)))
+
+        self.assertEqual(player_list[0].key, "0")
+        self.assertEqual(player_list[7].key, "7")
+        self.assertEqual(player_list[-1].key, "9")
+        self.assertEqual(player_list[-10].key, "0")
+        self.assertEqual([player_list[i].key for i in (3, 4, 2, 8, 1, 9)], ["3", "4", "2", "8", "1", "9"])
+        for index in (10, -11):
+            with self.assertRaises(IndexError):
+                player_list[index]
+        with self.assertRaises(TypeError):
+            player_list["1"]
+
+    def test_getitem_slices(self):
+        player_list = self.make_list(*map(str, range(10)))
+        keys = [str(i) for i in range(10)]
+
+        for index in (slice(5, 8), slice(None), slice(2, None, 3), slice(None, None, -1),
+                      slice(8, 1, -2), slice(-3, None), slice(7, 3), slice(20, 30)):
+            self.assertEqual([node.key for node in player_list[index]], keys[index])
+        self.assertEqual(player_list[4].key, "4")
+
+    def test_getitem_after_mutations(self):
+        player_list = self.make_list("1", "2", "3", "4")
+        self.assertEqual(player_list[2].key, "3")
+
+        player_list.push_front(PlayerNode(Player("0", "0")))
+        self.assertEqual(player_list[2].key, "2")
+        player_list.pop_by_uid("1")
+        self.assertEqual(player_list[2].key, "3")
+        player_list.push_back(PlayerNode(Player("5", "5")))
+        self.assertEqual(player_list[3].key, "4")
+        player_list.splice(player_list[0], self.make_list("a", "b"))
+        self.assertEqual([player_list[i].key for i in range(len(player_list))], ["0", "a", "b", "2", "3", "4", "5"])
+        player_list.extend([Player("6", "6")])
+        self.assertEqual(player_list[3].key, "2")
+        self.assertEqual(player_list[-1].key, "6")
+
+        other = self.make_list("x", "y")
+        self.assertEqual(other[1].key, "y")
+        player_list.concat(other)
+        self.assertEqual(other[:], [])
+        with self.assertRaises(IndexError):
+            other[0]
+
+    def test_pop_many(self):
+        player_list = self.make_list(*map(str, range(8)))
+
+        removed, missing = player_list.pop_many(["6", "x", "0", "3", "7", "6", "y"])
+
+        self.assertEqual([node.key for node in removed], ["0", "3", "6", "7"])
+        self.assertEqual(missing, ["x", "y"])
+        for node in removed:
+            self.assertIsNone(node.player_prev_node)
+            self.assertIsNone(node.player_next_node)
+        self.assert_consistent(player_list, ["1", "2", "4", "5"])
+        self.assertIsNone(player_list.find_node_by_key("3"))
+
+    def test_pop_many_everything_and_nothing(self):
+        player_list = self.make_list("1", "2", "3")
+
+        self.assertEqual(player_list.pop_many(["9"]), ([], ["9"]))
+        self.assertEqual(player_list.pop_many([]), ([], []))
+        self.assert_consistent(player_list, ["1", "2", "3"])
+
+        removed, missing = player_list.pop_many(["3", "1", "2"])
+        self.assertEqual([node.key for node in removed], ["1", "2", "3"])
+        self.assertEqual(missing, [])
+        self.assert_consistent(player_list, [])
+        player_list.push_back(self.player_node1)
+        self.assert_consistent(player_list, ["1"])
+
+    def test_remove_where(self):
+        player_list = self.make_list(*map(str, range(10)))
+        self.assertEqual(player_list[5].key, "5")
+
+        removed = player_list.remove_where(lambda node: int(node.key) % 3 == 0)
+
+        self.assertEqual([node.key for node in removed], ["0", "3", "6", "9"])
+        self.assert_consistent(player_list, ["1", "2", "4", "5", "7", "8"])
+        self.assertEqual(player_list[3].key, "5")
+        self.assertEqual(player_list.remove_where(lambda node: False), [])
+
+
+class UnindexedPlayerListTest(PlayerListTest):
+    """Runs every PlayerList test again with the uid index disabled."""
+
+    def setUp(self):
+        super().setUp()
+        self.player_list = PlayerList(index_uids=False)
+
 
 if __name__ == "__main__":
     unittest.main()
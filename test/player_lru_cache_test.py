@@ -0,0 +1,114 @@
+import unittest
+from player import Player
+from data_stuctures.player_lru_cache import PlayerLRUCache
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class PlayerLRUCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize a cache of three players and a list of evicted players for each test."""
+        self.evicted = []
+        self.clock = FakeClock()
+        self.cache = PlayerLRUCache(3, on_evict=self.evicted.append, clock=self.clock)
+        self.players = [Player(str(uid), f"name{uid}") for uid in range(6)]
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            PlayerLRUCache(0)
+        with self.assertRaises(ValueError):
+            PlayerLRUCache(1, ttl=0)
+        with self.assertRaises(ValueError):
+            self.cache["1"] = self.players[0]
+
+    def test_get_and_put(self):
+        self.cache.put(self.players[0])
+        self.cache["1"] = self.players[1]
+
+        self.assertIs(self.cache.get("0"), self.players[0])
+        self.assertIs(self.cache[self.players[1]], self.players[1])
+        self.assertIsNone(self.cache.get("2"))
+        with self.assertRaises(KeyError):
+            self.cache["2"]
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 2))
+
+    def test_evicts_least_recently_used(self):
+        for player in self.players[:3]:
+            self.cache.put(player)
+        self.cache.get("0")
+
+        self.cache.put(self.players[3])
+
+        self.assertEqual(list(self.cache), ["3", "0", "2"])
+        self.assertEqual([player.uid for player in self.evicted], ["1"])
+        self.assertNotIn("1", self.cache)
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_put_existing_replaces_and_refreshes(self):
+        for player in self.players[:3]:
+            self.cache.put(player)
+        replacement = Player("0", "Bob")
+
+        self.cache.put(replacement)
+        self.cache.put(self.players[3])
+
+        self.assertIs(self.cache.get("0"), replacement)
+        self.assertEqual(list(self.cache), ["0", "3", "2"])
+        self.assertEqual(len(self.cache), 3)
+
+    def test_delete_does_not_call_callback(self):
+        self.cache.put(self.players[0])
+
+        del self.cache["0"]
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.evicted, [])
+        with self.assertRaises(KeyError):
+            del self.cache["0"]
+
+    def test_ttl(self):
+        cache = PlayerLRUCache(3, ttl=10, on_evict=self.evicted.append, clock=self.clock)
+        cache.put(self.players[0])
+        self.clock.now = 5
+        cache.put(self.players[1])
+
+        self.clock.now = 10
+        self.assertNotIn("0", cache)
+        self.assertIsNone(cache.get("0"))
+        self.assertIs(cache.get("1"), self.players[1])
+        self.assertEqual(cache.stats(), {"size": 1, "capacity": 3, "hits": 1, "misses": 1,
+                                         "evictions": 0, "expirations": 1})
+        self.assertEqual(self.evicted, [self.players[0]])
+
+    def test_full_cache_drops_expired_before_evicting(self):
+        cache = PlayerLRUCache(3, ttl=10, on_evict=self.evicted.append, clock=self.clock)
+        for player in self.players[:2]:
+            cache.put(player)
+        self.clock.now = 5
+        cache.put(self.players[2])
+        cache.get("0")
+
+        self.clock.now = 12
+        cache.put(self.players[3])
+
+        self.assertEqual(sorted(cache), ["2", "3"])
+        self.assertEqual((cache.expirations, cache.evictions), (2, 0))
+
+        cache.put(self.players[4])
+        cache.put(self.players[5])
+        self.assertEqual(list(cache), ["5", "4", "3"])
+        self.assertEqual(cache.evictions, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
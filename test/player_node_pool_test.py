@@ -0,0 +1,71 @@
+import unittest
+from player import Player
+from player_node import PlayerNode
+from player_node_pool import PlayerNodePool
+
+
+class PlayerNodePoolTest(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize a small pool and a couple of players for each test"""
+        self.pool = PlayerNodePool(max_size=2)
+        self.player1 = Player("1", "Andrew")
+        self.player2 = Player("2", "Rafael")
+
+    def test_acquire_from_empty_pool_allocates(self):
+        node = self.pool.acquire(self.player1)
+
+        self.assertIsInstance(node, PlayerNode)
+        self.assertIs(node.player, self.player1)
+        self.assertEqual(self.pool.misses, 1)
+        self.assertEqual(self.pool.hits, 0)
+
+    def test_release_and_reuse(self):
+        node = self.pool.acquire(self.player1)
+        node.player_next_node = PlayerNode(self.player2)
+
+        self.pool.release(node)
+        self.assertEqual(len(self.pool), 1)
+        self.assertIsNone(node.player_next_node, "Released node's references should be cleared")
+
+        reused_node = self.pool.acquire(self.player2)
+        self.assertIs(reused_node, node)
+        self.assertIs(reused_node.player, self.player2)
+        self.assertEqual(self.pool.hits, 1)
+
+    def test_pool_size_limit(self):
+        for uid in "abc":
+            self.pool.release(PlayerNode(Player(uid, uid)))
+
+        self.assertEqual(len(self.pool), 2)
+        self.assertEqual(self.pool.stats()["discarded"], 1)
+
+    def test_preallocate(self):
+        pool = PlayerNodePool(max_size=8, preallocate=16)
+
+        self.assertEqual(len(pool), 8)
+        pool.acquire(self.player1)
+        self.assertEqual(pool.stats(), {"free": 7, "max_size": 8, "hits": 1, "misses": 0, "discarded": 0})
+
+    def test_acquire_requires_player(self):
+        with self.assertRaises(ValueError):
+            self.pool.acquire(None)
+
+    def test_failed_acquire_keeps_free_node(self):
+        """An invalid player leaves the free nodes of the pool untouched."""
+        pool = PlayerNodePool(max_size=4, preallocate=4)
+
+        with self.assertRaises(ValueError):
+            pool.acquire(None)
+
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(pool.hits, 0)
+        self.assertIs(pool.acquire(self.player1).player, self.player1)
+
+    def test_negative_sizes(self):
+        with self.assertRaises(ValueError):
+            PlayerNodePool(max_size=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import random
+import unittest
+from multiprocessing import shared_memory
+from unittest import mock
+import player_parallel_sort
+from player import Player
+from player_parallel_sort import parallel_argsort_descending, parallel_sort_descending
+
+
+class ParallelSortTest(unittest.TestCase):
+
+    def setUp(self):
+        """Sort even tiny inputs with the process pool."""
+        patcher = mock.patch.object(player_parallel_sort, "MIN_PARALLEL_SIZE", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        random.seed(21)
+
+    def test_sorts_scores(self):
+        for scores in ([], [5], [random.randrange(-1000, 1000) for _ in range(5000)], list(range(3000)), [7] * 100):
+            for workers in (1, 3):
+                with self.subTest(size=len(scores), workers=workers):
+                    self.assertEqual(parallel_sort_descending(scores, workers), sorted(scores, reverse=True))
+
+    def test_sorts_players_stably(self):
+        players = [Player(f"P{i:05d}", "name", random.randrange(1, 20)) for i in range(4000)]
+        expected = sorted(players, key=lambda player: player.score, reverse=True)
+
+        result = parallel_sort_descending(iter(players), workers=4)
+
+        self.assertEqual([player.uid for player in result], [player.uid for player in expected])
+
+    def test_argsort(self):
+        scores = [3, 1, 3, 2, 1]
+
+        self.assertEqual(list(parallel_argsort_descending(scores, workers=2)), [0, 2, 3, 1, 4])
+
+    def test_scores_must_fit_in_int64(self):
+        with self.assertRaises(OverflowError):
+            parallel_sort_descending([1, 2 ** 63], workers=2)
+
+    def test_merge_failure_releases_shared_memory(self):
+        blocks = [shared_memory.SharedMemory(create=True, size=64) for _ in range(3)]
+        for block in blocks:
+            self.addCleanup(block.unlink)
+            self.addCleanup(block.close)
+
+        with mock.patch.object(player_parallel_sort.heapq, "merge", side_effect=RuntimeError("merge failed")):
+            with self.assertRaisesRegex(RuntimeError, "merge failed"):
+                player_parallel_sort._merge_chunks(*(block.name for block in blocks), [(0, 2), (2, 4)], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
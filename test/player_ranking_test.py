@@ -0,0 +1,84 @@
+import random
+import unittest
+from player import Player
+from player_list import PlayerList
+from player_ranking import PlayerRanking, np
+from data_stuctures.player_hash_map import PlayerHashMap
+
+
+class PlayerRankingTest(unittest.TestCase):
+    use_numpy = False
+
+    def setUp(self):
+        """Initialize five players with tied scores."""
+        self.players = [Player(uid, "name", score) for uid, score in
+                        [("a", 10), ("b", 30), ("c", 20), ("d", 30), ("e", 5)]]
+
+    def ranking(self, collection):
+        return PlayerRanking(collection, use_numpy=self.use_numpy)
+
+    def test_descending_uids(self):
+        self.assertEqual(self.ranking(self.players).descending_uids(), ["b", "d", "c", "a", "e"])
+
+    def test_ranks(self):
+        ranking = self.ranking(self.players)
+
+        self.assertEqual(ranking.ranks(), {"b": 1, "d": 1, "c": 3, "a": 4, "e": 5})
+        self.assertEqual(ranking.ranks("dense"), {"b": 1, "d": 1, "c": 2, "a": 3, "e": 4})
+        with self.assertRaises(ValueError):
+            ranking.ranks("ordinal")
+
+    def test_percentile_buckets(self):
+        ranking = self.ranking(self.players)
+
+        self.assertEqual(ranking.percentile_buckets(), {"a": 20, "b": 60, "c": 40, "d": 60, "e": 0})
+        self.assertEqual(ranking.percentile_buckets(2), {"a": 0, "b": 1, "c": 0, "d": 1, "e": 0})
+        with self.assertRaises(ValueError):
+            ranking.percentile_buckets(0)
+
+    def test_collections(self):
+        player_list = PlayerList()
+        player_list.extend(self.players)
+        hash_map = PlayerHashMap.from_iterable(self.players)
+
+        for collection in (player_list, hash_map):
+            with self.subTest(collection=type(collection).__name__):
+                self.assertEqual(self.ranking(collection).ranks(), {"b": 1, "d": 1, "c": 3, "a": 4, "e": 5})
+
+    def test_empty_collection(self):
+        ranking = self.ranking([])
+
+        self.assertEqual(len(ranking), 0)
+        self.assertEqual((ranking.descending_uids(), ranking.ranks(), ranking.percentile_buckets()), ([], {}, {}))
+
+
+@unittest.skipUnless(np is not None, "NumPy is not installed")
+class NumpyPlayerRankingTest(PlayerRankingTest):
+    """Runs every ranking test again on the NumPy path, and checks that both paths agree."""
+    use_numpy = True
+
+    def test_paths_agree(self):
+        random.seed(22)
+        players = [Player(str(i), "name", random.randrange(1, 300)) for i in range(5000)]
+        vectorized, pure = PlayerRanking(players, use_numpy=True), PlayerRanking(players, use_numpy=False)
+
+        self.assertTrue(vectorized.uses_numpy)
+        self.assertEqual(vectorized.descending_uids(), pure.descending_uids())
+        for method in ("competition", "dense"):
+            self.assertEqual(vectorized.ranks(method), pure.ranks(method))
+        self.assertEqual(vectorized.percentile_buckets(10), pure.percentile_buckets(10))
+
+
+class NumpyFallbackTest(unittest.TestCase):
+
+    def test_default_follows_numpy_availability(self):
+        self.assertEqual(PlayerRanking([]).uses_numpy, np is not None)
+
+    @unittest.skipIf(np is not None, "NumPy is installed")
+    def test_requiring_numpy_without_it(self):
+        with self.assertRaises(ImportError):
+            PlayerRanking([], use_numpy=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+import random
+import unittest
+from operator import attrgetter
+from unittest import mock
+import player_sort
+from player import Player
+from player_list import PlayerList
+from unrolled_player_list import UnrolledPlayerList
+from player_sort import (counting_sort_descending, integer_sort_descending, introsort_descending,
+                         radix_sort_descending, select_top_k, sort_players, top_k)
+from data_stuctures.player_hash_map import PlayerHashMap
+
+
+class IntrosortDescendingTest(unittest.TestCase):
+
+    def assert_sorts(self, values):
+        items = list(values)
+        introsort_descending(items)
+        self.assertEqual(items, sorted(values, reverse=True))
+
+    def test_small_and_empty_inputs(self):
+        for values in ([], [1], [1, 2], [2, 1], [3, 1, 2]):
+            self.assert_sorts(values)
+
+    def test_input_shapes(self):
+        random.seed(17)
+        size = 5000
+        shapes = {
+            "random": random.sample(range(size), size),
+            "sorted": list(range(size)),
+            "reversed": list(range(size, 0, -1)),
+            "duplicates": [random.randrange(10) for _ in range(size)],
+            "all equal": [7] * size,
+            "organ pipe": list(range(size // 2)) + list(range(size // 2, 0, -1)),
+        }
+        for shape, values in shapes.items():
+            with self.subTest(shape=shape):
+                self.assert_sorts(values)
+
+    def test_sorts_range_only(self):
+        items = [0, 5, 1, 4, 2, 3, 9]
+
+        introsort_descending(items, 1, 6)
+
+        self.assertEqual(items, [0, 5, 4, 3, 2, 1, 9])
+
+    def test_heapsort_fallback(self):
+        random.seed(3)
+        values = [random.randrange(1000) for _ in range(2000)]
+        items = list(values)
+
+        player_sort._heapsort_descending(items, 0, len(items))
+
+        self.assertEqual(items, sorted(values, reverse=True))
+
+    def test_sorts_players_by_score(self):
+        players = [Player(str(uid), "name", score) for uid, score in enumerate([5, 1, 5, 9, 3, 9, 2] * 10)]
+
+        introsort_descending(players)
+
+        self.assertEqual([player.score for player in players], sorted([5, 1, 5, 9, 3, 9, 2] * 10, reverse=True))
+        self.assertEqual(len({player.uid for player in players}), 70)
+
+    def test_quicksort_descending_handles_sorted_input(self):
+        values = list(range(10_000))
+
+        self.assertEqual(Player.quicksort_descending(values), values[::-1])
+        self.assertEqual(values, list(range(10_000)))
+        self.assertEqual(Player.quicksort_descending(iter([1, 3, 2])), [3, 2, 1])
+
+
+class SortPlayersTest(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize players with repeated scores and names."""
+        self.players = [Player(uid, name, score) for uid, name, score in
+                        [("4", "Sam", 10), ("2", "Andrew", 30), ("5", "Cam", 10), ("1", "Sam", 20), ("3", "Bob", 30)]]
+
+    def uids(self, players):
+        return [player.uid for player in players]
+
+    def test_default_key_sorts_by_score(self):
+        self.assertEqual(self.uids(sort_players(self.players)), ["4", "5", "1", "2", "3"])
+        self.assertEqual(self.uids(sort_players(self.players, reverse=True)), ["2", "3", "1", "4", "5"])
+
+    def test_key_and_deterministic_tie_break(self):
+        self.assertEqual(self.uids(sort_players(self.players, key=attrgetter("uid"))), ["1", "2", "3", "4", "5"])
+        self.assertEqual(self.uids(sort_players(self.players, key=lambda player: (-player.score, player.name))),
+                         ["2", "3", "1", "5", "4"])
+
+    def test_successive_sorts_are_stable(self):
+        by_name = sort_players(self.players, key=attrgetter("name"))
+        leaderboard = sort_players(by_name, key=attrgetter("score"), reverse=True)
+
+        self.assertEqual(self.uids(leaderboard), ["2", "3", "1", "5", "4"])
+
+    def test_key_is_computed_once_per_player(self):
+        calls = []
+
+        sort_players(self.players, key=lambda player: calls.append(player.uid) or player.score)
+
+        self.assertEqual(sorted(calls), ["1", "2", "3", "4", "5"])
+
+    def test_sorts_player_collections(self):
+        player_list = PlayerList()
+        player_list.extend(self.players)
+        unrolled_list = UnrolledPlayerList(chunk_size=2)
+        unrolled_list.extend(self.players)
+        hash_map = PlayerHashMap.from_iterable(self.players)
+
+        for collection in (player_list, unrolled_list, hash_map, iter(self.players)):
+            with self.subTest(collection=type(collection).__name__):
+                self.assertEqual(self.uids(sort_players(collection, key=attrgetter("uid"))), ["1", "2", "3", "4", "5"])
+        self.assertEqual(len(player_list), 5)
+
+
+class TopKTest(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize a thousand players with many repeated scores."""
+        random.seed(19)
+        self.players = [Player(f"P{i:04d}", "name", random.randrange(1, 200)) for i in range(1000)]
+
+    def test_scores(self):
+        scores = [random.randrange(50) for _ in range(500)]
+
+        for select in (top_k, select_top_k):
+            with self.subTest(select=select.__name__):
+                for k in (0, 1, 10, 500, 600):
+                    self.assertEqual(select(scores, k), sorted(scores, reverse=True)[:k])
+
+    def test_players_with_key_prefer_earlier_ties(self):
+        expected = sorted(self.players, key=lambda player: player.score, reverse=True)[:100]
+
+        for select in (top_k, select_top_k):
+            with self.subTest(select=select.__name__):
+                self.assertEqual([player.uid for player in select(self.players, 100, key=lambda player: player.score)],
+                                 [player.uid for player in expected])
+
+    def test_players_without_key(self):
+        for select in (top_k, select_top_k):
+            with self.subTest(select=select.__name__):
+                self.assertEqual([player.score for player in select(self.players, 50)],
+                                 sorted((player.score for player in self.players), reverse=True)[:50])
+
+    def test_player_list_generator(self):
+        player_list = PlayerList()
+        player_list.extend(self.players)
+        expected = [player.uid for player in top_k(self.players, 5, key=lambda player: player.score)]
+
+        self.assertEqual([player.uid for player in top_k(player_list.iterate(), 5, key=lambda player: player.score)],
+                         expected)
+        self.assertEqual([player.uid for player in select_top_k(player_list.iterate(), 5,
+                                                                key=lambda player: player.score)],
+                         expected)
+        self.assertEqual([player.score for player in select_top_k(player_list.iterate(), 5)],
+                         [player.score for player in top_k(self.players, 5)])
+        self.assertEqual(len(sort_players(player_list.iterate())), len(self.players))
+
+    def test_does_not_modify_input(self):
+        scores = list(range(100))
+
+        self.assertEqual(select_top_k(scores, 3), [99, 98, 97])
+        self.assertEqual(scores, list(range(100)))
+
+
+class IntegerSortTest(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize players with many repeated scores."""
+        random.seed(23)
+        self.players = [Player(f"P{i:04d}", "name", random.randrange(0, 50)) for i in range(2000)]
+        self.expected = [player.uid for player in sorted(self.players, key=lambda player: player.score, reverse=True)]
+
+    def test_counting_and_radix_sort_players_stably(self):
+        for sort in (counting_sort_descending, radix_sort_descending, integer_sort_descending):
+            with self.subTest(sort=sort.__name__):
+                self.assertEqual([player.uid for player in sort(self.players)], self.expected)
+
+    def test_scores(self):
+        for scores in ([], [0], [random.randrange(2000) for _ in range(3000)], [5, 0, 5, 3]):
+            for sort in (counting_sort_descending, radix_sort_descending, integer_sort_descending):
+                with self.subTest(sort=sort.__name__, size=len(scores)):
+                    self.assertEqual(sort(scores), sorted(scores, reverse=True))
+
+        wide_scores = [random.randrange(2 ** 40) for _ in range(3000)]
+        self.assertEqual(radix_sort_descending(wide_scores), sorted(wide_scores, reverse=True))
+        self.assertEqual(integer_sort_descending(wide_scores), sorted(wide_scores, reverse=True))
+
+    def test_rejects_negative_or_non_integer_scores(self):
+        for scores in ([3, -1], [1.5, 2], [Player("1", "name", 2.5)]):
+            for sort in (counting_sort_descending, radix_sort_descending, integer_sort_descending):
+                with self.assertRaises(ValueError):
+                    sort(scores)
+
+    def test_integer_sort_picks_counting_sort_for_small_ranges(self):
+        narrow = [random.randrange(100, 100 + 2000) for _ in range(2000)]
+        wide = [random.randrange(100, 100 + 2001) for _ in range(1000)]
+
+        for scores, expected in ((narrow, "_counting_sort"), (wide, "_radix_sort")):
+            other = "_radix_sort" if expected == "_counting_sort" else "_counting_sort"
+            with mock.patch.object(player_sort, expected, wraps=getattr(player_sort, expected)) as chosen, \
+                    mock.patch.object(player_sort, other, wraps=getattr(player_sort, other)) as skipped:
+                self.assertEqual(integer_sort_descending(scores), sorted(scores, reverse=True))
+            self.assertEqual((chosen.call_count, skipped.call_count), (1, 0))
+
+    def test_sort_api_routes_non_negative_integer_scores(self):
+        wide = [Player(str(i), "name", random.randrange(10 ** 9)) for i in range(500)]
+
+        for players in (self.players, wide):
+            with mock.patch.object(player_sort, "_integer_sort", wraps=player_sort._integer_sort) as integer_sort:
+                descending = Player.quicksort_descending(players)
+                ascending = sort_players(players)
+            self.assertEqual(integer_sort.call_count, 2)
+            self.assertEqual([player.uid for player in descending],
+                             [player.uid for player in sorted(players, key=attrgetter("score"), reverse=True)])
+            self.assertEqual([player.uid for player in ascending],
+                             [player.uid for player in sorted(players, key=attrgetter("score"))])
+
+    def test_sort_api_falls_back_for_other_input(self):
+        for items in ([Player("1", "name", 2.5), Player("2", "name", 7)], [Player("1", "name", -1), Player("2", "name", 7)],
+                      [3, 1, 2], [Player("1", "name", 3), 5]):
+            with mock.patch.object(player_sort, "_integer_sort") as integer_sort:
+                try:
+                    sort_players(items)
+                    Player.quicksort_descending(items)
+                except (AttributeError, TypeError):
+                    pass  # players and plain scores cannot be sorted together
+            integer_sort.assert_not_called()
+
+    def test_sort_players_without_key_sorts_stably_by_score(self):
+        wide = [Player(str(i), "name", random.randrange(10 ** 9)) for i in range(500)]
+        for players in (self.players, wide):
+            for reverse in (False, True):
+                expected = sorted(players, key=lambda player: player.score, reverse=reverse)
+                self.assertEqual([player.uid for player in sort_players(players, reverse=reverse)],
+                                 [player.uid for player in expected])
+
+    def test_sort_players_falls_back_for_other_scores(self):
+        players = [Player("1", "name", 2.5), Player("2", "name", -1), Player("3", "name", 7)]
+
+        self.assertEqual([player.uid for player in sort_players(players, reverse=True)], ["3", "1", "2"])
+        self.assertEqual(sort_players([3, -2, 1]), [-2, 1, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
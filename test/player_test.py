@@ -64,6 +64,35 @@ class PlayerTest(unittest.TestCase):
 
         self.assertEqual(Player.quicksort_descending(self.player_list), expected_player_list)
 
+    def test_hash_is_sum_of_ascii_values_of_uid(self):
+        """Test that the cached hash matches the sum of ASCII values of the uid."""
+        self.assertEqual(hash(self.player1), Player.sum_of_ascii_values("1_uid"))
+        self.player1.name = "Andrii"
+        self.player1.score = 5
+        self.assertEqual(hash(self.player1), Player.sum_of_ascii_values("1_uid"))
+
+    def test_player_has_no_instance_dict(self):
+        """Test that players are slotted objects without a per-instance __dict__."""
+        self.assertFalse(hasattr(self.player1, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.player1.nickname = "Andy"
+
+    def test_score_listeners_are_notified_of_changes(self):
+        """Test that score listeners receive the player and its old score, only when the score changes."""
+        changes = []
+        listener = lambda player, old_score: changes.append((player.uid, old_score, player.score))
+        self.player1.add_score_listener(listener)
+
+        self.player1.score = 120
+        self.player1.score = 120
+        self.player1.score = -5
+        self.player1.remove_score_listener(listener)
+        self.player1.score = 130
+
+        self.assertEqual(changes, [("1_uid", 100, 120)])
+        with self.assertRaises(ValueError):
+            self.player1.remove_score_listener(listener)
+
 
 if __name__ == "__main__":
     unittest.main()
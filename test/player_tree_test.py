@@ -0,0 +1,130 @@
+import inspect
+import math
+import random
+import unittest
+from player import Player
+from player_sort import sort_players
+from data_stuctures.player_tree import PlayerTree
+
+
+class PlayerTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize a tree of players inserted in random order."""
+        random.seed(25)
+        self.uids = [f"{prefix}{i:03d}" for prefix in ("ann", "bob", "bobby", "cam") for i in range(0, 200, 2)]
+        random.shuffle(self.uids)
+        self.tree = PlayerTree(Player(uid, f"name {uid}") for uid in self.uids)
+
+    def assert_balanced(self, node):
+        """Check the AVL balance, the stored heights and the ordering below a node, returning its height."""
+        if node is None:
+            return 0
+        left, right = self.assert_balanced(node.left), self.assert_balanced(node.right)
+        self.assertLessEqual(abs(left - right), 1)
+        self.assertEqual(node.height, 1 + max(left, right))
+        if node.left is not None:
+            self.assertLess(node.left.key, node.key)
+        if node.right is not None:
+            self.assertGreater(node.right.key, node.key)
+        return node.height
+
+    def test_insert_and_lookup(self):
+        self.assertEqual(len(self.tree), 400)
+        self.assertEqual(self.tree["bob010"].name, "name bob010")
+        self.assertEqual(self.tree[Player("cam198", "")].uid, "cam198")
+        self.assertIn("ann000", self.tree)
+        self.assertNotIn("ann001", self.tree)
+        self.assertIsNone(self.tree.get("ann001"))
+        with self.assertRaises(KeyError):
+            self.tree["ann001"]
+        self.assert_balanced(self.tree._root)
+
+    def test_insert_replaces_same_uid(self):
+        replacement = Player("bob010", "Bob")
+
+        self.tree.insert(replacement)
+
+        self.assertEqual(len(self.tree), 400)
+        self.assertIs(self.tree["bob010"], replacement)
+
+    def test_sorted_inserts_stay_balanced(self):
+        tree = PlayerTree(Player(f"P{i:05d}", "name") for i in range(4096))
+
+        self.assertEqual(tree.height, 13)
+        self.assert_balanced(tree._root)
+
+    def test_delete(self):
+        removed = self.uids[:300]
+        for uid in removed:
+            del self.tree[uid]
+            self.assert_balanced(self.tree._root)
+
+        self.assertEqual(list(self.tree), sorted(self.uids[300:]))
+        self.assertNotIn(removed[0], self.tree)
+        with self.assertRaises(KeyError):
+            del self.tree[removed[0]]
+        for uid in self.uids[300:]:
+            del self.tree[Player(uid, "")]
+        self.assertEqual((len(self.tree), self.tree.height, list(self.tree)), (0, 0, []))
+
+    def test_in_order_iteration_is_lazy(self):
+        self.assertEqual(list(self.tree.keys()), sorted(self.uids))
+        self.assertEqual([player.uid for player in self.tree.values()], sorted(self.uids))
+        self.assertEqual([uid for uid, _ in self.tree.items()], sorted(self.uids))
+
+        values = self.tree.values()
+        self.assertTrue(inspect.isgenerator(values))
+        self.assertEqual([next(values).uid for _ in range(3)], ["ann000", "ann002", "ann004"])
+
+    def test_floor_and_ceiling(self):
+        self.assertEqual(self.tree.floor("bob011").uid, "bob010")
+        self.assertEqual(self.tree.floor("bob010").uid, "bob010")
+        self.assertEqual(self.tree.ceiling("bob011").uid, "bob012")
+        self.assertEqual(self.tree.ceiling(Player("bob198a", "")).uid, "bobby000")
+        self.assertIsNone(self.tree.floor("a"))
+        self.assertIsNone(self.tree.ceiling("d"))
+        self.assertIsNone(PlayerTree().floor("a"))
+
+    def test_range_by_bounds(self):
+        uids = sorted(self.uids)
+
+        self.assertEqual([player.uid for player in self.tree.range("bob050", "bob060")],
+                         ["bob050", "bob052", "bob054", "bob056", "bob058"])
+        self.assertEqual([player.uid for player in self.tree.range(high="ann010")], uids[:5])
+        self.assertEqual([player.uid for player in self.tree.range("cam190")], uids[-5:])
+        self.assertEqual(list(self.tree.range("b", "a")), [])
+
+    def test_range_by_prefix(self):
+        self.assertEqual([player.uid for player in self.tree.prefix("bob")],
+                         sorted(uid for uid in self.uids if uid.startswith("bob")))
+        self.assertEqual([player.uid for player in self.tree.prefix("bobby01")],
+                         [f"bobby01{i}" for i in range(0, 10, 2)])
+        self.assertEqual(list(self.tree.prefix("dan")), [])
+        self.assertEqual(len(list(self.tree.prefix(""))), 400)
+
+    def test_sort_players_reads_tree(self):
+        for uid, score in zip(sorted(self.uids), range(400)):
+            self.tree[uid].score = 1000 - score
+
+        self.assertEqual([player.uid for player in sort_players(self.tree)], sorted(self.uids, reverse=True))
+
+    def test_random_operations_match_a_dict(self):
+        tree = PlayerTree()
+        expected = {}
+        for _ in range(3000):
+            uid = f"U{random.randrange(500):03d}"
+            if random.random() < 0.6:
+                tree.insert(Player(uid, "name"))
+                expected[uid] = True
+            elif uid in expected:
+                del tree[uid]
+                del expected[uid]
+
+        self.assertEqual(list(tree), sorted(expected))
+        self.assertLessEqual(tree.height, 1.45 * math.log2(len(tree) + 2))
+        self.assert_balanced(tree._root)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from player import Player
+from data_stuctures.hash_strategies import SumOfAsciiHash
+from data_stuctures.probing_player_hash_map import ProbingPlayerHashMap
+
+
+class ProbingHashMapTest(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize a new ProbingPlayerHashMap for each test."""
+        self.hash_map = ProbingPlayerHashMap()
+        self.player1 = Player("And12rew", "Andrew")
+        self.player2 = Player("Raf34el", "Rafael")
+        self.hash_map[self.player1.uid] = self.player1.name
+        self.hash_map[self.player2.uid] = self.player2.name
+
+    def test_add_and_retrieve_player(self):
+        """Test adding players and retrieving them by uid or Player."""
+        self.hash_map["Sa45m"] = "Samuel"
+        self.assertEqual(len(self.hash_map), 3)
+        self.assertEqual(self.hash_map["Sa45m"].name, "Samuel")
+        self.assertEqual(self.hash_map[self.player1].uid, "And12rew")
+
+    def test_update_player(self):
+        """Test updating an existing player keeps the same Player object."""
+        player = self.hash_map["And12rew"]
+        self.hash_map["And12rew"] = "Andrii"
+        self.assertIs(self.hash_map["And12rew"], player)
+        self.assertEqual(player.name, "Andrii")
+        self.assertEqual(len(self.hash_map), 2)
+
+    def test_remove_player(self):
+        """Test removing a player from the hash map."""
+        del self.hash_map["And12rew"]
+        self.assertEqual(len(self.hash_map), 1)
+        with self.assertRaises(KeyError):
+            self.hash_map["And12rew"]
+        with self.assertRaises(KeyError):
+            del self.hash_map["And12rew"]
+
+    def test_collisions_probe_past_tombstones(self):
+        """Test that deleting a key in the middle of a probe sequence keeps later keys reachable."""
+        hash_map = ProbingPlayerHashMap(hash_strategy=SumOfAsciiHash())
+        for uid in ("123", "231", "321"):  # anagrams share a slot under the sum of ASCII values
+            hash_map[uid] = uid
+        del hash_map["231"]
+        self.assertEqual(hash_map["321"].name, "321")
+        hash_map["213"] = "213"  # reuses the tombstone
+        self.assertEqual(len(hash_map), 3)
+        self.assertEqual(hash_map["213"].name, "213")
+        self.assertEqual(hash_map["123"].name, "123")
+
+    def test_grows_and_keeps_players(self):
+        """Test that the table grows past its load factor without losing players."""
+        player = self.hash_map["And12rew"]
+        for i in range(1000):
+            self.hash_map[f"uid{i}"] = f"name{i}"
+        self.assertEqual(len(self.hash_map), 1002)
+        self.assertLessEqual(self.hash_map.load_factor, ProbingPlayerHashMap.MAX_LOAD_FACTOR)
+        self.assertIs(self.hash_map["And12rew"], player)
+        for i in range(1000):
+            self.assertEqual(self.hash_map[f"uid{i}"].name, f"name{i}")
+
+    def test_churn_does_not_grow_table(self):
+        """Test that tombstones from repeated insert/delete cycles are purged instead of growing the table."""
+        bucket_count = self.hash_map.bucket_count
+        for i in range(1000):
+            self.hash_map[f"uid{i}"] = "churn"
+            del self.hash_map[f"uid{i}"]
+        self.assertEqual(self.hash_map.bucket_count, bucket_count)
+        self.assertEqual(len(self.hash_map), 2)
+
+    def test_capacity_hint(self):
+        """Test that a capacity hint presizes the table so no rebuild is needed."""
+        hash_map = ProbingPlayerHashMap(capacity=1000)
+        bucket_count = hash_map.bucket_count
+        for i in range(1000):
+            hash_map[f"uid{i}"] = f"name{i}"
+        self.assertEqual(hash_map.bucket_count, bucket_count)
+
+    def test_invalid_load_factor(self):
+        """Test that a load factor that could fill the table is rejected."""
+        with self.assertRaises(ValueError):
+            ProbingPlayerHashMap(max_load_factor=1)
+
+    def test_empty_hash_map(self):
+        """Test behavior when the hash map is empty."""
+        empty_hash_map = ProbingPlayerHashMap()
+        self.assertEqual(len(empty_hash_map), 0)
+        with self.assertRaises(KeyError):
+            empty_hash_map["non_existent"]
+
+    def test_contains_get_and_views(self):
+        """Test membership checks, lookups with a default and the lazy views."""
+        del self.hash_map["Raf34el"]
+        self.hash_map["Sa45m"] = "Samuel"
+        self.assertIn("And12rew", self.hash_map)
+        self.assertNotIn("Raf34el", self.hash_map)
+        self.assertIsNone(self.hash_map.get("Raf34el"))
+        self.assertEqual(self.hash_map.get("Sa45m").name, "Samuel")
+        self.assertEqual(set(self.hash_map.keys()), {"And12rew", "Sa45m"})
+        self.assertEqual({player.name for player in self.hash_map.values()}, {"Andrew", "Samuel"})
+        self.assertEqual(dict((uid, player.name) for uid, player in self.hash_map.items()),
+                         {"And12rew": "Andrew", "Sa45m": "Samuel"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import random
+import unittest
+from player import Player
+from unrolled_player_list import UnrolledPlayerList
+
+
+class UnrolledPlayerListTest(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize players and an UnrolledPlayerList with small chunks for each test"""
+        self.player1 = Player("1", "Andrew")
+        self.player2 = Player("2", "Rafael")
+        self.player3 = Player("3", "Sam")
+        self.player_list = UnrolledPlayerList(chunk_size=4)
+
+    def uids(self, forward=True):
+        return [player.uid for player in self.player_list.iterate(forward)]
+
+    def test_push_front_and_back(self):
+        self.player_list.push_back(self.player1)
+        self.player_list.push_front(self.player2)
+        self.player_list.push_back(self.player3)
+
+        self.assertEqual(self.uids(), ["2", "1", "3"])
+        self.assertEqual(self.uids(forward=False), ["3", "1", "2"])
+        self.assertIs(self.player_list.head, self.player2)
+        self.assertIs(self.player_list.tail, self.player3)
+        self.assertEqual(len(self.player_list), 3)
+
+    def test_pop_from_front_and_back(self):
+        for player in (self.player1, self.player2, self.player3):
+            self.player_list.push_back(player)
+
+        self.assertIs(self.player_list.pop_from_front(), self.player1)
+        self.assertIs(self.player_list.pop_from_back(), self.player3)
+        self.assertIs(self.player_list.pop_from_back(), self.player2)
+        self.assertTrue(self.player_list.is_empty)
+        self.assertIsNone(self.player_list.head)
+        self.assertIsNone(self.player_list.tail)
+
+    def test_pop_from_empty_list(self):
+        with self.assertRaises(IndexError):
+            self.player_list.pop_from_front()
+        with self.assertRaises(IndexError):
+            self.player_list.pop_from_back()
+        with self.assertRaises(IndexError):
+            self.player_list.pop_by_uid("1")
+
+    def test_pop_by_uid_across_chunks(self):
+        players = [Player(str(i), f"name{i}") for i in range(10)]
+        for player in players:
+            self.player_list.push_back(player)
+
+        self.assertIs(self.player_list.pop_by_uid("5"), players[5])
+        self.assertIs(self.player_list.pop_by_uid("0"), players[0])
+        self.assertIs(self.player_list.pop_by_uid("9"), players[9])
+
+        self.assertEqual(self.uids(), ["1", "2", "3", "4", "6", "7", "8"])
+        self.assertIs(self.player_list.find_player_by_key("7"), players[7])
+        self.assertIsNone(self.player_list.find_player_by_key("5"))
+        with self.assertRaises(ValueError):
+            self.player_list.pop_by_uid("5")
+
+    def test_duplicate_uid(self):
+        self.player_list.push_back(self.player1)
+
+        with self.assertRaises(ValueError):
+            self.player_list.push_front(Player("1", "Bob"))
+        with self.assertRaises(ValueError):
+            self.player_list.push_back(self.player1)
+        self.assertEqual(len(self.player_list), 1)
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            UnrolledPlayerList(chunk_size=1)
+
+    def test_matches_python_list_under_random_operations(self):
+        rng = random.Random(7)
+        expected = []
+        for i in range(2000):
+            operation = rng.random()
+            if operation < 0.3 or not expected:
+                player = Player(f"uid{i}", "name")
+                self.player_list.push_back(player)
+                expected.append(player)
+            elif operation < 0.5:
+                player = Player(f"uid{i}", "name")
+                self.player_list.push_front(player)
+                expected.insert(0, player)
+            elif operation < 0.65:
+                self.assertIs(self.player_list.pop_from_front(), expected.pop(0))
+            elif operation < 0.8:
+                self.assertIs(self.player_list.pop_from_back(), expected.pop())
+            else:
+                # Player equality compares scores, so remove by position rather than list.remove
+                player = expected.pop(rng.randrange(len(expected)))
+                self.assertIs(self.player_list.pop_by_uid(player.uid), player)
+
+            self.assertEqual(len(self.player_list), len(expected))
+        self.assertEqual(list(self.player_list.iterate()), expected)
+        self.assertEqual(list(self.player_list.iterate(forward=False)), expected[::-1])
+
+    def test_extend(self):
+        self.player_list.push_back(self.player1)
+        players = [Player(str(i), f"name{i}") for i in range(10, 20)]
+
+        self.player_list.extend(players)
+
+        self.assertEqual(self.uids(), ["1"] + [str(i) for i in range(10, 20)])
+        self.assertEqual(len(self.player_list), 11)
+        self.assertIs(self.player_list.pop_by_uid("15"), players[5])
+
+    def test_extend_rejects_duplicates_atomically(self):
+        self.player_list.push_back(self.player1)
+
+        with self.assertRaises(ValueError):
+            self.player_list.extend([self.player2, Player("1", "Bob")])
+        with self.assertRaises(ValueError):
+            self.player_list.extend([self.player2, Player("2", "Bob")])
+        self.assertEqual(self.uids(), ["1"])
+
+
+class UnindexedUnrolledPlayerListTest(UnrolledPlayerListTest):
+    """Runs every UnrolledPlayerList test again with the uid index disabled."""
+
+    def setUp(self):
+        super().setUp()
+        self.player_list = UnrolledPlayerList(chunk_size=4, index_uids=False)
+
+
+if __name__ == "__main__":
+    unittest.main()